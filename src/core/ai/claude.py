@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 from core import http
@@ -12,9 +14,13 @@ from core.ai.prompts import (
     PLAYBOOK_UPDATE_USER,
     REFLECTION_SYSTEM,
     REFLECTION_USER,
+    TRADE_ANALYSIS_BATCH_ITEM,
+    TRADE_ANALYSIS_BATCH_USER,
     TRADE_ANALYSIS_SYSTEM,
     TRADE_ANALYSIS_USER,
 )
+from core.analysis.greeks import parse_expiration
+from core.cache import TTLCache
 from core.types import Confidence, CreditSpread, PlaybookRule, Trade
 
 
@@ -24,7 +30,7 @@ class ClaudeError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeAnalysis:
     """Result of AI trade analysis."""
 
@@ -34,7 +40,7 @@ class TradeAnalysis:
     confidence_reason: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeReflection:
     """Result of AI trade reflection."""
 
@@ -42,7 +48,7 @@ class TradeReflection:
     lesson: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlaybookUpdate:
     """Suggested playbook updates."""
 
@@ -53,31 +59,49 @@ class ClaudeClient:
     """Client for Claude AI analysis."""
 
     BASE_URL = "https://api.anthropic.com/v1"
+    MESSAGES_URL = f"{BASE_URL}/messages"
     MODEL = "claude-sonnet-4-20250514"
     MAX_TOKENS = 1024
 
-    def __init__(self, api_key: str):
+    # Response caches, shared across clients for the lifetime of the isolate.
+    # Keys bucket the numeric inputs so near-identical requests in the same
+    # screening cycle reuse one response.
+    RESPONSE_CACHE_TTL = 15 * 60  # 15 minutes
+    _market_context_cache = TTLCache(maxsize=64, ttl=RESPONSE_CACHE_TTL)
+    _analysis_cache = TTLCache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+
+    # Cap on in-flight requests per client so fan-out stays under API rate limits
+    MAX_CONCURRENT_REQUESTS = 10
+
+    # Spreads per batched analysis request; bounds max_tokens per request
+    MAX_BATCH_SIZE = 8
+
+    def __init__(self, api_key: str, max_concurrent_requests: int | None = None):
         self.api_key = api_key
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests or self.MAX_CONCURRENT_REQUESTS)
         self._headers = {
             "x-api-key": api_key,
             "anthropic-version": "2023-06-01",
             "content-type": "application/json",
         }
 
-    async def _request(self, messages: list[dict], system: str) -> str:
+    async def _request(
+        self, messages: list[dict], system: str, max_tokens: int | None = None
+    ) -> str:
         """Make a request to Claude API."""
         try:
-            data = await http.request(
-                "POST",
-                f"{self.BASE_URL}/messages",
-                headers=self._headers,
-                json_data={
-                    "model": self.MODEL,
-                    "max_tokens": self.MAX_TOKENS,
-                    "system": system,
-                    "messages": messages,
-                },
-            )
+            async with self._semaphore:
+                data = await http.request(
+                    "POST",
+                    self.MESSAGES_URL,
+                    headers=self._headers,
+                    json_data={
+                        "model": self.MODEL,
+                        "max_tokens": max_tokens or self.MAX_TOKENS,
+                        "system": system,
+                        "messages": messages,
+                    },
+                )
 
             content = data.get("content", [])
             if not content:
@@ -92,29 +116,46 @@ class ClaudeClient:
         # Strip markdown code blocks if present
         text = text.strip()
         if text.startswith("```"):
-            lines = text.split("\n")
-            # Remove first line (```json) and last line (```)
-            text = "\n".join(lines[1:-1])
+            # Drop the opening fence line (```json) and the closing fence
+            text = text.partition("\n")[2].removesuffix("```")
 
         return json.loads(text)
 
-    async def analyze_trade(
+    def _rules_text(self, playbook_rules: list[PlaybookRule]) -> str:
+        return "\n".join(f"- {r.rule}" for r in playbook_rules[:5])
+
+    def _analysis_cache_key(
         self,
         spread: CreditSpread,
         underlying_price: float,
         iv_rank: float,
         current_iv: float,
-        playbook_rules: list[PlaybookRule],
-    ) -> TradeAnalysis:
-        """Analyze a potential credit spread trade."""
-        # Calculate DTE
-        from datetime import datetime
-
-        exp_date = datetime.strptime(spread.expiration, "%Y-%m-%d")
-        dte = (exp_date - datetime.now()).days
+        rules_text: str,
+    ) -> tuple:
+        """Key covering every prompt input, with the market numbers bucketed."""
+        return (
+            spread.underlying,
+            spread.spread_type,
+            spread.short_strike,
+            spread.long_strike,
+            spread.expiration,
+            round(spread.credit, 2),
+            round(underlying_price),
+            round(iv_rank),
+            round(current_iv, 2),
+            hash(rules_text),
+        )
 
-        # Format playbook rules
-        rules_text = "\n".join(f"- {r.rule}" for r in playbook_rules[:5])
+    def _trade_prompt_fields(
+        self,
+        spread: CreditSpread,
+        underlying_price: float,
+        iv_rank: float,
+        current_iv: float,
+    ) -> dict:
+        """Build the template fields describing a spread for analysis prompts."""
+        # Calculate DTE
+        dte = (parse_expiration(spread.expiration) - datetime.now()).days
 
         # Get deltas from greeks (core OptionContract uses greeks object)
         short_delta = 0.0
@@ -124,21 +165,50 @@ class ClaudeClient:
         if spread.long_contract.greeks:
             long_delta = spread.long_contract.greeks.delta or 0
 
+        return {
+            "underlying": spread.underlying,
+            "underlying_price": underlying_price,
+            "spread_type": spread.spread_type.display_name,
+            "short_strike": spread.short_strike,
+            "short_delta": short_delta,
+            "long_strike": spread.long_strike,
+            "long_delta": long_delta,
+            "expiration": spread.expiration,
+            "dte": dte,
+            "credit": spread.credit,
+            "max_loss": spread.max_loss / 100,  # Per spread, not per contract
+            "risk_reward": spread.max_loss / spread.max_profit if spread.max_profit > 0 else 0,
+            "iv_rank": iv_rank,
+            "current_iv": current_iv,
+        }
+
+    def _parse_trade_analysis(self, data: dict) -> TradeAnalysis:
+        return TradeAnalysis(
+            thesis=data["thesis"],
+            risks=data["risks"],
+            confidence=Confidence(data["confidence"]),
+            confidence_reason=data["confidence_reason"],
+        )
+
+    async def analyze_trade(
+        self,
+        spread: CreditSpread,
+        underlying_price: float,
+        iv_rank: float,
+        current_iv: float,
+        playbook_rules: list[PlaybookRule],
+    ) -> TradeAnalysis:
+        """Analyze a potential credit spread trade."""
+        rules_text = self._rules_text(playbook_rules)
+        cache_key = self._analysis_cache_key(
+            spread, underlying_price, iv_rank, current_iv, rules_text
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         prompt = TRADE_ANALYSIS_USER.format(
-            underlying=spread.underlying,
-            underlying_price=underlying_price,
-            spread_type=spread.spread_type.value.replace("_", " ").title(),
-            short_strike=spread.short_strike,
-            short_delta=short_delta,
-            long_strike=spread.long_strike,
-            long_delta=long_delta,
-            expiration=spread.expiration,
-            dte=dte,
-            credit=spread.credit,
-            max_loss=spread.max_loss / 100,  # Per spread, not per contract
-            risk_reward=spread.max_loss / spread.max_profit if spread.max_profit > 0 else 0,
-            iv_rank=iv_rank,
-            current_iv=current_iv,
+            **self._trade_prompt_fields(spread, underlying_price, iv_rank, current_iv),
             playbook_rules=rules_text or "No rules loaded",
         )
 
@@ -147,14 +217,104 @@ class ClaudeClient:
             TRADE_ANALYSIS_SYSTEM,
         )
 
-        data = self._parse_json_response(response)
+        analysis = self._parse_trade_analysis(self._parse_json_response(response))
+        self._analysis_cache.set(cache_key, analysis)
+        return analysis
 
-        return TradeAnalysis(
-            thesis=data["thesis"],
-            risks=data["risks"],
-            confidence=Confidence(data["confidence"]),
-            confidence_reason=data["confidence_reason"],
+    async def _analyze_batch_chunk(
+        self,
+        trades: list[tuple[CreditSpread, float, float, float]],
+        indices: list[int],
+        rules_text: str,
+        results: list[TradeAnalysis | None],
+    ) -> None:
+        """Analyze trades[i] for each i in indices with one request, filling results."""
+        spreads_text = "\n\n".join(
+            TRADE_ANALYSIS_BATCH_ITEM.format(index=n, **self._trade_prompt_fields(*trades[i]))
+            for n, i in enumerate(indices, start=1)
         )
+        prompt = TRADE_ANALYSIS_BATCH_USER.format(
+            count=len(indices),
+            spreads=spreads_text,
+            playbook_rules=rules_text or "No rules loaded",
+        )
+
+        try:
+            response = await self._request(
+                [{"role": "user", "content": prompt}],
+                TRADE_ANALYSIS_SYSTEM,
+                max_tokens=self.MAX_TOKENS * len(indices),
+            )
+            data = self._parse_json_response(response)
+        except (ClaudeError, ValueError) as e:
+            print(f"Batch trade analysis failed, analyzing individually: {e}")
+            return
+
+        if not isinstance(data, list):
+            return
+
+        # Map items back by their spread number rather than trusting order
+        by_number = dict(enumerate(indices, start=1))
+        for item in data:
+            try:
+                i = by_number.get(item["index"])
+                if i is None or results[i] is not None:
+                    continue
+                analysis = self._parse_trade_analysis(item)
+            except (KeyError, TypeError, ValueError):
+                continue
+            results[i] = analysis
+            self._analysis_cache.set(self._analysis_cache_key(*trades[i], rules_text), analysis)
+
+    async def analyze_trades_batch(
+        self,
+        trades: list[tuple[CreditSpread, float, float, float]],
+        playbook_rules: list[PlaybookRule],
+    ) -> list[TradeAnalysis | None]:
+        """Analyze several credit spreads, up to MAX_BATCH_SIZE per Claude call.
+
+        Args:
+            trades: (spread, underlying_price, iv_rank, current_iv) per spread
+            playbook_rules: Playbook rules to include as context
+
+        Returns:
+            One analysis per input, in order. Spreads missing from the batch
+            response are retried individually; None if that also fails.
+        """
+        rules_text = self._rules_text(playbook_rules)
+        results: list[TradeAnalysis | None] = [
+            self._analysis_cache.get(self._analysis_cache_key(*trade, rules_text))
+            for trade in trades
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if len(pending) > 1:
+            await asyncio.gather(
+                *(
+                    self._analyze_batch_chunk(
+                        trades, pending[start : start + self.MAX_BATCH_SIZE], rules_text, results
+                    )
+                    for start in range(0, len(pending), self.MAX_BATCH_SIZE)
+                )
+            )
+
+        # Fall back to individual analysis for anything the batch didn't cover
+        for i, result in enumerate(results):
+            if result is not None:
+                continue
+            spread, underlying_price, iv_rank, current_iv = trades[i]
+            try:
+                results[i] = await self.analyze_trade(
+                    spread=spread,
+                    underlying_price=underlying_price,
+                    iv_rank=iv_rank,
+                    current_iv=current_iv,
+                    playbook_rules=playbook_rules,
+                )
+            except (ClaudeError, KeyError, TypeError, ValueError) as e:
+                print(f"Trade analysis failed for {spread.underlying}: {e}")
+
+        return results
 
     async def generate_reflection(
         self, trade: Trade, original_thesis: str | None = None
@@ -168,7 +328,7 @@ class ClaudeClient:
 
         prompt = REFLECTION_USER.format(
             underlying=trade.underlying,
-            spread_type=trade.spread_type.value.replace("_", " ").title(),
+            spread_type=trade.spread_type.display_name,
             opened_at=trade.opened_at.strftime("%Y-%m-%d") if trade.opened_at else "N/A",
             closed_at=trade.closed_at.strftime("%Y-%m-%d") if trade.closed_at else "N/A",
             short_strike=trade.short_strike,
@@ -241,6 +401,11 @@ Lesson: {trade.lesson}
         iv_rank: float,
     ) -> str:
         """Get brief market context for trading decisions."""
+        cache_key = (underlying, round(price), round(vix, 1), round(iv_rank))
+        cached = self._market_context_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         prompt = MARKET_CONTEXT_USER.format(
             underlying=underlying,
             price=price,
@@ -248,7 +413,9 @@ Lesson: {trade.lesson}
             iv_rank=iv_rank,
         )
 
-        return await self._request(
+        context = await self._request(
             [{"role": "user", "content": prompt}],
             MARKET_CONTEXT_SYSTEM,
         )
+        self._market_context_cache.set(cache_key, context)
+        return context
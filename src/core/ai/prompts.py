@@ -44,6 +44,46 @@ Respond in this exact JSON format:
     "confidence_reason": "Brief justification"
 }}"""
 
+TRADE_ANALYSIS_BATCH_ITEM = """### Spread {index}
+
+**Underlying:** {underlying}
+**Current Price:** ${underlying_price:.2f}
+**Strategy:** {spread_type}
+
+**Short Strike:** ${short_strike:.2f} (Delta: {short_delta:.3f})
+**Long Strike:** ${long_strike:.2f} (Delta: {long_delta:.3f})
+**Expiration:** {expiration} ({dte} DTE)
+
+**Credit:** ${credit:.2f} per spread
+**Max Loss:** ${max_loss:.2f} per spread
+**Risk/Reward:** {risk_reward:.2f}:1
+
+**IV Rank:** {iv_rank:.1f}%
+**Current IV:** {current_iv:.1f}%"""
+
+TRADE_ANALYSIS_BATCH_USER = """Analyze each of the following {count} credit spread opportunities independently:
+
+{spreads}
+
+**Recent Playbook Rules:**
+{playbook_rules}
+
+For each spread, provide:
+1. A 2-3 sentence thesis for or against this trade
+2. Key risks to monitor
+3. Confidence level (low/medium/high) with brief justification
+
+Respond with a JSON array containing exactly one object per spread, each tagged with the spread's number, in this exact format:
+[
+    {{
+        "index": 1,
+        "thesis": "Your 2-3 sentence analysis",
+        "risks": ["risk 1", "risk 2"],
+        "confidence": "low|medium|high",
+        "confidence_reason": "Brief justification"
+    }}
+]"""
+
 REFLECTION_SYSTEM = """You are an options trading coach reviewing closed trades. Your job is to extract actionable lessons that can improve future trading decisions.
 
 Focus on:
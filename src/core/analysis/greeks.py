@@ -3,10 +3,11 @@
 import math
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GreeksResult:
     """Calculated Greeks for an option."""
 
@@ -17,34 +18,84 @@ class GreeksResult:
     rho: float
 
 
+@dataclass(slots=True, frozen=True)
+class GreeksArray:
+    """Calculated Greeks for a batch of options, stored column-wise."""
+
+    delta: list[float]
+    gamma: list[float]
+    theta: list[float]
+    vega: list[float]
+    rho: list[float]
+
+
+# Normal distribution constants (computed once instead of per call)
+_INV_SQRT_2 = 1 / math.sqrt(2)
+_INV_SQRT_2PI = 1 / math.sqrt(2 * math.pi)
+
+
 def norm_cdf(x: float) -> float:
     """Cumulative distribution function for standard normal distribution."""
-    return 0.5 * (1 + math.erf(x / math.sqrt(2)))
+    return 0.5 * (1 + math.erf(x * _INV_SQRT_2))
 
 
 def norm_pdf(x: float) -> float:
     """Probability density function for standard normal distribution."""
-    return math.exp(-0.5 * x * x) / math.sqrt(2 * math.pi)
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
 
 
-def calculate_d1_d2(
+def _greeks_core(
     spot: float,
     strike: float,
     time_to_expiry: float,
     volatility: float,
     risk_free_rate: float,
-) -> tuple[float, float]:
-    """Calculate d1 and d2 for Black-Scholes formula."""
-    if time_to_expiry <= 0 or volatility <= 0:
-        return 0.0, 0.0
+    is_call: bool,
+) -> tuple[float, float, float, float, float]:
+    """Black-Scholes kernel returning (delta, gamma, theta, vega, rho).
+
+    Takes a boolean instead of the option type string so the call/put branches
+    are a single truth test, and computes sqrt(t) once for d1, d2 and the Greeks.
+    """
+    if time_to_expiry <= 0:
+        # At expiration
+        delta = (1.0 if spot > strike else 0.0) if is_call else (-1.0 if spot < strike else 0.0)
+        return delta, 0.0, 0.0, 0.0, 0.0
 
     sqrt_t = math.sqrt(time_to_expiry)
-    d1 = (math.log(spot / strike) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / (
-        volatility * sqrt_t
-    )
-    d2 = d1 - volatility * sqrt_t
+    if volatility <= 0:
+        d1 = d2 = 0.0
+    else:
+        d1 = (math.log(spot / strike) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / (
+            volatility * sqrt_t
+        )
+        d2 = d1 - volatility * sqrt_t
 
-    return d1, d2
+    # Common calculations
+    nd1 = norm_cdf(d1)
+    nd2 = norm_cdf(d2)
+    npd1 = norm_pdf(d1)
+    discounted_strike = strike * math.exp(-risk_free_rate * time_to_expiry)
+
+    # Gamma (same for calls and puts)
+    gamma = npd1 / (spot * volatility * sqrt_t)
+
+    # Theta common term (per year, negative for long options)
+    theta_common = -(spot * npd1 * volatility) / (2 * sqrt_t)
+
+    # Vega (per 1% change in volatility)
+    vega = spot * sqrt_t * npd1 / 100
+
+    if is_call:
+        delta = nd1
+        theta = (theta_common - risk_free_rate * discounted_strike * nd2) / 365  # Per day
+        rho = discounted_strike * time_to_expiry * nd2 / 100  # Per 1% rate change
+    else:
+        delta = nd1 - 1
+        theta = (theta_common + risk_free_rate * discounted_strike * (1 - nd2)) / 365
+        rho = -discounted_strike * time_to_expiry * (1 - nd2) / 100
+
+    return delta, gamma, theta, vega, rho
 
 
 def calculate_greeks(
@@ -68,55 +119,84 @@ def calculate_greeks(
     Returns:
         GreeksResult with delta, gamma, theta, vega, rho
     """
-    if time_to_expiry <= 0:
-        # At expiration
-        if option_type == "call":
-            delta = 1.0 if spot > strike else 0.0
-        else:
-            delta = -1.0 if spot < strike else 0.0
-        return GreeksResult(delta=delta, gamma=0.0, theta=0.0, vega=0.0, rho=0.0)
+    delta, gamma, theta, vega, rho = _greeks_core(
+        spot, strike, time_to_expiry, volatility, risk_free_rate, option_type == "call"
+    )
+    return GreeksResult(delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho)
 
-    d1, d2 = calculate_d1_d2(spot, strike, time_to_expiry, volatility, risk_free_rate)
-    sqrt_t = math.sqrt(time_to_expiry)
 
-    # Common calculations
-    nd1 = norm_cdf(d1)
-    nd2 = norm_cdf(d2)
-    npd1 = norm_pdf(d1)
-    exp_rt = math.exp(-risk_free_rate * time_to_expiry)
-
-    # Delta
-    if option_type == "call":
-        delta = nd1
-    else:
-        delta = nd1 - 1
+def calculate_greeks_batch(
+    spot: float,
+    strikes: list[float],
+    time_to_expiry: float,
+    volatility: float,
+    risk_free_rate: float = 0.05,
+    option_type: Literal["call", "put"] = "call",
+) -> GreeksArray:
+    """Calculate Greeks for many strikes sharing spot, expiry and volatility.
 
-    # Gamma (same for calls and puts)
-    gamma = npd1 / (spot * volatility * sqrt_t)
+    Terms that depend only on the shared inputs (sqrt(t), discount factor,
+    vol*sqrt(t)) are computed once for the whole batch, so each strike costs
+    one log and a handful of multiplies instead of a full calculate_greeks call.
 
-    # Theta (per day, negative for long options)
-    theta_common = -(spot * npd1 * volatility) / (2 * sqrt_t)
-    if option_type == "call":
-        theta = (theta_common - risk_free_rate * strike * exp_rt * nd2) / 365  # Per day
-    else:
-        theta = (theta_common + risk_free_rate * strike * exp_rt * (1 - nd2)) / 365  # Per day
+    Args:
+        spot: Current underlying price
+        strikes: Option strike prices
+        time_to_expiry: Time to expiration in years
+        volatility: Implied volatility as decimal
+        risk_free_rate: Risk-free interest rate as decimal
+        option_type: "call" or "put"
 
-    # Vega (per 1% change in volatility)
-    vega = spot * sqrt_t * npd1 / 100
+    Returns:
+        GreeksArray with one entry per strike, in input order
+    """
+    if time_to_expiry <= 0 or volatility <= 0:
+        # Degenerate inputs - defer to the scalar path for identical semantics
+        is_call = option_type == "call"
+        rows = [
+            _greeks_core(spot, k, time_to_expiry, volatility, risk_free_rate, is_call)
+            for k in strikes
+        ]
+        return GreeksArray(
+            delta=[row[0] for row in rows],
+            gamma=[row[1] for row in rows],
+            theta=[row[2] for row in rows],
+            vega=[row[3] for row in rows],
+            rho=[row[4] for row in rows],
+        )
 
-    # Rho (per 1% change in interest rate)
-    if option_type == "call":
-        rho = strike * time_to_expiry * exp_rt * nd2 / 100
-    else:
-        rho = -strike * time_to_expiry * exp_rt * (1 - nd2) / 100
+    sqrt_t = math.sqrt(time_to_expiry)
+    vol_sqrt_t = volatility * sqrt_t
+    drift = (risk_free_rate + 0.5 * volatility**2) * time_to_expiry
+    exp_rt = math.exp(-risk_free_rate * time_to_expiry)
+    log_spot = math.log(spot)
+    gamma_denom = spot * vol_sqrt_t
+    theta_scale = spot * volatility / (2 * sqrt_t)
+    vega_scale = spot * sqrt_t / 100
+    is_call = option_type == "call"
+
+    deltas, gammas, thetas, vegas, rhos = [], [], [], [], []
+    for strike in strikes:
+        d1 = (log_spot - math.log(strike) + drift) / vol_sqrt_t
+        nd1 = norm_cdf(d1)
+        nd2 = norm_cdf(d1 - vol_sqrt_t)
+        npd1 = norm_pdf(d1)
+        discounted_strike = strike * exp_rt
+
+        gammas.append(npd1 / gamma_denom)
+        vegas.append(vega_scale * npd1)
+        if is_call:
+            deltas.append(nd1)
+            thetas.append((-theta_scale * npd1 - risk_free_rate * discounted_strike * nd2) / 365)
+            rhos.append(discounted_strike * time_to_expiry * nd2 / 100)
+        else:
+            deltas.append(nd1 - 1)
+            thetas.append(
+                (-theta_scale * npd1 + risk_free_rate * discounted_strike * (1 - nd2)) / 365
+            )
+            rhos.append(-discounted_strike * time_to_expiry * (1 - nd2) / 100)
 
-    return GreeksResult(
-        delta=delta,
-        gamma=gamma,
-        theta=theta,
-        vega=vega,
-        rho=rho,
-    )
+    return GreeksArray(delta=deltas, gamma=gammas, theta=thetas, vega=vegas, rho=rhos)
 
 
 def calculate_spread_greeks(
@@ -142,12 +222,24 @@ def calculate_spread_greeks(
     )
 
 
-def days_to_expiry(expiration: str) -> int:
-    """Calculate days until expiration."""
-    exp_date = datetime.strptime(expiration, "%Y-%m-%d")
-    return max(0, (exp_date - datetime.now()).days)
+@lru_cache(maxsize=512)
+def parse_expiration(expiration: str) -> datetime:
+    """Parse a YYYY-MM-DD expiration to midnight of that day.
+
+    Memoized: the same handful of expirations are parsed for every contract
+    in a chain.
+    """
+    return datetime.fromisoformat(expiration)
+
+
+def days_to_expiry(expiration: str, now: datetime | None = None) -> int:
+    """Calculate days until expiration.
+
+    Pass `now` to evaluate many expirations against a single timestamp.
+    """
+    return max(0, (parse_expiration(expiration) - (now or datetime.now())).days)
 
 
-def years_to_expiry(expiration: str) -> float:
+def years_to_expiry(expiration: str, now: datetime | None = None) -> float:
     """Calculate years until expiration."""
-    return days_to_expiry(expiration) / 365.0
+    return days_to_expiry(expiration, now) / 365.0
@@ -1,12 +1,14 @@
-from __future__ import annotations
-
 """Implied Volatility Rank calculations."""
 
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IVMetrics:
     """IV metrics for an underlying."""
 
@@ -35,9 +37,11 @@ def calculate_iv_rank(
     if not historical_ivs:
         return 50.0  # Default to middle if no history
 
-    iv_low = min(historical_ivs)
-    iv_high = max(historical_ivs)
+    return _iv_rank_from_bounds(current_iv, min(historical_ivs), max(historical_ivs))
 
+
+def _iv_rank_from_bounds(current_iv: float, iv_low: float, iv_high: float) -> float:
+    """Calculate IV Rank from precomputed 52-week low and high."""
     if iv_high == iv_low:
         return 50.0  # Avoid division by zero
 
@@ -63,7 +67,7 @@ def calculate_iv_percentile(
     if not historical_ivs:
         return 50.0
 
-    days_lower = sum(1 for iv in historical_ivs if iv < current_iv)
+    days_lower = len([iv for iv in historical_ivs if iv < current_iv])
     return (days_lower / len(historical_ivs)) * 100
 
 
@@ -89,12 +93,16 @@ def calculate_iv_metrics(
             iv_low=current_iv,
         )
 
+    # Scan the history once for each bound instead of once per metric
+    iv_low = min(historical_ivs)
+    iv_high = max(historical_ivs)
+
     return IVMetrics(
         current_iv=current_iv,
-        iv_rank=calculate_iv_rank(current_iv, historical_ivs),
+        iv_rank=_iv_rank_from_bounds(current_iv, iv_low, iv_high),
         iv_percentile=calculate_iv_percentile(current_iv, historical_ivs),
-        iv_high=max(historical_ivs),
-        iv_low=min(historical_ivs),
+        iv_high=iv_high,
+        iv_low=iv_low,
     )
 
 
@@ -121,37 +129,42 @@ def get_iv_regime(iv_rank: float) -> str:
 # Historical IV storage helpers
 
 
-@dataclass
-class IVDataPoint:
-    """Single IV observation."""
-
-    date: str
-    iv: float
-
-
 class IVHistory:
-    """Manager for historical IV data."""
+    """Manager for historical IV data.
+
+    Each symbol's history is kept as a packed array of date ordinals alongside
+    a packed array of IV values, so trimming the lookback window is a single
+    slice delete and no per-observation objects are allocated.
+    """
 
     def __init__(self, lookback_days: int = 252):
         self.lookback_days = lookback_days
-        self._data: dict[str, list[IVDataPoint]] = {}  # symbol -> data points
+        self._dates: dict[str, array] = {}  # symbol -> sorted date ordinals
+        self._ivs: dict[str, array] = {}  # symbol -> IVs aligned with _dates
 
     def add_observation(self, symbol: str, date: str, iv: float) -> None:
-        """Add an IV observation for a symbol."""
-        if symbol not in self._data:
-            self._data[symbol] = []
+        """Add an IV observation for a YYYY-MM-DD date."""
+        dates = self._dates.setdefault(symbol, array("l"))
+        ivs = self._ivs.setdefault(symbol, array("d"))
 
-        self._data[symbol].append(IVDataPoint(date=date, iv=iv))
+        # Observations normally arrive in date order, making this an append
+        ordinal = datetime.fromisoformat(date).toordinal()
+        i = bisect_right(dates, ordinal)
+        dates.insert(i, ordinal)
+        ivs.insert(i, iv)
 
         # Trim to lookback period
-        cutoff_date = (datetime.now() - timedelta(days=self.lookback_days)).strftime("%Y-%m-%d")
-        self._data[symbol] = [dp for dp in self._data[symbol] if dp.date >= cutoff_date]
+        cutoff = (datetime.now() - timedelta(days=self.lookback_days)).toordinal()
+        expired = bisect_left(dates, cutoff)
+        if expired:
+            del dates[:expired]
+            del ivs[:expired]
 
     def get_historical_ivs(self, symbol: str) -> list[float]:
         """Get historical IV values for a symbol."""
-        if symbol not in self._data:
+        if symbol not in self._ivs:
             return []
-        return [dp.iv for dp in self._data[symbol]]
+        return self._ivs[symbol].tolist()
 
     def get_metrics(self, symbol: str, current_iv: float) -> IVMetrics:
         """Get IV metrics for a symbol."""
@@ -160,12 +173,15 @@ class IVHistory:
     def to_dict(self) -> dict:
         """Serialize to dict for storage."""
         return {
-            symbol: [{"date": dp.date, "iv": dp.iv} for dp in data]
-            for symbol, data in self._data.items()
+            symbol: [
+                {"date": datetime.fromordinal(ordinal).strftime("%Y-%m-%d"), "iv": iv}
+                for ordinal, iv in zip(dates, self._ivs[symbol], strict=True)
+            ]
+            for symbol, dates in self._dates.items()
         }
 
     @classmethod
-    def from_dict(cls, data: dict, lookback_days: int = 252) -> "IVHistory":
+    def from_dict(cls, data: dict, lookback_days: int = 252) -> IVHistory:
         """Deserialize from dict."""
         history = cls(lookback_days)
         for symbol, points in data.items():
@@ -1,11 +1,12 @@
-from __future__ import annotations
-
 """Options screener for finding credit spread opportunities."""
 
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 
-from core.analysis.greeks import calculate_greeks, days_to_expiry, years_to_expiry
+from core.analysis.greeks import calculate_greeks_batch, days_to_expiry
 from core.analysis.iv_rank import IVMetrics
 from core.broker.types import OptionContract, OptionsChain
 from core.types import CreditSpread, Greeks, SpreadType
@@ -45,7 +46,7 @@ class ScreenerConfig:
     max_bid_ask_spread_pct: float = 0.08  # 8% of mid price (tightened from 10%)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScoredSpread:
     """A credit spread with a score for ranking."""
 
@@ -86,20 +87,26 @@ class OptionsScreener:
 
         opportunities = []
 
+        # Compute DTE once per expiration against a single timestamp
+        now = datetime.now()
+        dte_by_expiration = {exp: days_to_expiry(exp, now) for exp in chain.expirations}
+
         # Filter expirations to DTE range
         valid_expirations = [
             exp
-            for exp in chain.expirations
-            if self.config.min_dte <= days_to_expiry(exp) <= self.config.max_dte
+            for exp, dte in dte_by_expiration.items()
+            if self.config.min_dte <= dte <= self.config.max_dte
         ]
 
         for expiration in valid_expirations:
+            tte = dte_by_expiration[expiration] / 365.0
+
             # Find bull put spreads (bullish/neutral)
-            put_opportunities = self._find_bull_put_spreads(chain, expiration, iv_metrics)
+            put_opportunities = self._find_bull_put_spreads(chain, expiration, iv_metrics, tte)
             opportunities.extend(put_opportunities)
 
             # Find bear call spreads (bearish/neutral)
-            call_opportunities = self._find_bear_call_spreads(chain, expiration, iv_metrics)
+            call_opportunities = self._find_bear_call_spreads(chain, expiration, iv_metrics, tte)
             opportunities.extend(call_opportunities)
 
         # Sort by score descending
@@ -112,6 +119,7 @@ class OptionsScreener:
         chain: OptionsChain,
         expiration: str,
         iv_metrics: IVMetrics,
+        tte: float,
     ) -> list[ScoredSpread]:
         """Find bull put spread opportunities (sell higher put, buy lower put)."""
         puts = chain.get_puts(expiration)
@@ -124,22 +132,37 @@ class OptionsScreener:
         puts.sort(key=lambda x: x.strike, reverse=True)
 
         opportunities = []
-        tte = years_to_expiry(expiration)
 
-        for i, short_put in enumerate(puts):
-            # Check short strike delta
-            short_delta = self._get_delta(
-                short_put, chain.underlying_price, tte, iv_metrics.current_iv, "put"
-            )
-            if not (self.config.min_delta <= abs(short_delta) <= self.config.max_delta):
-                continue
+        short_deltas = self._get_deltas(
+            puts, chain.underlying_price, tte, iv_metrics.current_iv, "put"
+        )
+
+        # Negated strikes ascend, so bisect finds the band of valid long strikes
+        neg_strikes = [-p.strike for p in puts]
+
+        for i in self._short_candidates(short_deltas):
+            short_put = puts[i]
+            short_delta = short_deltas[i]
 
-            # Find long put candidates (lower strikes)
-            for long_put in puts[i + 1 :]:
+            # Find long put candidates (lower strikes within the width range)
+            lo = max(i + 1, bisect_left(neg_strikes, self.config.min_width - short_put.strike))
+            hi = bisect_right(neg_strikes, self.config.max_width - short_put.strike)
+            for long_put in puts[lo:hi]:
                 width = short_put.strike - long_put.strike
                 if not (self.config.min_width <= width <= self.config.max_width):
                     continue
 
+                # Check credit from the broker quotes before building the spread,
+                # since most pairs are rejected here (same mid math as CreditSpread)
+                credit = short_put.mid - long_put.mid
+                if credit <= 0:
+                    continue
+
+                # Check minimum credit
+                credit_pct = credit / width
+                if credit_pct < self.config.min_credit_pct:
+                    continue
+
                 spread = self._build_spread(
                     chain.underlying,
                     SpreadType.BULL_PUT,
@@ -148,14 +171,6 @@ class OptionsScreener:
                     expiration,
                 )
 
-                if spread.credit <= 0:
-                    continue
-
-                # Check minimum credit
-                credit_pct = spread.credit / width
-                if credit_pct < self.config.min_credit_pct:
-                    continue
-
                 # Score the spread
                 scored = self._score_spread(spread, iv_metrics, abs(short_delta))
                 opportunities.append(scored)
@@ -167,6 +182,7 @@ class OptionsScreener:
         chain: OptionsChain,
         expiration: str,
         iv_metrics: IVMetrics,
+        tte: float,
     ) -> list[ScoredSpread]:
         """Find bear call spread opportunities (sell lower call, buy higher call)."""
         calls = chain.get_calls(expiration)
@@ -179,22 +195,36 @@ class OptionsScreener:
         calls.sort(key=lambda x: x.strike)
 
         opportunities = []
-        tte = years_to_expiry(expiration)
 
-        for i, short_call in enumerate(calls):
-            # Check short strike delta
-            short_delta = self._get_delta(
-                short_call, chain.underlying_price, tte, iv_metrics.current_iv, "call"
-            )
-            if not (self.config.min_delta <= abs(short_delta) <= self.config.max_delta):
-                continue
+        short_deltas = self._get_deltas(
+            calls, chain.underlying_price, tte, iv_metrics.current_iv, "call"
+        )
+
+        strikes = [c.strike for c in calls]
+
+        for i in self._short_candidates(short_deltas):
+            short_call = calls[i]
+            short_delta = short_deltas[i]
 
-            # Find long call candidates (higher strikes)
-            for long_call in calls[i + 1 :]:
+            # Find long call candidates (higher strikes within the width range)
+            lo = max(i + 1, bisect_left(strikes, short_call.strike + self.config.min_width))
+            hi = bisect_right(strikes, short_call.strike + self.config.max_width)
+            for long_call in calls[lo:hi]:
                 width = long_call.strike - short_call.strike
                 if not (self.config.min_width <= width <= self.config.max_width):
                     continue
 
+                # Check credit from the broker quotes before building the spread,
+                # since most pairs are rejected here (same mid math as CreditSpread)
+                credit = short_call.mid - long_call.mid
+                if credit <= 0:
+                    continue
+
+                # Check minimum credit
+                credit_pct = credit / width
+                if credit_pct < self.config.min_credit_pct:
+                    continue
+
                 spread = self._build_spread(
                     chain.underlying,
                     SpreadType.BEAR_CALL,
@@ -203,14 +233,6 @@ class OptionsScreener:
                     expiration,
                 )
 
-                if spread.credit <= 0:
-                    continue
-
-                # Check minimum credit
-                credit_pct = spread.credit / width
-                if credit_pct < self.config.min_credit_pct:
-                    continue
-
                 # Score the spread
                 scored = self._score_spread(spread, iv_metrics, abs(short_delta))
                 opportunities.append(scored)
@@ -219,46 +241,53 @@ class OptionsScreener:
 
     def _filter_for_liquidity(self, contracts: list[OptionContract]) -> list[OptionContract]:
         """Filter contracts for minimum liquidity."""
-        filtered = []
-        for c in contracts:
-            if c.open_interest < self.config.min_open_interest:
-                continue
-            if c.volume < self.config.min_volume:
-                continue
-            if c.bid <= 0 or c.ask <= 0:
-                continue
-
-            # Check bid-ask spread
-            mid = (c.bid + c.ask) / 2
-            spread_pct = (c.ask - c.bid) / mid if mid > 0 else 1.0
-            if spread_pct > self.config.max_bid_ask_spread_pct:
-                continue
-
-            filtered.append(c)
-
-        return filtered
-
-    def _get_delta(
+        min_open_interest = self.config.min_open_interest
+        min_volume = self.config.min_volume
+        max_spread_pct = self.config.max_bid_ask_spread_pct
+
+        # bid > 0 and ask > 0 guarantee a positive mid, so the bid-ask spread
+        # check can divide without a zero guard
+        return [
+            c
+            for c in contracts
+            if c.open_interest >= min_open_interest
+            and c.volume >= min_volume
+            and c.bid > 0
+            and c.ask > 0
+            and (c.ask - c.bid) / ((c.bid + c.ask) / 2) <= max_spread_pct
+        ]
+
+    def _short_candidates(self, short_deltas: list[float]) -> list[int]:
+        """Indices of contracts whose delta is in the short strike range."""
+        min_delta = self.config.min_delta
+        max_delta = self.config.max_delta
+        return [i for i, delta in enumerate(short_deltas) if min_delta <= abs(delta) <= max_delta]
+
+    def _get_deltas(
         self,
-        contract: OptionContract,
+        contracts: list[OptionContract],
         spot: float,
         tte: float,
         iv: float,
         option_type: str,
-    ) -> float:
-        """Get delta for a contract (from broker or calculated)."""
-        if contract.delta is not None:
-            return contract.delta
-
-        # Calculate if not provided
-        greeks = calculate_greeks(
+    ) -> list[float]:
+        """Get deltas for contracts (from broker, or batch-calculated when missing)."""
+        deltas = [c.delta for c in contracts]
+        missing = [i for i, delta in enumerate(deltas) if delta is None]
+        if not missing:
+            return deltas
+
+        # Calculate all missing deltas for this expiration in one batch
+        greeks = calculate_greeks_batch(
             spot=spot,
-            strike=contract.strike,
+            strikes=[contracts[i].strike for i in missing],
             time_to_expiry=tte,
             volatility=iv,
             option_type=option_type,
         )
-        return greeks.delta
+        for i, delta in zip(missing, greeks.delta, strict=True):
+            deltas[i] = delta
+        return deltas
 
     def _build_spread(
         self,
@@ -338,23 +367,26 @@ class OptionsScreener:
         - Higher credit/width ratio = better risk/reward
         - Expected value (credit * prob_win - max_loss * prob_loss)
         """
+        abs_delta = abs(short_delta)
+        credit = spread.credit
+        width = spread.width
+
         # Probability of expiring OTM (rough estimate from delta)
-        prob_otm = 1 - abs(short_delta)
+        prob_otm = 1 - abs_delta
 
         # Expected value per spread
-        credit = spread.credit * 100  # Per contract
-        max_loss = spread.max_loss
-        expected_value = (credit * prob_otm) - (max_loss * (1 - prob_otm))
+        max_loss = (width - credit) * 100  # Same as spread.max_loss
+        expected_value = (credit * 100 * prob_otm) - (max_loss * abs_delta)
 
         # Score components (normalized)
         # Use IV percentile for scoring (more stable than IV rank)
         iv_score = iv_metrics.iv_percentile / 100  # 0-1
-        delta_score = 1 - abs(abs(short_delta) - 0.25) * 4  # Peak at 0.25
-        credit_score = min(spread.credit / spread.width, 0.5) * 2  # 0-1
-        ev_score = max(0, expected_value) / (spread.width * 100)  # Normalized by width
+        delta_score = max(0.0, 1 - abs(abs_delta - 0.25) * 4)  # Peak at 0.25, floor at 0
+        credit_score = min(credit / width, 0.5) * 2  # 0-1
+        ev_score = max(0, expected_value) / (width * 100)  # Normalized by width
 
-        # Weighted average
-        score = iv_score * 0.25 + delta_score * 0.25 + credit_score * 0.25 + ev_score * 0.25
+        # Equally weighted average
+        score = 0.25 * (iv_score + delta_score + credit_score + ev_score)
 
         return ScoredSpread(
             spread=spread,
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from core import http
@@ -17,6 +21,33 @@ from core.broker.types import (
     PositionSide,
     SpreadOrder,
 )
+from core.cache import TTLCache
+
+# OCC option symbol: ROOT + YYMMDD + C/P + strike*1000 (8 digits)
+_OCC_SYMBOL_RE = re.compile(r"(\D+)(\d{6})([CP])(\d{8})")
+
+# Read-only default for missing snapshot sections
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_occ(occ_symbol: str) -> tuple[str, str, str, float] | None:
+    """Parse an OCC symbol into (underlying, expiration, option_type, strike).
+
+    Cached because the same chain and position symbols are re-parsed on
+    every scan and monitor poll.
+    """
+    match = _OCC_SYMBOL_RE.fullmatch(occ_symbol)
+    if match is None:
+        return None
+
+    underlying, date_part, option_type, strike = match.groups()
+    return (
+        underlying,
+        f"20{date_part[:2]}-{date_part[2:4]}-{date_part[4:]}",
+        "call" if option_type == "C" else "put",
+        int(strike) / 1000,
+    )
 
 
 class AlpacaError(Exception):
@@ -34,22 +65,47 @@ class AlpacaClient:
     LIVE_BASE_URL = "https://api.alpaca.markets"
     DATA_BASE_URL = "https://data.alpaca.markets"
 
+    # Options chains, shared across clients for the lifetime of the isolate.
+    # Quotes move on second-to-minute scales, so only keep them briefly.
+    CHAIN_CACHE_TTL = 30  # seconds
+    _chain_cache = TTLCache(maxsize=32, ttl=CHAIN_CACHE_TTL)
+
+    # Cap on in-flight requests when fanning out snapshot batches. Workers
+    # allows 6 simultaneous outbound connections per invocation, so a higher
+    # cap only queues inside the runtime; pass max_concurrent_requests to
+    # lower it further if Alpaca starts rate limiting.
+    MAX_CONCURRENT_REQUESTS = 6
+
+    # Normalized order side strings; anything else (empty, None, junk) is unset
+    _SIDE_MAP = {"buy": OrderSide.BUY, "sell": OrderSide.SELL}
+
+    # Candidate VIX / VIX3M quote symbols, in order of preference
+    VIX_SYMBOLS = ["$VIX.X", "VIX", "VIXY"]
+    VIX3M_SYMBOLS = ["$VIX3M.X", "VIX3M"]
+
     def __init__(
         self,
         api_key: str,
         secret_key: str,
         paper: bool = True,
+        max_concurrent_requests: int | None = None,
     ):
         self.api_key = api_key
         self.secret_key = secret_key
         self.paper = paper
         self.base_url = self.PAPER_BASE_URL if paper else self.LIVE_BASE_URL
+        self._semaphore = asyncio.Semaphore(
+            max_concurrent_requests or self.MAX_CONCURRENT_REQUESTS
+        )
+        self._inflight: dict[tuple, asyncio.Task] = {}
 
         self._headers = {
             "APCA-API-KEY-ID": api_key,
             "APCA-API-SECRET-KEY": secret_key,
             "Content-Type": "application/json",
         }
+        # Headers never change per client; build the fetch Headers object once
+        self._fetch_headers = http.build_headers(self._headers)
 
     async def _request(
         self,
@@ -60,24 +116,31 @@ class AlpacaClient:
     ) -> Any:
         """Make an authenticated request to Alpaca."""
         try:
-            return await http.request(
-                method,
-                url,
-                headers=self._headers,
-                params=params,
-                json_data=json_data,
-            )
+            async with self._semaphore:
+                return await http.request(
+                    method,
+                    url,
+                    headers=self._fetch_headers,
+                    params=params,
+                    json_data=json_data,
+                )
+        except http.HttpError as e:
+            raise AlpacaError(str(e), status_code=e.status_code) from e
         except Exception as e:
-            error_msg = str(e)
-            status_code = None
-            if error_msg.startswith("HTTP "):
-                parts = error_msg.split(":", 1)
-                if parts[0].startswith("HTTP "):
-                    try:
-                        status_code = int(parts[0].replace("HTTP ", ""))
-                    except ValueError:
-                        pass
-            raise AlpacaError(error_msg, status_code=status_code)
+            raise AlpacaError(str(e)) from e
+
+    async def _coalesce(self, key: tuple, make_request: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight request between concurrent callers with the same key.
+
+        The shared task is shielded so a cancelled caller doesn't cancel it for
+        the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(make_request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
 
     async def _trading_request(
         self,
@@ -134,14 +197,7 @@ class AlpacaClient:
         OCC format: SYMBOL + YYMMDD + C/P + Strike*1000
         """
         all_positions = await self.get_positions()
-        option_positions = []
-
-        for pos in all_positions:
-            # Use centralized OCC symbol parser to identify options
-            if self.parse_occ_symbol(pos.symbol) is not None:
-                option_positions.append(pos)
-
-        return option_positions
+        return [pos for pos in all_positions if _parse_occ(pos.symbol) is not None]
 
     def parse_occ_symbol(self, occ_symbol: str) -> dict | None:
         """Parse an OCC option symbol into components.
@@ -152,31 +208,18 @@ class AlpacaClient:
         Returns:
             Dict with underlying, expiration, option_type, strike or None if invalid
         """
-        try:
-            underlying = ""
-            i = 0
-            while i < len(occ_symbol) and not occ_symbol[i].isdigit():
-                underlying += occ_symbol[i]
-                i += 1
-
-            if not underlying or len(occ_symbol) < i + 15:
-                return None
-
-            date_part = occ_symbol[i : i + 6]
-            option_type = "call" if occ_symbol[i + 6] == "C" else "put"
-            strike = int(occ_symbol[i + 7 :]) / 1000
-
-            expiration = f"20{date_part[:2]}-{date_part[2:4]}-{date_part[4:6]}"
-
-            return {
-                "underlying": underlying,
-                "expiration": expiration,
-                "option_type": option_type,
-                "strike": strike,
-            }
-        except (ValueError, IndexError):
+        parsed = _parse_occ(occ_symbol)
+        if parsed is None:
             return None
 
+        underlying, expiration, option_type, strike = parsed
+        return {
+            "underlying": underlying,
+            "expiration": expiration,
+            "option_type": option_type,
+            "strike": strike,
+        }
+
     async def get_position(self, symbol: str) -> BrokerPosition | None:
         """Get a specific position."""
         try:
@@ -188,10 +231,11 @@ class AlpacaClient:
             raise
 
     def _parse_position(self, data: dict) -> BrokerPosition:
+        qty = int(data["qty"])
         return BrokerPosition(
             symbol=data["symbol"],
-            qty=int(data["qty"]),
-            side=PositionSide.LONG if int(data["qty"]) > 0 else PositionSide.SHORT,
+            qty=qty,
+            side=PositionSide.LONG if qty > 0 else PositionSide.SHORT,
             avg_entry_price=float(data["avg_entry_price"]),
             market_value=float(data["market_value"]),
             cost_basis=float(data["cost_basis"]),
@@ -210,89 +254,121 @@ class AlpacaClient:
     ) -> OptionsChain:
         """Get options chain for a symbol.
 
+        Chains are cached for CHAIN_CACHE_TTL seconds, and concurrent calls
+        for the same chain share a single fetch.
+
         Args:
             symbol: Underlying symbol (e.g., SPY)
             expiration_start: Start date for expirations (YYYY-MM-DD)
             expiration_end: End date for expirations (YYYY-MM-DD)
         """
+        now = datetime.now()
+
         # Default to 30-60 DTE range if not specified
         if expiration_start is None:
-            expiration_start = (datetime.now() + timedelta(days=25)).strftime("%Y-%m-%d")
+            expiration_start = (now + timedelta(days=25)).strftime("%Y-%m-%d")
         if expiration_end is None:
-            expiration_end = (datetime.now() + timedelta(days=50)).strftime("%Y-%m-%d")
-
-        # Step 1: Get option contracts from trading API
-        contracts_params = {
-            "underlying_symbols": symbol,
-            "expiration_date_gte": expiration_start,
-            "expiration_date_lte": expiration_end,
-            "status": "active",
-            "limit": 1000,
-        }
+            expiration_end = (now + timedelta(days=50)).strftime("%Y-%m-%d")
 
-        contracts_data = await self._trading_request(
-            "GET", "/v2/options/contracts", params=contracts_params
-        )
+        cache_key = (symbol, expiration_start, expiration_end)
+        cached = self._chain_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        option_contracts = contracts_data.get("option_contracts", [])
-        if not option_contracts:
-            # Get underlying price even if no contracts
-            underlying_price = await self._get_underlying_price(symbol)
-            return OptionsChain(
-                underlying=symbol,
-                underlying_price=underlying_price,
-                timestamp=datetime.now(),
-                expirations=[],
-                contracts=[],
-            )
+        chain = await self._coalesce(
+            ("chain", *cache_key),
+            lambda: self._fetch_options_chain(symbol, expiration_start, expiration_end, now),
+        )
+        self._chain_cache.set(cache_key, chain)
+        return chain
 
-        # Build a lookup of contract metadata (open_interest, etc.) from trading API
+    async def _fetch_options_chain(
+        self,
+        symbol: str,
+        expiration_start: str,
+        expiration_end: str,
+        now: datetime,
+    ) -> OptionsChain:
+        """Fetch an options chain from Alpaca, bypassing the chain cache."""
+        # The underlying quote is independent of the chain, fetch it alongside
+        price_task = asyncio.create_task(self._get_underlying_price(symbol))
+        snapshot_tasks = []
         contract_metadata = {}
-        for c in option_contracts:
-            contract_metadata[c["symbol"]] = {
-                "open_interest": int(c.get("open_interest") or 0),
+
+        try:
+            # Step 1: Page through option contracts from trading API. Each page's
+            # snapshots (batches of 100 symbols) are requested as soon as it
+            # arrives, overlapping with the fetch of the next page.
+            contracts_params = {
+                "underlying_symbols": symbol,
+                "expiration_date_gte": expiration_start,
+                "expiration_date_lte": expiration_end,
+                "status": "active",
+                "limit": 1000,
             }
+            batch_size = 100
 
-        # Step 2: Get snapshots for the option symbols (batch in groups of 100)
-        all_symbols = [c["symbol"] for c in option_contracts]
-        contracts = []
-        expirations = set()
+            while True:
+                contracts_data = await self._trading_request(
+                    "GET", "/v2/options/contracts", params=contracts_params
+                )
 
-        # Process in batches of 100 symbols
-        batch_size = 100
-        for i in range(0, len(all_symbols), batch_size):
-            batch_symbols = all_symbols[i : i + batch_size]
-            symbols_param = ",".join(batch_symbols)
+                page_symbols = []
+                for c in contracts_data.get("option_contracts") or []:
+                    # Contract metadata (open_interest, etc.) from trading API
+                    contract_metadata[c["symbol"]] = {
+                        "open_interest": int(c.get("open_interest") or 0),
+                    }
+                    page_symbols.append(c["symbol"])
+
+                # Step 2: Get snapshots for this page's option symbols
+                snapshot_tasks.extend(
+                    asyncio.create_task(
+                        self._data_request(
+                            "GET",
+                            "/v1beta1/options/snapshots",
+                            params={"symbols": ",".join(page_symbols[i : i + batch_size])},
+                        )
+                    )
+                    for i in range(0, len(page_symbols), batch_size)
+                )
 
-            snapshot_params = {"symbols": symbols_param}
-            snapshot_data = await self._data_request(
-                "GET", "/v1beta1/options/snapshots", params=snapshot_params
-            )
+                page_token = contracts_data.get("next_page_token")
+                if not page_token:
+                    break
+                contracts_params["page_token"] = page_token
 
-            for occ_symbol, snapshot in snapshot_data.get("snapshots", {}).items():
-                # Merge open_interest from contract metadata
-                metadata = contract_metadata.get(occ_symbol, {})
-                contract = self._parse_option_contract(occ_symbol, snapshot, metadata)
-                if contract:
-                    contracts.append(contract)
-                    expirations.add(contract.expiration)
+            underlying_price, *snapshot_batches = await asyncio.gather(
+                price_task, *snapshot_tasks
+            )
+        except BaseException:
+            for task in (price_task, *snapshot_tasks):
+                task.cancel()
+            raise
 
-        # Get underlying price
-        underlying_price = await self._get_underlying_price(symbol)
+        # Parse snapshots, merging open_interest from contract metadata
+        parse_contract = self._parse_option_contract
+        contracts = [
+            contract
+            for snapshot_data in snapshot_batches
+            for occ_symbol, snapshot in snapshot_data.get("snapshots", {}).items()
+            if (contract := parse_contract(occ_symbol, snapshot, contract_metadata.get(occ_symbol)))
+            is not None
+        ]
 
         return OptionsChain(
             underlying=symbol,
             underlying_price=underlying_price,
-            timestamp=datetime.now(),
-            expirations=sorted(expirations),
+            timestamp=now,
+            expirations=sorted({c.expiration for c in contracts}),
             contracts=contracts,
         )
 
     async def _get_underlying_price(self, symbol: str) -> float:
         """Get current price of underlying."""
-        data = await self._data_request(
-            "GET",
-            f"/v2/stocks/{symbol}/quotes/latest",
+        data = await self._coalesce(
+            ("quote", symbol),
+            lambda: self._data_request("GET", f"/v2/stocks/{symbol}/quotes/latest"),
         )
         quote = data.get("quote", {})
         # Use midpoint of bid/ask
@@ -308,73 +384,93 @@ class AlpacaClient:
         """Parse option contract from Alpaca snapshot."""
         try:
             # Use centralized OCC symbol parser
-            parsed = self.parse_occ_symbol(occ_symbol)
-            if not parsed:
+            parsed = _parse_occ(occ_symbol)
+            if parsed is None:
                 return None
+            underlying, expiration, option_type, strike = parsed
 
-            quote = snapshot.get("latestQuote", {})
-            trade = snapshot.get("latestTrade", {})
-            greeks = snapshot.get("greeks", {})
-            metadata = metadata or {}
+            quote = snapshot.get("latestQuote") or _EMPTY
+            trade = snapshot.get("latestTrade") or _EMPTY
+            greeks = snapshot.get("greeks") or _EMPTY
+            metadata = metadata or _EMPTY
 
             # Open interest from contract metadata (trading API), fallback to snapshot
             open_interest = metadata.get("open_interest") or int(snapshot.get("openInterest", 0))
 
+            # Read each greek once; missing or zero values are reported as None
+            delta = greeks.get("delta")
+            gamma = greeks.get("gamma")
+            theta = greeks.get("theta")
+            vega = greeks.get("vega")
+            iv = greeks.get("impliedVolatility")
+
             return OptionContract(
                 symbol=occ_symbol,
-                underlying=parsed["underlying"],
-                expiration=parsed["expiration"],
-                strike=parsed["strike"],
-                option_type=parsed["option_type"],
+                underlying=underlying,
+                expiration=expiration,
+                strike=strike,
+                option_type=option_type,
                 bid=float(quote.get("bp", 0)),
                 ask=float(quote.get("ap", 0)),
                 last=float(trade.get("p", 0)),
-                volume=int(snapshot.get("dailyBar", {}).get("v", 0)),
+                volume=int((snapshot.get("dailyBar") or _EMPTY).get("v", 0)),
                 open_interest=open_interest,
-                delta=float(greeks.get("delta")) if greeks.get("delta") else None,
-                gamma=float(greeks.get("gamma")) if greeks.get("gamma") else None,
-                theta=float(greeks.get("theta")) if greeks.get("theta") else None,
-                vega=float(greeks.get("vega")) if greeks.get("vega") else None,
-                implied_volatility=float(greeks.get("impliedVolatility"))
-                if greeks.get("impliedVolatility")
-                else None,
+                delta=float(delta) if delta else None,
+                gamma=float(gamma) if gamma else None,
+                theta=float(theta) if theta else None,
+                vega=float(vega) if vega else None,
+                implied_volatility=float(iv) if iv else None,
             )
         except (ValueError, IndexError, KeyError):
             return None
 
     # Orders
 
-    async def place_spread_order(self, spread: SpreadOrder) -> Order:
-        """Place a credit spread order (sell short, buy long).
-
-        For credit spreads, limit_price should be negative (credit received).
-        """
-        # Alpaca mleg orders use negative limit_price for credits
-        # Round to 2 decimal places - Alpaca rejects prices with more precision
-        limit_price = round(-abs(spread.limit_price), 2)
+    # (side, position_intent) for each leg of an opening / closing credit spread
+    _OPEN_SHORT_LEG = ("sell", "sell_to_open")
+    _OPEN_LONG_LEG = ("buy", "buy_to_open")
+    _CLOSE_SHORT_LEG = ("buy", "buy_to_close")
+    _CLOSE_LONG_LEG = ("sell", "sell_to_close")
 
-        order_data = {
+    def _mleg_order_data(
+        self,
+        contracts: int,
+        limit_price: float,
+        legs: list[tuple[str, tuple[str, str]]],
+    ) -> dict:
+        """Build a day limit multi-leg order body from (symbol, leg action) pairs."""
+        return {
             "order_class": "mleg",
-            "qty": str(spread.contracts),
+            "qty": str(contracts),
             "type": "limit",
             "time_in_force": "day",
             "limit_price": str(limit_price),
             "legs": [
                 {
-                    "symbol": spread.short_symbol,
-                    "side": "sell",
+                    "symbol": symbol,
+                    "side": side,
                     "ratio_qty": "1",
-                    "position_intent": "sell_to_open",
-                },
-                {
-                    "symbol": spread.long_symbol,
-                    "side": "buy",
-                    "ratio_qty": "1",
-                    "position_intent": "buy_to_open",
-                },
+                    "position_intent": intent,
+                }
+                for symbol, (side, intent) in legs
             ],
         }
 
+    async def place_spread_order(self, spread: SpreadOrder) -> Order:
+        """Place a credit spread order (sell short, buy long).
+
+        For credit spreads, limit_price should be negative (credit received).
+        """
+        # Alpaca mleg orders use negative limit_price for credits
+        # Round to 2 decimal places - Alpaca rejects prices with more precision
+        limit_price = round(-abs(spread.limit_price), 2)
+
+        order_data = self._mleg_order_data(
+            spread.contracts,
+            limit_price,
+            [(spread.short_symbol, self._OPEN_SHORT_LEG), (spread.long_symbol, self._OPEN_LONG_LEG)],
+        )
+
         data = await self._trading_request("POST", "/v2/orders", json_data=order_data)
         return self._parse_order(data)
 
@@ -393,27 +489,11 @@ class AlpacaClient:
         # Round to 2 decimal places - Alpaca rejects prices with more precision
         limit_price = round(abs(limit_price), 2)
 
-        order_data = {
-            "order_class": "mleg",
-            "qty": str(contracts),
-            "type": "limit",
-            "time_in_force": "day",
-            "limit_price": str(limit_price),
-            "legs": [
-                {
-                    "symbol": short_symbol,
-                    "side": "buy",
-                    "ratio_qty": "1",
-                    "position_intent": "buy_to_close",
-                },
-                {
-                    "symbol": long_symbol,
-                    "side": "sell",
-                    "ratio_qty": "1",
-                    "position_intent": "sell_to_close",
-                },
-            ],
-        }
+        order_data = self._mleg_order_data(
+            contracts,
+            limit_price,
+            [(short_symbol, self._CLOSE_SHORT_LEG), (long_symbol, self._CLOSE_LONG_LEG)],
+        )
 
         data = await self._trading_request("POST", "/v2/orders", json_data=order_data)
         return self._parse_order(data)
@@ -437,52 +517,34 @@ class AlpacaClient:
         data = await self._trading_request("GET", "/v2/orders", params=params)
         return [self._parse_order(o) for o in data]
 
+    def _parse_side(self, value: Any) -> OrderSide | None:
+        if value is None:
+            return None
+        return self._SIDE_MAP.get(str(value).lower().strip())
+
     def _parse_order(self, data: dict) -> Order:
         legs = None
         if data.get("legs"):
-            parsed_legs = []
-            for i, leg in enumerate(data["legs"]):
-                # Handle empty/missing/invalid leg side
-                leg_side_str = leg.get("side", "")
-                # Normalize: convert to lowercase string, handle None
-                if leg_side_str is None:
-                    leg_side_str = ""
-                leg_side_str = str(leg_side_str).lower().strip()
-
-                # Validate side value
-                if leg_side_str not in ("buy", "sell"):
+            legs = [
+                OrderLeg(
+                    symbol=leg["symbol"],
                     # For credit spreads: first leg is sell (short), second is buy (long)
-                    leg_side_str = "sell" if i == 0 else "buy"
-
-                parsed_legs.append(
-                    OrderLeg(
-                        symbol=leg["symbol"],
-                        side=OrderSide(leg_side_str),
-                        qty=int(leg["qty"]),
-                        filled_qty=int(leg.get("filled_qty", 0)),
-                        filled_avg_price=float(leg["filled_avg_price"])
-                        if leg.get("filled_avg_price")
-                        else None,
-                    )
+                    side=self._parse_side(leg.get("side"))
+                    or (OrderSide.SELL if i == 0 else OrderSide.BUY),
+                    qty=int(leg["qty"]),
+                    filled_qty=int(leg.get("filled_qty", 0)),
+                    filled_avg_price=float(leg["filled_avg_price"])
+                    if leg.get("filled_avg_price")
+                    else None,
                 )
-            legs = parsed_legs
+                for i, leg in enumerate(data["legs"])
+            ]
 
         # For multi-leg orders, Alpaca returns empty string for top-level side
         # since each leg has its own side. Derive from first leg if available.
-        side_str = data.get("side", "")
-        # Normalize: convert to lowercase string, handle None
-        if side_str is None:
-            side_str = ""
-        side_str = str(side_str).lower().strip()
-
-        if side_str not in ("buy", "sell"):
-            if legs:
-                # Use first leg's side (already validated)
-                side_str = legs[0].side.value
-            else:
-                side_str = "buy"  # Default fallback
-
-        order_side = OrderSide(side_str)
+        order_side = self._parse_side(data.get("side"))
+        if order_side is None:
+            order_side = legs[0].side if legs else OrderSide.BUY
 
         return Order(
             id=data["id"],
@@ -497,8 +559,8 @@ class AlpacaClient:
             filled_avg_price=float(data["filled_avg_price"])
             if data.get("filled_avg_price")
             else None,
-            created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            updated_at=datetime.fromisoformat(data["updated_at"]),
             legs=legs,
         )
 
@@ -520,84 +582,65 @@ class AlpacaClient:
 
     # VIX Data
 
+    async def _get_quotes_batch(self, symbols: list[str]) -> dict[str, dict]:
+        """Get latest stock quotes for several symbols in one request."""
+        data = await self._data_request(
+            "GET",
+            "/v2/stocks/quotes/latest",
+            params={"symbols": ",".join(symbols)},
+        )
+        return data.get("quotes") or {}
+
+    @staticmethod
+    def _first_quote_price(quotes: dict[str, dict], symbols: list[str]) -> float | None:
+        """Get the price of the first symbol, in preference order, with a quote."""
+        for symbol in symbols:
+            quote = quotes.get(symbol) or {}
+            bid = float(quote.get("bp") or 0)
+            ask = float(quote.get("ap") or 0)
+            if bid and ask:
+                return (bid + ask) / 2
+            if bid or ask:
+                return bid or ask
+        return None
+
     async def get_vix_snapshot(self) -> dict | None:
         """Get current VIX and VIX3M levels.
 
         Uses CBOE VIX Index via Alpaca's market data API.
-        VIX is available as a tradeable asset.
+        VIX is available as a tradeable asset. All candidate VIX and VIX3M
+        symbols are fetched in a single multi-symbol quotes request.
 
         Returns:
             Dict with 'vix' and optionally 'vix3m' values, or None if unavailable.
         """
         result = {}
 
-        # Fetch VIX (CBOE Volatility Index)
+        # Alpaca uses different symbols - fetch all common variations at once
         try:
-            # VIX is available via the stocks endpoint as $VIX.X or similar
-            # Alpaca uses different symbols - try common variations
-            for vix_symbol in ["$VIX.X", "VIX", "VIXY"]:
-                try:
-                    data = await self._data_request(
-                        "GET",
-                        f"/v2/stocks/{vix_symbol}/quotes/latest",
-                    )
-                    quote = data.get("quote", {})
-                    bid = float(quote.get("bp", 0))
-                    ask = float(quote.get("ap", 0))
-                    if bid and ask:
-                        result["vix"] = (bid + ask) / 2
-                        break
-                    elif bid or ask:
-                        result["vix"] = bid or ask
-                        break
-                except AlpacaError:
-                    continue
-
-            # If direct VIX not available, try to get from options-based proxy
-            if "vix" not in result:
-                # Calculate VIX proxy from SPY options IV
-                try:
-                    chain = await self.get_options_chain("SPY")
-                    if chain.contracts:
-                        atm_contracts = [
-                            c
-                            for c in chain.contracts
-                            if abs(c.strike - chain.underlying_price) < chain.underlying_price * 0.02
-                            and c.implied_volatility
-                        ]
-                        if atm_contracts:
-                            avg_iv = sum(c.implied_volatility for c in atm_contracts) / len(
-                                atm_contracts
-                            )
-                            # Convert annualized IV to VIX-like value (VIX = IV * 100)
-                            result["vix"] = avg_iv * 100
-                except Exception:
-                    pass
-
-        except Exception as e:
-            print(f"Error fetching VIX: {e}")
-
-        # Try to fetch VIX3M for term structure analysis
-        try:
-            for vix3m_symbol in ["$VIX3M.X", "VIX3M"]:
-                try:
-                    data = await self._data_request(
-                        "GET",
-                        f"/v2/stocks/{vix3m_symbol}/quotes/latest",
-                    )
-                    quote = data.get("quote", {})
-                    bid = float(quote.get("bp", 0))
-                    ask = float(quote.get("ap", 0))
-                    if bid and ask:
-                        result["vix3m"] = (bid + ask) / 2
-                        break
-                    elif bid or ask:
-                        result["vix3m"] = bid or ask
-                        break
-                except AlpacaError:
-                    continue
-        except Exception:
-            pass  # VIX3M is optional
+            quotes = await self._get_quotes_batch(self.VIX_SYMBOLS + self.VIX3M_SYMBOLS)
+        except AlpacaError as e:
+            print(f"Error fetching VIX quotes: {e}")
+            quotes = {}
+
+        vix = self._first_quote_price(quotes, self.VIX_SYMBOLS)
+        if vix is not None:
+            result["vix"] = vix
+        else:
+            # Direct VIX not available: calculate VIX proxy from SPY options IV
+            try:
+                chain = await self.get_options_chain("SPY")
+                avg_iv = chain.get_atm_iv()
+                if avg_iv is not None:
+                    # Convert annualized IV to VIX-like value (VIX = IV * 100)
+                    result["vix"] = avg_iv * 100
+            except Exception as e:
+                print(f"Error fetching VIX: {e}")
+
+        # VIX3M is optional, used for term structure analysis
+        vix3m = self._first_quote_price(quotes, self.VIX3M_SYMBOLS)
+        if vix3m is not None:
+            result["vix3m"] = vix3m
 
         return result if result else None
 
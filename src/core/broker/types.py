@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Literal
@@ -32,7 +32,7 @@ class PositionSide(str, Enum):
     SHORT = "short"
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionQuote:
     """Real-time quote for an option contract."""
 
@@ -46,7 +46,7 @@ class OptionQuote:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OptionContract:
     """Option contract details from broker."""
 
@@ -75,7 +75,7 @@ class OptionContract:
         return (self.bid + self.ask) / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionsChain:
     """Full options chain for an underlying."""
 
@@ -85,22 +85,50 @@ class OptionsChain:
     expirations: list[str]
     contracts: list[OptionContract]
 
+    # Contracts grouped by (expiration, option_type), built on first lookup
+    _groups: dict[tuple[str, str], list[OptionContract]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _get_group(self, expiration: str, option_type: str) -> list[OptionContract]:
+        if self._groups is None:
+            groups: dict[tuple[str, str], list[OptionContract]] = {}
+            for c in self.contracts:
+                groups.setdefault((c.expiration, c.option_type), []).append(c)
+            self._groups = groups
+        return list(self._groups.get((expiration, option_type), ()))
+
     def get_expiration(self, expiration: str) -> list[OptionContract]:
         """Get all contracts for a specific expiration."""
         return [c for c in self.contracts if c.expiration == expiration]
 
     def get_puts(self, expiration: str | None = None) -> list[OptionContract]:
         """Get all put contracts, optionally filtered by expiration."""
-        contracts = self.contracts if expiration is None else self.get_expiration(expiration)
-        return [c for c in contracts if c.option_type == "put"]
+        if expiration is not None:
+            return self._get_group(expiration, "put")
+        return [c for c in self.contracts if c.option_type == "put"]
 
     def get_calls(self, expiration: str | None = None) -> list[OptionContract]:
         """Get all call contracts, optionally filtered by expiration."""
-        contracts = self.contracts if expiration is None else self.get_expiration(expiration)
-        return [c for c in contracts if c.option_type == "call"]
+        if expiration is not None:
+            return self._get_group(expiration, "call")
+        return [c for c in self.contracts if c.option_type == "call"]
+
+    def get_atm_contracts(self, band_pct: float = 0.02) -> list[OptionContract]:
+        """Get contracts with strikes within band_pct of the underlying price."""
+        price = self.underlying_price
+        band = price * band_pct
+        return [c for c in self.contracts if abs(c.strike - price) < band]
+
+    def get_atm_iv(self, band_pct: float = 0.02) -> float | None:
+        """Get the average implied volatility of ATM contracts that report one."""
+        ivs = [
+            c.implied_volatility for c in self.get_atm_contracts(band_pct) if c.implied_volatility
+        ]
+        return sum(ivs) / len(ivs) if ivs else None
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order details."""
 
@@ -119,7 +147,7 @@ class Order:
     legs: list["OrderLeg"] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderLeg:
     """Leg of a multi-leg order."""
 
@@ -130,7 +158,7 @@ class OrderLeg:
     filled_avg_price: float | None
 
 
-@dataclass
+@dataclass(slots=True)
 class BrokerPosition:
     """Position held at broker."""
 
@@ -145,7 +173,7 @@ class BrokerPosition:
     current_price: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Broker account information."""
 
@@ -163,7 +191,7 @@ class Account:
     pattern_day_trader: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadOrder:
     """Credit spread order request."""
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
@@ -18,42 +19,162 @@ from core.types import (
 
 
 def js_to_python(obj):
-    """Convert JsProxy objects to Python equivalents."""
-    from pyodide.ffi import JsProxy
+    """Convert JsProxy objects to Python equivalents.
+
+    D1 results and rows are JS objects that implement to_py(); anything else
+    is already a Python value.
+    """
+    to_py = getattr(obj, "to_py", None)
+    return to_py() if to_py is not None else obj
+
+
+def _optional(convert):
+    """Wrap a column converter so NULL (or empty) values become None."""
+    return lambda value: convert(value) if value else None
+
+
+def _enum_lookup(enum_cls):
+    """Converter mapping stored values to enum members with a dict lookup.
+
+    Unknown values fall through to the enum constructor so they still raise
+    ValueError.
+    """
+    members = {member.value: member for member in enum_cls}
+
+    def convert(value):
+        member = members.get(value)
+        return member if member is not None else enum_cls(value)
+
+    return convert
+
+
+_to_recommendation_status = _enum_lookup(RecommendationStatus)
+_to_trade_status = _enum_lookup(TradeStatus)
+_to_spread_type = _enum_lookup(SpreadType)
+_to_confidence = _enum_lookup(Confidence)
+
+
+# (column, converter) pairs in dataclass field order, so rows can be built
+# positionally. A converter of None passes the column value through.
+_RECOMMENDATION_COLUMNS = (
+    ("id", None),
+    ("created_at", datetime.fromisoformat),
+    ("expires_at", datetime.fromisoformat),
+    ("status", _to_recommendation_status),
+    ("underlying", None),
+    ("spread_type", _to_spread_type),
+    ("short_strike", None),
+    ("long_strike", None),
+    ("expiration", None),
+    ("credit", None),
+    ("max_loss", None),
+    ("iv_rank", None),
+    ("delta", None),
+    ("theta", None),
+    ("thesis", None),
+    ("confidence", _optional(_to_confidence)),
+    ("suggested_contracts", None),
+    ("analysis_price", None),
+    ("discord_message_id", None),
+)
+
+_TRADE_COLUMNS = (
+    ("id", None),
+    ("recommendation_id", None),
+    ("opened_at", _optional(datetime.fromisoformat)),
+    ("closed_at", _optional(datetime.fromisoformat)),
+    ("status", _to_trade_status),
+    ("underlying", None),
+    ("spread_type", _to_spread_type),
+    ("short_strike", None),
+    ("long_strike", None),
+    ("expiration", None),
+    ("entry_credit", None),
+    ("exit_debit", None),
+    ("profit_loss", None),
+    ("contracts", None),
+    ("broker_order_id", None),
+    ("reflection", None),
+    ("lesson", None),
+)
+
+_POSITION_COLUMNS = (
+    ("id", None),
+    ("trade_id", None),
+    ("underlying", None),
+    ("short_strike", None),
+    ("long_strike", None),
+    ("expiration", None),
+    ("contracts", None),
+    ("current_value", None),
+    ("unrealized_pnl", None),
+    ("updated_at", datetime.fromisoformat),
+)
+
+
+def _row_values(row: dict, columns: tuple) -> list:
+    """Convert a row's columns into positional constructor arguments."""
+    return [convert(row[column]) if convert else row[column] for column, convert in columns]
 
-    if isinstance(obj, JsProxy):
-        # Check if it's array-like
-        if hasattr(obj, "to_py"):
-            return obj.to_py()
-        # Check if it's an object with properties
-        try:
-            return {k: js_to_python(getattr(obj, k)) for k in dir(obj) if not k.startswith("_")}
-        except Exception:
-            return str(obj)
-    return obj
+
+def _rows_changed(result: Any) -> int:
+    """Number of rows written by a run() statement, from its D1 result meta."""
+    meta = (js_to_python(result) or {}).get("meta") or {}
+    return meta.get("changes") or 0
 
 
 class D1Client:
     """Client for Cloudflare D1 SQLite database operations."""
 
+    # (assignment, is_delta) per update_daily_performance argument, in order
+    _PERFORMANCE_UPDATES = (
+        ("ending_balance = ?", False),
+        ("realized_pnl = realized_pnl + ?", True),
+        ("trades_opened = trades_opened + ?", True),
+        ("trades_closed = trades_closed + ?", True),
+        ("win_count = win_count + ?", True),
+        ("loss_count = loss_count + ?", True),
+    )
+    # UPDATE SQL by bitmask of supplied arguments, shared across clients
+    _performance_update_sql: dict[int, str] = {}
+
     def __init__(self, db_binding: Any):
         self.db = db_binding
+        self._stmt_cache: dict[str, Any] = {}
+
+    def _statement(self, query: str, params: list | None = None) -> Any:
+        """Get a statement for query, bound to params if given.
+
+        Prepared statements are cached by SQL text; bind() returns a new
+        statement, so the cached one is never mutated.
+        """
+        stmt = self._stmt_cache.get(query)
+        if stmt is None:
+            stmt = self._stmt_cache[query] = self.db.prepare(query)
+        return stmt.bind(*params) if params else stmt
 
     async def execute(self, query: str, params: list | None = None) -> Any:
         """Execute a query and return results."""
-        if params:
-            result = await self.db.prepare(query).bind(*params).all()
-        else:
-            result = await self.db.prepare(query).all()
+        result = await self._statement(query, params).all()
 
         # Convert the results to Python
         return js_to_python(result)
 
     async def run(self, query: str, params: list | None = None) -> Any:
         """Execute a query without returning results (INSERT, UPDATE, DELETE)."""
-        if params:
-            return await self.db.prepare(query).bind(*params).run()
-        return await self.db.prepare(query).run()
+        return await self._statement(query, params).run()
+
+    async def run_batch(self, statements: list[tuple[str, list | None]]) -> list:
+        """Execute write statements in one round-trip, atomically.
+
+        Args:
+            statements: (query, params) pairs, executed in order
+
+        Returns:
+            One result per statement
+        """
+        prepared = [self._statement(query, params) for query, params in statements]
+        return js_to_python(await self.db.batch(prepared)) or []
 
     # Recommendations
 
@@ -135,27 +256,7 @@ class D1Client:
         )
 
     def _row_to_recommendation(self, row: dict) -> Recommendation:
-        return Recommendation(
-            id=row["id"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            expires_at=datetime.fromisoformat(row["expires_at"]),
-            status=RecommendationStatus(row["status"]),
-            underlying=row["underlying"],
-            spread_type=SpreadType(row["spread_type"]),
-            short_strike=row["short_strike"],
-            long_strike=row["long_strike"],
-            expiration=row["expiration"],
-            credit=row["credit"],
-            max_loss=row["max_loss"],
-            iv_rank=row["iv_rank"],
-            delta=row["delta"],
-            theta=row["theta"],
-            thesis=row["thesis"],
-            confidence=Confidence(row["confidence"]) if row["confidence"] else None,
-            suggested_contracts=row["suggested_contracts"],
-            analysis_price=row["analysis_price"],
-            discord_message_id=row["discord_message_id"],
-        )
+        return Recommendation(*_row_values(row, _RECOMMENDATION_COLUMNS))
 
     # Trades
 
@@ -171,15 +272,18 @@ class D1Client:
         contracts: int,
         broker_order_id: str | None = None,
         status: TradeStatus = TradeStatus.OPEN,
+        recommendation_status: RecommendationStatus | None = None,
     ) -> str:
         """Create a new trade and return its ID.
 
         Args:
             status: Initial trade status. Use PENDING_FILL for auto-approved orders
                     that haven't been confirmed filled yet.
+            recommendation_status: If set, also update the recommendation to this
+                    status in the same batch as the insert.
         """
         trade_id = str(uuid4())
-        await self.run(
+        insert = (
             """
             INSERT INTO trades (
                 id, recommendation_id, opened_at, status, underlying, spread_type,
@@ -201,6 +305,18 @@ class D1Client:
                 broker_order_id,
             ],
         )
+        if recommendation_status is None:
+            await self.run(*insert)
+        else:
+            await self.run_batch(
+                [
+                    (
+                        "UPDATE recommendations SET status = ? WHERE id = ?",
+                        [recommendation_status.value, recommendation_id],
+                    ),
+                    insert,
+                ]
+            )
         return trade_id
 
     async def get_trade(self, trade_id: str) -> Trade | None:
@@ -251,50 +367,54 @@ class D1Client:
         exit_debit: float,
         reflection: str | None = None,
         lesson: str | None = None,
+        delete_position: bool = False,
     ) -> None:
-        """Close a trade with exit details."""
-        trade = await self.get_trade(trade_id)
-        if not trade:
-            raise ValueError(f"Trade {trade_id} not found")
+        """Close a trade with exit details.
 
-        profit_loss = (trade.entry_credit - exit_debit) * trade.contracts * 100
-        await self.run(
+        P/L is computed in SQL from the stored entry credit and contracts, so
+        the close is a single round-trip. With delete_position, the trade's
+        position snapshot is removed in the same batch; the DELETE only
+        matches once the trade is closed, so a missing trade keeps its rows.
+        """
+        update = (
             """
             UPDATE trades
-            SET status = 'closed', closed_at = ?, exit_debit = ?, profit_loss = ?,
+            SET status = 'closed', closed_at = ?, exit_debit = ?,
+                profit_loss = (entry_credit - ?) * contracts * 100,
                 reflection = ?, lesson = ?
             WHERE id = ?
             """,
             [
                 datetime.now().isoformat(),
                 exit_debit,
-                profit_loss,
+                exit_debit,
                 reflection,
                 lesson,
                 trade_id,
             ],
         )
+        if delete_position:
+            results = await self.run_batch(
+                [
+                    update,
+                    (
+                        """
+                        DELETE FROM positions
+                        WHERE trade_id = ?
+                          AND EXISTS (SELECT 1 FROM trades WHERE id = ? AND status = 'closed')
+                        """,
+                        [trade_id, trade_id],
+                    ),
+                ]
+            )
+            result = results[0] if results else None
+        else:
+            result = await self.run(*update)
+        if not _rows_changed(result):
+            raise ValueError(f"Trade {trade_id} not found")
 
     def _row_to_trade(self, row: dict) -> Trade:
-        return Trade(
-            id=row["id"],
-            recommendation_id=row["recommendation_id"],
-            opened_at=datetime.fromisoformat(row["opened_at"]) if row["opened_at"] else None,
-            closed_at=datetime.fromisoformat(row["closed_at"]) if row["closed_at"] else None,
-            status=TradeStatus(row["status"]),
-            underlying=row["underlying"],
-            spread_type=SpreadType(row["spread_type"]),
-            short_strike=row["short_strike"],
-            long_strike=row["long_strike"],
-            expiration=row["expiration"],
-            entry_credit=row["entry_credit"],
-            exit_debit=row["exit_debit"],
-            profit_loss=row["profit_loss"],
-            contracts=row["contracts"],
-            broker_order_id=row["broker_order_id"],
-            reflection=row["reflection"],
-            lesson=row["lesson"],
-        )
+        return Trade(*_row_values(row, _TRADE_COLUMNS))
 
     # Positions
 
@@ -309,30 +429,25 @@ class D1Client:
         current_value: float,
         unrealized_pnl: float,
     ) -> str:
-        """Create or update a position snapshot."""
-        existing = await self.execute("SELECT id FROM positions WHERE trade_id = ?", [trade_id])
-        if existing["results"]:
-            pos_id = existing["results"][0]["id"]
-            await self.run(
-                """
-                UPDATE positions
-                SET current_value = ?, unrealized_pnl = ?, updated_at = ?
-                WHERE id = ?
-                """,
-                [current_value, unrealized_pnl, datetime.now().isoformat(), pos_id],
-            )
-            return pos_id
+        """Create or update a position snapshot, returning its ID.
 
-        pos_id = str(uuid4())
-        await self.run(
+        A single upsert keyed on the unique trade_id; an existing snapshot keeps
+        its ID and only its value fields change.
+        """
+        result = await self.execute(
             """
             INSERT INTO positions (
                 id, trade_id, underlying, short_strike, long_strike, expiration,
-                contracts, current_value, unrealized_pnl
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                contracts, current_value, unrealized_pnl, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(trade_id) DO UPDATE SET
+                current_value = excluded.current_value,
+                unrealized_pnl = excluded.unrealized_pnl,
+                updated_at = excluded.updated_at
+            RETURNING id
             """,
             [
-                pos_id,
+                str(uuid4()),
                 trade_id,
                 underlying,
                 short_strike,
@@ -341,9 +456,10 @@ class D1Client:
                 contracts,
                 current_value,
                 unrealized_pnl,
+                datetime.now().isoformat(),
             ],
         )
-        return pos_id
+        return result["results"][0]["id"]
 
     async def delete_position(self, trade_id: str) -> None:
         """Delete position for a closed trade."""
@@ -355,42 +471,32 @@ class D1Client:
         return [self._row_to_position(row) for row in result["results"]]
 
     def _row_to_position(self, row: dict) -> Position:
-        return Position(
-            id=row["id"],
-            trade_id=row["trade_id"],
-            underlying=row["underlying"],
-            short_strike=row["short_strike"],
-            long_strike=row["long_strike"],
-            expiration=row["expiration"],
-            contracts=row["contracts"],
-            current_value=row["current_value"],
-            unrealized_pnl=row["unrealized_pnl"],
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-        )
+        return Position(*_row_values(row, _POSITION_COLUMNS))
 
     # Daily Performance
 
     async def get_or_create_daily_performance(
         self, date: str, starting_balance: float
     ) -> DailyPerformance:
-        """Get or create daily performance record."""
-        result = await self.execute("SELECT * FROM daily_performance WHERE date = ?", [date])
-        if result["results"]:
-            return self._row_to_daily_performance(result["results"][0])
+        """Get or create daily performance record.
 
-        await self.run(
-            """
-            INSERT INTO daily_performance (date, starting_balance, ending_balance, realized_pnl)
-            VALUES (?, ?, ?, 0)
-            """,
-            [date, starting_balance, starting_balance],
-        )
-        return DailyPerformance(
-            date=date,
-            starting_balance=starting_balance,
-            ending_balance=starting_balance,
-            realized_pnl=0,
+        The insert-if-missing and the read go out as one batch, so this is a
+        single round-trip whether or not the row existed.
+        """
+        _, selected = await self.run_batch(
+            [
+                (
+                    """
+                    INSERT OR IGNORE INTO daily_performance
+                        (date, starting_balance, ending_balance, realized_pnl)
+                    VALUES (?, ?, ?, 0)
+                    """,
+                    [date, starting_balance, starting_balance],
+                ),
+                ("SELECT * FROM daily_performance WHERE date = ?", [date]),
+            ]
         )
+        return self._row_to_daily_performance(selected["results"][0])
 
     async def update_daily_performance(
         self,
@@ -403,34 +509,40 @@ class D1Client:
         loss_delta: int = 0,
     ) -> None:
         """Update daily performance metrics."""
-        updates = []
+        values = (
+            ending_balance,
+            realized_pnl_delta,
+            trades_opened_delta,
+            trades_closed_delta,
+            win_delta,
+            loss_delta,
+        )
+        # ending_balance is set when given (even 0); deltas only when non-zero
+        mask = 0
         params = []
-
-        if ending_balance is not None:
-            updates.append("ending_balance = ?")
-            params.append(ending_balance)
-        if realized_pnl_delta:
-            updates.append("realized_pnl = realized_pnl + ?")
-            params.append(realized_pnl_delta)
-        if trades_opened_delta:
-            updates.append("trades_opened = trades_opened + ?")
-            params.append(trades_opened_delta)
-        if trades_closed_delta:
-            updates.append("trades_closed = trades_closed + ?")
-            params.append(trades_closed_delta)
-        if win_delta:
-            updates.append("win_count = win_count + ?")
-            params.append(win_delta)
-        if loss_delta:
-            updates.append("loss_count = loss_count + ?")
-            params.append(loss_delta)
-
-        if updates:
-            params.append(date)
-            await self.run(
-                f"UPDATE daily_performance SET {', '.join(updates)} WHERE date = ?",
-                params,
+        for bit, (value, (_, is_delta)) in enumerate(
+            zip(values, self._PERFORMANCE_UPDATES, strict=True)
+        ):
+            supplied = bool(value) if is_delta else value is not None
+            if supplied:
+                mask |= 1 << bit
+                params.append(value)
+
+        if not mask:
+            return
+
+        query = self._performance_update_sql.get(mask)
+        if query is None:
+            assignments = ", ".join(
+                assignment
+                for bit, (assignment, _) in enumerate(self._PERFORMANCE_UPDATES)
+                if mask & (1 << bit)
             )
+            query = f"UPDATE daily_performance SET {assignments} WHERE date = ?"
+            self._performance_update_sql[mask] = query
+
+        params.append(date)
+        await self.run(query, params)
 
     def _row_to_daily_performance(self, row: dict) -> DailyPerformance:
         return DailyPerformance(
@@ -455,8 +567,6 @@ class D1Client:
         self, rule: str, source: str = "learned", supporting_trade_ids: list[str] | None = None
     ) -> str:
         """Add a new playbook rule."""
-        import json
-
         rule_id = str(uuid4())
         await self.run(
             "INSERT INTO playbook (id, rule, source, supporting_trade_ids) VALUES (?, ?, ?, ?)",
@@ -465,8 +575,6 @@ class D1Client:
         return rule_id
 
     def _row_to_playbook_rule(self, row: dict) -> PlaybookRule:
-        import json
-
         return PlaybookRule(
             id=row["id"],
             rule=row["rule"],
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Any
 
+from core.cache import TTLCache
 from core.types import CircuitBreakerStatus
 
 
@@ -16,8 +19,12 @@ class KVClient:
     WEEKLY_KEY_PREFIX = "weekly:"
     RATE_LIMIT_PREFIX = "rate_limit:"
 
+    # Seconds a read of the circuit breaker is reused before KV is consulted again
+    CIRCUIT_BREAKER_CACHE_TTL = 5
+
     def __init__(self, kv_binding: Any):
         self.kv = kv_binding
+        self._cb_cache = TTLCache(maxsize=1, ttl=self.CIRCUIT_BREAKER_CACHE_TTL)
 
     async def get(self, key: str) -> str | None:
         """Get a value from KV."""
@@ -48,39 +55,56 @@ class KVClient:
     # Circuit Breaker
 
     async def get_circuit_breaker(self) -> CircuitBreakerStatus:
-        """Get current circuit breaker status."""
+        """Get current circuit breaker status.
+
+        Reads are cached for CIRCUIT_BREAKER_CACHE_TTL seconds; trips and
+        resets through this client update the cache immediately.
+        """
+        status = self._cb_cache.get(self.CIRCUIT_BREAKER_KEY)
+        if status is not None:
+            return status
+
         data = await self.get_json(self.CIRCUIT_BREAKER_KEY)
         if not data:
-            return CircuitBreakerStatus.active()
-
-        return CircuitBreakerStatus(
-            halted=data.get("halted", False),
-            reason=data.get("reason"),
-            triggered_at=datetime.fromisoformat(data["triggered_at"])
-            if data.get("triggered_at")
-            else None,
-        )
+            status = CircuitBreakerStatus.active()
+        else:
+            status = CircuitBreakerStatus(
+                halted=data.get("halted", False),
+                reason=data.get("reason"),
+                triggered_at=datetime.fromisoformat(data["triggered_at"])
+                if data.get("triggered_at")
+                else None,
+            )
+
+        self._cb_cache.set(self.CIRCUIT_BREAKER_KEY, status)
+        return status
 
     async def trip_circuit_breaker(self, reason: str) -> None:
         """Trip the circuit breaker."""
+        triggered_at = datetime.now()
         await self.put_json(
             self.CIRCUIT_BREAKER_KEY,
             {
                 "halted": True,
                 "reason": reason,
-                "triggered_at": datetime.now().isoformat(),
+                "triggered_at": triggered_at.isoformat(),
             },
         )
+        self._cb_cache.set(
+            self.CIRCUIT_BREAKER_KEY,
+            CircuitBreakerStatus(halted=True, reason=reason, triggered_at=triggered_at),
+        )
 
     async def reset_circuit_breaker(self) -> None:
         """Reset the circuit breaker."""
         await self.put_json(self.CIRCUIT_BREAKER_KEY, {"halted": False})
+        self._cb_cache.set(self.CIRCUIT_BREAKER_KEY, CircuitBreakerStatus.active())
 
     # Daily Limits
 
     def _daily_key(self, date: str | None = None) -> str:
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = datetime.now().date().isoformat()
         return f"{self.DAILY_KEY_PREFIX}{date}"
 
     async def get_daily_stats(self, date: str | None = None) -> dict:
@@ -94,6 +118,14 @@ class KVClient:
             "rapid_loss_amount": 0.0,
         }
 
+    async def get_trading_state(self, date: str | None = None) -> tuple[CircuitBreakerStatus, dict]:
+        """Get circuit breaker status and daily stats in one concurrent read."""
+        status, stats = await asyncio.gather(
+            self.get_circuit_breaker(),
+            self.get_daily_stats(date),
+        )
+        return status, stats
+
     async def update_daily_stats(
         self,
         trades_delta: int = 0,
@@ -207,64 +239,38 @@ class KVClient:
 
     # Rate Limiting
 
+    def _window_key(self, name: str, window_seconds: int) -> tuple[str, int]:
+        """Get the counter key for the current fixed window and its remaining TTL."""
+        now = int(time.time())
+        bucket = now // window_seconds
+        remaining = window_seconds - (now - bucket * window_seconds)
+        # KV rejects TTLs under 60s; a key outliving its window is harmless
+        # because the next window uses a new key
+        return f"{self.RATE_LIMIT_PREFIX}{name}:{bucket}", max(remaining, 60)
+
+    async def _window_count(self, key: str) -> int:
+        value = await self.get(key)
+        return int(value) if value else 0
+
     async def check_rate_limit(
         self, service: str, max_requests: int, window_seconds: int = 3600
     ) -> bool:
-        """Check if rate limit is exceeded. Returns True if OK to proceed."""
-        key = f"{self.RATE_LIMIT_PREFIX}{service}"
-        data = await self.get_json(key)
-
-        now = datetime.now()
-        if not data:
-            await self.put_json(
-                key,
-                {"count": 1, "window_start": now.isoformat()},
-                expiration_ttl=window_seconds,
-            )
-            return True
-
-        window_start = datetime.fromisoformat(data["window_start"])
-        if now - window_start > timedelta(seconds=window_seconds):
-            # Window expired, reset
-            await self.put_json(
-                key,
-                {"count": 1, "window_start": now.isoformat()},
-                expiration_ttl=window_seconds,
-            )
-            return True
+        """Check if rate limit is exceeded. Returns True if OK to proceed.
 
-        if data["count"] >= max_requests:
+        Counts live in one key per fixed window, so nothing needs resetting:
+        a new window is a new key and old ones expire.
+        """
+        key, ttl = self._window_key(service, window_seconds)
+        count = await self._window_count(key)
+        if count >= max_requests:
             return False
 
-        data["count"] += 1
-        remaining_ttl = window_seconds - int((now - window_start).total_seconds())
-        await self.put_json(key, data, expiration_ttl=max(remaining_ttl, 1))
+        await self.put(key, str(count + 1), expiration_ttl=ttl)
         return True
 
     async def increment_error_count(self, window_seconds: int = 60) -> int:
         """Increment API error count and return current count."""
-        key = f"{self.RATE_LIMIT_PREFIX}errors"
-        data = await self.get_json(key)
-
-        now = datetime.now()
-        if not data:
-            await self.put_json(
-                key,
-                {"count": 1, "window_start": now.isoformat()},
-                expiration_ttl=window_seconds,
-            )
-            return 1
-
-        window_start = datetime.fromisoformat(data["window_start"])
-        if now - window_start > timedelta(seconds=window_seconds):
-            await self.put_json(
-                key,
-                {"count": 1, "window_start": now.isoformat()},
-                expiration_ttl=window_seconds,
-            )
-            return 1
-
-        data["count"] += 1
-        remaining_ttl = window_seconds - int((now - window_start).total_seconds())
-        await self.put_json(key, data, expiration_ttl=max(remaining_ttl, 1))
-        return data["count"]
+        key, ttl = self._window_key("errors", window_seconds)
+        count = await self._window_count(key) + 1
+        await self.put(key, str(count), expiration_ttl=ttl)
+        return count
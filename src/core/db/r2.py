@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
@@ -8,32 +11,50 @@ from typing import Any
 class R2Client:
     """Client for Cloudflare R2 object storage (archival)."""
 
+    # Workers allows 6 simultaneous open connections per invocation
+    MAX_CONCURRENT_WRITES = 6
+
     def __init__(self, r2_binding: Any):
         self.r2 = r2_binding
 
     async def put(
-        self, key: str, data: bytes, content_type: str = "application/octet-stream"
+        self,
+        key: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
     ) -> None:
         """Store an object in R2."""
-        await self.r2.put(key, data, {"httpMetadata": {"contentType": content_type}})
+        http_metadata = {"contentType": content_type}
+        if content_encoding:
+            http_metadata["contentEncoding"] = content_encoding
+        await self.r2.put(key, data, {"httpMetadata": http_metadata})
 
     async def put_json(self, key: str, data: dict) -> None:
-        """Store JSON data in R2."""
-        await self.put(key, json.dumps(data).encode(), "application/json")
+        """Store JSON data in R2, gzip-compressed."""
+        body = gzip.compress(json.dumps(data).encode(), compresslevel=6)
+        await self.put(key, body, "application/json", "gzip")
 
     async def get(self, key: str) -> bytes | None:
         """Get an object from R2."""
         obj = await self.r2.get(key)
         if obj is None:
             return None
-        return await obj.arrayBuffer()
+        return (await obj.arrayBuffer()).to_bytes()
 
     async def get_json(self, key: str) -> dict | None:
-        """Get JSON data from R2."""
-        data = await self.get(key)
-        if data is None:
+        """Get JSON data from R2, decompressing gzip-encoded objects."""
+        obj = await self.r2.get(key)
+        if obj is None:
             return None
-        return json.loads(data.decode())
+
+        http_metadata = getattr(obj, "httpMetadata", None)
+        if getattr(http_metadata, "contentEncoding", None) == "gzip":
+            data = gzip.decompress((await obj.arrayBuffer()).to_bytes())
+        else:
+            # Uncompressed objects decode on the JS side, skipping a bytes copy
+            data = await obj.text()
+        return json.loads(data)
 
     async def delete(self, key: str) -> None:
         """Delete an object from R2."""
@@ -44,6 +65,17 @@ class R2Client:
         result = await self.r2.list({"prefix": prefix, "limit": limit})
         return [obj.key for obj in result.objects]
 
+    async def iter_keys(self, prefix: str = "", page_size: int = 1000) -> AsyncIterator[str]:
+        """Yield every key under a prefix, following list cursors page by page."""
+        options = {"prefix": prefix, "limit": page_size}
+        while True:
+            result = await self.r2.list(options)
+            for obj in result.objects:
+                yield obj.key
+            if not result.truncated:
+                return
+            options = {**options, "cursor": result.cursor}
+
     # Archive helpers
 
     def _options_chain_key(self, symbol: str, date: str) -> str:
@@ -54,7 +86,7 @@ class R2Client:
     ) -> str:
         """Archive options chain data for a symbol."""
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = datetime.now().date().isoformat()
         key = self._options_chain_key(symbol, date)
         await self.put_json(
             key,
@@ -67,6 +99,28 @@ class R2Client:
         )
         return key
 
+    async def archive_options_chains(
+        self,
+        chains: dict[str, dict],
+        date: str | None = None,
+        max_concurrent_writes: int | None = None,
+    ) -> list[str]:
+        """Archive options chains for several symbols concurrently.
+
+        Returns the archived keys in the order of chains.
+        """
+        if date is None:
+            date = datetime.now().date().isoformat()
+        semaphore = asyncio.Semaphore(max_concurrent_writes or self.MAX_CONCURRENT_WRITES)
+
+        async def archive(symbol: str, chain_data: dict) -> str:
+            async with semaphore:
+                return await self.archive_options_chain(symbol, chain_data, date)
+
+        return list(
+            await asyncio.gather(*(archive(symbol, data) for symbol, data in chains.items()))
+        )
+
     async def get_archived_options_chain(self, symbol: str, date: str) -> dict | None:
         """Get archived options chain data."""
         return await self.get_json(self._options_chain_key(symbol, date))
@@ -1,20 +1,47 @@
-from __future__ import annotations
-
 """HTTP client wrapper for Cloudflare Workers Python.
 
 Uses the JavaScript fetch API via Pyodide interop.
 """
 
+from __future__ import annotations
+
 import json
+from typing import Any
+from urllib.parse import urlencode
 
 from js import Headers, Object, fetch
 from pyodide.ffi import to_js
 
+# Error bodies beyond this are truncated in HttpError messages
+MAX_ERROR_BODY_CHARS = 2048
+
+
+class HttpError(Exception):
+    """Non-2xx HTTP response."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+def build_headers(headers: dict | None = None):
+    """Build a JS Headers object.
+
+    Clients with fixed headers can build this once and pass it to request()
+    instead of a dict; fetch copies it, so one object can be shared.
+    """
+    js_headers = Headers.new()
+    if headers:
+        for key, value in headers.items():
+            js_headers.append(key, value)
+    return js_headers
+
 
 async def request(
     method: str,
     url: str,
-    headers: dict | None = None,
+    headers: Any = None,
     params: dict | None = None,
     json_data: dict | None = None,
     timeout: float = 30.0,
@@ -24,7 +51,7 @@ async def request(
     Args:
         method: HTTP method (GET, POST, PUT, DELETE, etc.)
         url: Full URL to request
-        headers: Optional headers dict
+        headers: Optional headers dict, or a prebuilt build_headers() object
         params: Optional query parameters
         json_data: Optional JSON body
         timeout: Request timeout in seconds (not fully supported in Workers)
@@ -33,18 +60,17 @@ async def request(
         Parsed JSON response as dict
 
     Raises:
-        Exception: On HTTP errors or network failures
+        HttpError: On non-2xx responses
+        Exception: On network failures
     """
     # Build URL with query params
     if params:
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        url = f"{url}?{query_string}"
+        url = f"{url}?{urlencode(params, safe=',')}"
 
-    # Build headers
-    js_headers = Headers.new()
-    if headers:
-        for key, value in headers.items():
-            js_headers.append(key, value)
+    # Build headers (unless the caller passed a prebuilt Headers object)
+    js_headers = headers
+    if headers is None or isinstance(headers, dict):
+        js_headers = build_headers(headers)
 
     # Build fetch options
     options = {
@@ -64,10 +90,10 @@ async def request(
     # Check for errors
     if not response.ok:
         text = await response.text()
-        raise Exception(f"HTTP {response.status}: {text}")
+        raise HttpError(response.status, text[:MAX_ERROR_BODY_CHARS])
 
-    # Handle empty responses
-    if response.status == 204:
+    # Handle empty responses without reading the body
+    if response.status == 204 or response.headers.get("content-length") == "0":
         return {}
 
     # Parse JSON response
@@ -1,11 +1,25 @@
-from __future__ import annotations
-
 """Discord client for notifications with interactive buttons."""
 
+from __future__ import annotations
+
+from functools import lru_cache
 from typing import Any
 
 from core import http
-from core.types import DailyPerformance, Recommendation, Trade
+from core.types import DailyPerformance, Recommendation, SpreadType, Trade
+
+# Recommendation embed color by confidence level
+_CONFIDENCE_COLORS = {
+    "low": 0xFEE75C,  # Yellow
+    "medium": 0xF97316,  # Orange
+    "high": 0x57F287,  # Green
+}
+
+# (strategy name, direction) by spread type
+_SPREAD_LABELS = {
+    SpreadType.BULL_PUT: ("Bull Put Spread", "Bullish"),
+    SpreadType.BEAR_CALL: ("Bear Call Spread", "Bearish"),
+}
 
 
 class DiscordError(Exception):
@@ -14,37 +28,55 @@ class DiscordError(Exception):
     pass
 
 
-async def verify_ed25519_signature(public_key_hex: str, message: bytes, signature_hex: str) -> bool:
-    """Verify Ed25519 signature using JavaScript SubtleCrypto."""
-    try:
-        from js import Object, Uint8Array, crypto
+def _to_uint8_array(data: bytes):
+    """Copy bytes into a JS Uint8Array with a single buffer assignment."""
+    from js import Uint8Array
+
+    array = Uint8Array.new(len(data))
+    array.assign(data)
+    return array
+
+
+# Imported Ed25519 CryptoKeys by public key hex, reused for the isolate's lifetime
+_ED25519_KEYS: dict[str, Any] = {}
+
+
+@lru_cache(maxsize=1)
+def _ed25519_algorithm():
+    """Build the SubtleCrypto Ed25519 algorithm object once per isolate."""
+    from js import Object
+    from pyodide.ffi import to_js
+
+    return Object.fromEntries(to_js([["name", "Ed25519"]]))
+
+
+async def _get_ed25519_key(public_key_hex: str):
+    """Import an Ed25519 public key, or return the already-imported CryptoKey."""
+    key = _ED25519_KEYS.get(public_key_hex)
+    if key is None:
+        from js import crypto
         from pyodide.ffi import to_js
 
-        print(
-            f"Verifying signature: pk_len={len(public_key_hex)}, sig_len={len(signature_hex)}, msg_len={len(message)}"
+        pk_array = _to_uint8_array(bytes.fromhex(public_key_hex))
+        key = await crypto.subtle.importKey(
+            "raw", pk_array, _ed25519_algorithm(), False, to_js(["verify"])
         )
+        _ED25519_KEYS[public_key_hex] = key
+    return key
 
-        # Convert hex to bytes
-        public_key_bytes = bytes.fromhex(public_key_hex)
-        signature_bytes = bytes.fromhex(signature_hex)
-
-        print(f"Converted: pk_bytes={len(public_key_bytes)}, sig_bytes={len(signature_bytes)}")
 
-        # Create Uint8Arrays from the bytes
-        pk_array = Uint8Array.new(to_js(list(public_key_bytes)))
-        sig_array = Uint8Array.new(to_js(list(signature_bytes)))
-        msg_array = Uint8Array.new(to_js(list(message)))
+async def verify_ed25519_signature(public_key_hex: str, message: bytes, signature_hex: str) -> bool:
+    """Verify Ed25519 signature using JavaScript SubtleCrypto."""
+    try:
+        from js import crypto
 
-        # Import the Ed25519 public key - convert dict to JS object via Object.fromEntries
-        algorithm = Object.fromEntries(to_js([["name", "Ed25519"]]))
-        print(f"Algorithm object: {algorithm}")
+        key = await _get_ed25519_key(public_key_hex)
 
-        key = await crypto.subtle.importKey("raw", pk_array, algorithm, False, to_js(["verify"]))
-        print(f"Key imported successfully")
+        # Create Uint8Arrays from the bytes
+        sig_array = _to_uint8_array(bytes.fromhex(signature_hex))
+        msg_array = _to_uint8_array(message)
 
-        # Verify the signature
-        result = await crypto.subtle.verify(algorithm, key, sig_array, msg_array)
-        print(f"Verification result: {result}")
+        result = await crypto.subtle.verify(_ed25519_algorithm(), key, sig_array, msg_array)
         return bool(result)
     except Exception as e:
         import traceback
@@ -68,14 +100,17 @@ class DiscordClient:
             "Authorization": f"Bot {bot_token}",
             "Content-Type": "application/json",
         }
+        # Built once and reused for every request
+        self._fetch_headers = http.build_headers(self._headers)
+        self._interaction_headers = http.build_headers({"Content-Type": "application/json"})
 
     async def _request(self, method: str, endpoint: str, data: dict | None = None) -> dict:
         """Make a request to Discord API."""
         try:
             url = f"{self.BASE_URL}{endpoint}"
-            return await http.request(method, url, headers=self._headers, json_data=data)
+            return await http.request(method, url, headers=self._fetch_headers, json_data=data)
         except Exception as e:
-            raise DiscordError(f"Discord API error: {str(e)}")
+            raise DiscordError(f"Discord API error: {e}") from e
 
     async def verify_signature(self, body: str, timestamp: str, signature: str) -> bool:
         """Verify Discord interaction signature using Ed25519."""
@@ -104,6 +139,22 @@ class DiscordClient:
         )
         return result["id"]
 
+    async def send_many(self, messages: list[dict]) -> list[str | Exception]:
+        """Send several messages one after another, in order.
+
+        Each entry holds send_message() arguments. Sends are sequential so the
+        messages appear in the channel in list order. Returns message IDs in
+        the same order; a failed send yields its exception instead of raising,
+        so one failure does not drop the others.
+        """
+        results: list[str | Exception] = []
+        for message in messages:
+            try:
+                results.append(await self.send_message(**message))
+            except Exception as e:
+                results.append(e)
+        return results
+
     async def update_message(
         self,
         message_id: str,
@@ -150,61 +201,49 @@ class DiscordClient:
         # Interaction responses use a different endpoint (no auth needed)
         url = f"{self.BASE_URL}/interactions/{interaction_id}/{interaction_token}/callback"
         try:
-            await http.request(
-                "POST", url, headers={"Content-Type": "application/json"}, json_data=data
-            )
+            await http.request("POST", url, headers=self._interaction_headers, json_data=data)
         except Exception as e:
-            raise DiscordError(f"Discord interaction error: {str(e)}")
+            raise DiscordError(f"Discord interaction error: {e}") from e
 
     # Trade recommendation
 
     async def send_recommendation(self, rec: Recommendation) -> str:
         """Send a trade recommendation with approve/reject buttons."""
-        spread_name = (
-            "Bull Put Spread" if rec.spread_type.value == "bull_put" else "Bear Call Spread"
-        )
-        direction = "Bullish" if rec.spread_type.value == "bull_put" else "Bearish"
-
-        confidence_color = {
-            "low": 0xFEE75C,  # Yellow
-            "medium": 0xF97316,  # Orange
-            "high": 0x57F287,  # Green
-        }
-        color = confidence_color.get(rec.confidence.value if rec.confidence else "low", 0x5865F2)
+        spread_name, direction = _SPREAD_LABELS[rec.spread_type]
+        color = _CONFIDENCE_COLORS.get(rec.confidence.value if rec.confidence else "low", 0x5865F2)
+
+        fields = [
+            {"name": "Strategy", "value": spread_name, "inline": True},
+            {"name": "Direction", "value": direction, "inline": True},
+            {"name": "Expiration", "value": rec.expiration, "inline": True},
+            {"name": "Short Strike", "value": f"${rec.short_strike:.2f}", "inline": True},
+            {"name": "Long Strike", "value": f"${rec.long_strike:.2f}", "inline": True},
+            {"name": "Credit", "value": f"${rec.credit:.2f}", "inline": True},
+        ]
+        if rec.iv_rank:
+            fields.append({"name": "IV Rank", "value": f"{rec.iv_rank:.1f}%", "inline": True})
+        if rec.delta:
+            fields.append({"name": "Delta", "value": f"{rec.delta:.3f}", "inline": True})
+        fields += [
+            {"name": "Max Loss", "value": f"${rec.max_loss:.2f}", "inline": True},
+            {"name": "Contracts", "value": str(rec.suggested_contracts or 1), "inline": True},
+            {
+                "name": "Confidence",
+                "value": (rec.confidence.value.upper() if rec.confidence else "N/A"),
+                "inline": True,
+            },
+        ]
 
         embed = {
             "title": f"Trade Recommendation: {rec.underlying}",
             "description": rec.thesis if rec.thesis else "No analysis provided",
             "color": color,
-            "fields": [
-                {"name": "Strategy", "value": spread_name, "inline": True},
-                {"name": "Direction", "value": direction, "inline": True},
-                {"name": "Expiration", "value": rec.expiration, "inline": True},
-                {"name": "Short Strike", "value": f"${rec.short_strike:.2f}", "inline": True},
-                {"name": "Long Strike", "value": f"${rec.long_strike:.2f}", "inline": True},
-                {"name": "Credit", "value": f"${rec.credit:.2f}", "inline": True},
-                {"name": "Max Loss", "value": f"${rec.max_loss:.2f}", "inline": True},
-                {"name": "Contracts", "value": str(rec.suggested_contracts or 1), "inline": True},
-                {
-                    "name": "Confidence",
-                    "value": (rec.confidence.value.upper() if rec.confidence else "N/A"),
-                    "inline": True,
-                },
-            ],
+            "fields": fields,
             "footer": {
                 "text": f"Expires: {rec.expires_at.strftime('%H:%M:%S')} | ID: {rec.id[:8]}",
             },
         }
 
-        if rec.iv_rank:
-            embed["fields"].insert(
-                6, {"name": "IV Rank", "value": f"{rec.iv_rank:.1f}%", "inline": True}
-            )
-        if rec.delta:
-            embed["fields"].insert(
-                7, {"name": "Delta", "value": f"{rec.delta:.3f}", "inline": True}
-            )
-
         components = [
             {
                 "type": 1,  # Action Row
@@ -238,7 +277,7 @@ class DiscordClient:
         order_id: str,
     ) -> None:
         """Update recommendation message to show approved status."""
-        spread_name = rec.spread_type.value.replace("_", " ").title()
+        spread_name = rec.spread_type.display_name
 
         embed = {
             "title": f"Trade Approved: {rec.underlying}",
@@ -335,13 +374,13 @@ class DiscordClient:
 
     # Daily summary
 
-    async def send_daily_summary(
+    def daily_summary_message(
         self,
         performance: DailyPerformance,
         open_positions: int,
         trade_stats: dict,
-    ) -> str:
-        """Send end-of-day summary."""
+    ) -> dict:
+        """Build the end-of-day summary as send_message() arguments."""
         pnl_color = 0x57F287 if performance.realized_pnl >= 0 else 0xED4245
 
         embed = {
@@ -375,10 +414,10 @@ class DiscordClient:
             },
         }
 
-        return await self.send_message(
-            content=f"**Daily Summary: {performance.date}**",
-            embeds=[embed],
-        )
+        return {
+            "content": f"**Daily Summary: {performance.date}**",
+            "embeds": [embed],
+        }
 
     # Circuit breaker
 
@@ -405,7 +444,7 @@ class DiscordClient:
             "fields": [
                 {
                     "name": "Strategy",
-                    "value": trade.spread_type.value.replace("_", " ").title(),
+                    "value": trade.spread_type.display_name,
                     "inline": True,
                 },
                 {"name": "Expiration", "value": trade.expiration, "inline": True},
@@ -548,8 +587,8 @@ class DiscordClient:
 
     # AI Calibration alerts
 
-    async def send_calibration_alert(self, calibration_data: dict) -> str:
-        """Send AI confidence calibration alert when calibration gap exceeds threshold."""
+    def calibration_alert_message(self, calibration_data: dict) -> dict | None:
+        """Build the calibration alert as send_message() arguments, or None if calibrated."""
         fields = []
         issues = []
 
@@ -567,7 +606,7 @@ class DiscordClient:
                 })
 
         if not issues:
-            return ""  # No alert needed
+            return None
 
         embed = {
             "title": "AI Confidence Calibration Alert",
@@ -576,13 +615,13 @@ class DiscordClient:
             "fields": fields,
         }
 
-        return await self.send_message(
-            content="**AI Calibration Issue Detected**",
-            embeds=[embed],
-        )
+        return {
+            "content": "**AI Calibration Issue Detected**",
+            "embeds": [embed],
+        }
 
-    async def send_calibration_summary(self, calibration_data: dict, stats: dict) -> str:
-        """Send weekly calibration summary."""
+    def calibration_summary_message(self, calibration_data: dict, stats: dict) -> dict:
+        """Build the weekly calibration summary as send_message() arguments."""
         fields = []
 
         for confidence in ["high", "medium", "low"]:
@@ -608,7 +647,7 @@ class DiscordClient:
             },
         }
 
-        return await self.send_message(
-            content="**Weekly AI Calibration Report**",
-            embeds=[embed],
-        )
+        return {
+            "content": "**Weekly AI Calibration Report**",
+            "embeds": [embed],
+        }
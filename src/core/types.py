@@ -10,6 +10,14 @@ class SpreadType(str, Enum):
     BULL_PUT = "bull_put"
     BEAR_CALL = "bear_call"
 
+    @property
+    def display_name(self) -> str:
+        """Title-cased name for messages, e.g. "Bull Put"."""
+        return _SPREAD_DISPLAY_NAMES[self]
+
+
+_SPREAD_DISPLAY_NAMES = {t: t.value.replace("_", " ").title() for t in SpreadType}
+
 
 class RecommendationStatus(str, Enum):
     PENDING = "pending"
@@ -32,7 +40,7 @@ class Confidence(str, Enum):
     HIGH = "high"
 
 
-@dataclass
+@dataclass(slots=True)
 class Greeks:
     delta: float
     gamma: float
@@ -40,7 +48,7 @@ class Greeks:
     vega: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionContract:
     symbol: str
     underlying: str
@@ -56,7 +64,7 @@ class OptionContract:
     greeks: Greeks | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditSpread:
     underlying: str
     spread_type: SpreadType
@@ -85,7 +93,7 @@ class CreditSpread:
         return self.credit * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class Recommendation:
     id: str
     created_at: datetime
@@ -113,7 +121,7 @@ class Recommendation:
     discord_message_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     id: str
     recommendation_id: str | None
@@ -139,7 +147,7 @@ class Trade:
     lesson: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     id: str
     trade_id: str
@@ -156,7 +164,7 @@ class Position:
     updated_at: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyPerformance:
     date: str
     starting_balance: float
@@ -168,7 +176,7 @@ class DailyPerformance:
     loss_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaybookRule:
     id: str
     rule: str
@@ -177,7 +185,7 @@ class PlaybookRule:
     created_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreakerStatus:
     halted: bool
     reason: str | None = None
@@ -192,7 +200,7 @@ class CircuitBreakerStatus:
         return cls(halted=True, reason=reason, triggered_at=datetime.now())
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountInfo:
     equity: float
     cash: float
@@ -208,7 +216,7 @@ class AssetClass(str, Enum):
     COMMODITY = "commodity"  # GLD - low/variable correlation
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioGreeks:
     """Aggregate portfolio Greeks (beta-weighted to SPY)."""
 
@@ -3,6 +3,7 @@
 Routes incoming requests (HTTP and cron) to appropriate handlers.
 """
 
+import asyncio
 from datetime import datetime
 
 from workers import Response
@@ -41,8 +42,10 @@ async def on_fetch(request, env):
                 secret_key=env.ALPACA_SECRET_KEY,
                 paper=(env.ENVIRONMENT == "paper"),
             )
-            account = await alpaca.get_account()
-            market_open = await alpaca.is_market_open()
+            account, market_open = await asyncio.gather(
+                alpaca.get_account(),
+                alpaca.is_market_open(),
+            )
             return Response(
                 json.dumps(
                     {
@@ -4,6 +4,7 @@ Final scan before market close. More conservative - only very high
 probability setups with excellent IV conditions.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 from core import http
@@ -68,8 +69,10 @@ async def _run_afternoon_scan(env):
         print("Market is closed, skipping afternoon scan")
         return
 
-    account = await alpaca.get_account()
-    positions = await db.get_all_positions()
+    account, positions = await asyncio.gather(
+        alpaca.get_account(),
+        db.get_all_positions(),
+    )
 
     sizer = PositionSizer()
     heat = sizer.calculate_portfolio_heat(positions, account.equity)
@@ -100,11 +103,7 @@ async def _run_afternoon_scan(env):
             if not chain.contracts:
                 continue
 
-            atm = [
-                c
-                for c in chain.contracts
-                if abs(c.strike - chain.underlying_price) < chain.underlying_price * 0.02
-            ]
+            atm = chain.get_atm_contracts()
             current_iv = atm[0].implied_volatility if atm and atm[0].implied_volatility else 0.20
             iv_metrics = calculate_iv_metrics(current_iv, [current_iv * 0.8, current_iv * 1.2])
 
@@ -153,10 +153,7 @@ async def handle_approve(
 
         order = await alpaca.place_spread_order(spread_order)
 
-        # Update recommendation status
-        await db.update_recommendation_status(rec_id, RecommendationStatus.APPROVED)
-
-        # Create trade record with pending_fill status
+        # Create trade record with pending_fill status and approve the recommendation
         # The position monitor will verify the order filled and update to 'open'
         trade_id = await db.create_trade(
             recommendation_id=rec_id,
@@ -169,10 +166,11 @@ async def handle_approve(
             contracts=rec.suggested_contracts or 1,
             broker_order_id=order.id,
             status=TradeStatus.PENDING_FILL,
+            recommendation_status=RecommendationStatus.APPROVED,
         )
 
         # Respond to interaction with pending fill message (yellow)
-        spread_name = rec.spread_type.value.replace("_", " ").title()
+        spread_name = rec.spread_type.display_name
         embed = {
             "title": f"Order Placed: {rec.underlying}",
             "description": "Order submitted - awaiting fill confirmation",
@@ -409,7 +407,7 @@ async def handle_acknowledge_reconciliation(kv, discord, interaction_id, interac
     try:
         from datetime import datetime
 
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = datetime.now().date().isoformat()
 
         # Mark reconciliation as acknowledged
         recon_data = await kv.get_json(f"reconciliation:{today}")
@@ -8,6 +8,7 @@ Generates daily summary with:
 - Position reconciliation with broker
 """
 
+import asyncio
 from datetime import datetime
 
 from core import http
@@ -140,7 +141,7 @@ async def handle_eod_summary(env):
 
 async def _run_eod_summary(env):
     """Internal EOD summary logic."""
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = datetime.now().date().isoformat()
 
     # Initialize clients
     db = D1Client(env.MAHLER_DB)
@@ -170,16 +171,9 @@ async def _run_eod_summary(env):
         try:
             chain = await alpaca.get_options_chain(symbol)
             if chain.contracts:
-                # Find ATM contracts (within 2% of underlying price)
-                atm_contracts = [
-                    c
-                    for c in chain.contracts
-                    if abs(c.strike - chain.underlying_price) < chain.underlying_price * 0.02
-                    and c.implied_volatility
-                ]
-                if atm_contracts:
-                    # Use average IV of ATM options
-                    atm_iv = sum(c.implied_volatility for c in atm_contracts) / len(atm_contracts)
+                # Use average IV of ATM options (within 2% of underlying price)
+                atm_iv = chain.get_atm_iv()
+                if atm_iv is not None:
                     await db.save_daily_iv(
                         date=today,
                         underlying=symbol,
@@ -224,12 +218,12 @@ async def _run_eod_summary(env):
         starting_balance=starting_balance,
     )
 
-    # Get positions
-    positions = await db.get_all_positions()
-    open_trades = await db.get_open_trades()
-
-    # Get trade stats
-    trade_stats = await db.get_trade_stats()
+    # Get positions and trade stats
+    positions, open_trades, trade_stats = await asyncio.gather(
+        db.get_all_positions(),
+        db.get_open_trades(),
+        db.get_trade_stats(),
+    )
 
     # Generate reflections for trades closed today
     closed_today = []
@@ -378,6 +372,9 @@ async def _run_eod_summary(env):
     except Exception as e:
         print(f"Error archiving snapshot: {e}")
 
+    # Discord messages to send together at the end
+    messages = []
+
     # Check AI confidence calibration (weekly on Fridays)
     try:
         weekday = datetime.now().weekday()
@@ -393,13 +390,15 @@ async def _run_eod_summary(env):
             )
 
             if has_issues:
-                await discord.send_calibration_alert(calibration)
-                print("Calibration issues detected - alert sent")
+                alert = discord.calibration_alert_message(calibration)
+                if alert:
+                    messages.append(alert)
+                    print("Calibration issues detected - alert queued")
 
-            # Send weekly summary
+            # Queue weekly summary
             if calibration:
-                await discord.send_calibration_summary(calibration, stats)
-                print("Weekly calibration summary sent")
+                messages.append(discord.calibration_summary_message(calibration, stats))
+                print("Weekly calibration summary queued")
 
             # Archive calibration data
             await kv.put_json(
@@ -411,12 +410,20 @@ async def _run_eod_summary(env):
     except Exception as e:
         print(f"Error checking calibration: {e}")
 
-    # Send Discord summary
-    await discord.send_daily_summary(
-        performance=performance,
-        open_positions=len(open_trades),
-        trade_stats=trade_stats,
+    # Send any calibration messages, then the Discord summary
+    messages.append(
+        discord.daily_summary_message(
+            performance=performance,
+            open_positions=len(open_trades),
+            trade_stats=trade_stats,
+        )
     )
+    *calibration_results, summary_result = await discord.send_many(messages)
+    for result in calibration_results:
+        if isinstance(result, Exception):
+            print(f"Error sending calibration message: {result}")
+    if isinstance(summary_result, Exception):
+        raise summary_result
 
     # Reset daily KV stats for next day
     tomorrow = datetime.now().replace(hour=0, minute=0, second=0) + __import__(
@@ -4,6 +4,7 @@ Lighter version of morning scan - checks positions and
 looks for new setups if capacity available.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 from core import http
@@ -72,9 +73,11 @@ async def _run_midday_check(env):
         return
 
     # Get account and position info
-    account = await alpaca.get_account()
-    positions = await db.get_all_positions()
-    open_trades = await db.get_open_trades()
+    account, positions, open_trades = await asyncio.gather(
+        alpaca.get_account(),
+        db.get_all_positions(),
+        db.get_open_trades(),
+    )
 
     sizer = PositionSizer()
     heat = sizer.calculate_portfolio_heat(positions, account.equity)
@@ -103,11 +106,7 @@ async def _run_midday_check(env):
                 continue
 
             # Quick IV estimate
-            atm = [
-                c
-                for c in chain.contracts
-                if abs(c.strike - chain.underlying_price) < chain.underlying_price * 0.02
-            ]
+            atm = chain.get_atm_contracts()
             current_iv = atm[0].implied_volatility if atm and atm[0].implied_volatility else 0.20
             iv_metrics = calculate_iv_metrics(current_iv, [current_iv * 0.8, current_iv * 1.2])
 
@@ -7,6 +7,7 @@ Timing: Moved from 9:35 AM to 10:00 AM to avoid the first 30 minutes
 when spreads are wide and quotes are stale.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 from core import http
@@ -57,7 +58,7 @@ async def _run_morning_scan(env):
     circuit_breaker = CircuitBreaker(kv)
 
     # Quick check if manually halted (full evaluation happens after account info loaded)
-    status = await circuit_breaker.get_status()
+    status, daily_stats = await kv.get_trading_state()
     if status.halted:
         print(f"Trading manually halted: {status.reason}")
         return
@@ -85,9 +86,11 @@ async def _run_morning_scan(env):
         return
 
     # Get account info for position sizing
-    account = await alpaca.get_account()
-    positions = await db.get_all_positions()
-    open_trades = await db.get_open_trades()
+    account, positions, open_trades = await asyncio.gather(
+        alpaca.get_account(),
+        db.get_all_positions(),
+        db.get_open_trades(),
+    )
 
     # Initialize weekly stats (will only set if not already initialized this week)
     await kv.initialize_weekly_stats(starting_equity=account.equity)
@@ -110,7 +113,6 @@ async def _run_morning_scan(env):
         print(f"Could not fetch VIX: {e}")
 
     # Full graduated risk evaluation
-    daily_stats = await kv.get_daily_stats()
     daily_starting_equity = daily_stats.get("starting_equity", account.equity)
 
     risk_state = await circuit_breaker.evaluate_all(
@@ -158,11 +160,7 @@ async def _run_morning_scan(env):
             print(f"{symbol}: Got {len(chain.contracts)} contracts, price=${chain.underlying_price:.2f}")
 
             # Calculate IV metrics (using ATM options as proxy)
-            atm_contracts = [
-                c
-                for c in chain.contracts
-                if abs(c.strike - chain.underlying_price) < chain.underlying_price * 0.02
-            ]
+            atm_contracts = chain.get_atm_contracts()
 
             if atm_contracts and atm_contracts[0].implied_volatility:
                 current_iv = atm_contracts[0].implied_volatility
@@ -206,8 +204,8 @@ async def _run_morning_scan(env):
     # Sort all opportunities by score
     all_opportunities.sort(key=lambda x: x[0].score, reverse=True)
 
-    # Process top opportunities
-    recommendations_sent = 0
+    # Size top opportunities so only tradeable spreads are sent for analysis
+    candidates = []
 
     for opp, underlying_price, iv_metrics in all_opportunities[:MAX_RECOMMENDATIONS]:
         try:
@@ -230,14 +228,35 @@ async def _run_morning_scan(env):
             if adjusted_contracts < size_result.contracts:
                 print(f"Risk-adjusted contracts: {size_result.contracts} -> {adjusted_contracts}")
 
-            # Get AI analysis
-            analysis = await claude.analyze_trade(
-                spread=spread,
-                underlying_price=underlying_price,
-                iv_rank=iv_metrics.iv_rank,
-                current_iv=iv_metrics.current_iv,
-                playbook_rules=playbook_rules,
+            candidates.append((spread, underlying_price, iv_metrics, adjusted_contracts))
+
+        except Exception as e:
+            print(f"Error sizing opportunity: {e}")
+
+    # Get AI analysis for all candidates in one request
+    analyses = []
+    if candidates:
+        try:
+            analyses = await claude.analyze_trades_batch(
+                [
+                    (spread, underlying_price, iv_metrics.iv_rank, iv_metrics.current_iv)
+                    for spread, underlying_price, iv_metrics, _ in candidates
+                ],
+                playbook_rules,
             )
+        except Exception as e:
+            print(f"Error analyzing opportunities: {e}")
+            analyses = [None] * len(candidates)
+
+    # Process analyzed opportunities
+    recommendations_sent = 0
+
+    for (spread, _, iv_metrics, adjusted_contracts), analysis in zip(
+        candidates, analyses, strict=True
+    ):
+        try:
+            if analysis is None:
+                continue
 
             # Skip low confidence trades
             if analysis.confidence == Confidence.LOW:
@@ -302,10 +321,7 @@ async def _run_morning_scan(env):
                     )
                     order = await alpaca.place_spread_order(spread_order)
 
-                    # Update recommendation status
-                    await db.update_recommendation_status(rec_id, RecommendationStatus.APPROVED)
-
-                    # Create trade record with pending_fill status
+                    # Create trade record with pending_fill status and approve the recommendation
                     # The position monitor will verify the order filled and update to 'open'
                     trade_id = await db.create_trade(
                         recommendation_id=rec_id,
@@ -318,6 +334,7 @@ async def _run_morning_scan(env):
                         contracts=adjusted_contracts,
                         broker_order_id=order.id,
                         status=TradeStatus.PENDING_FILL,
+                        recommendation_status=RecommendationStatus.APPROVED,
                     )
 
                     # Update Discord message to show order placed (pending fill)
@@ -329,7 +346,7 @@ async def _run_morning_scan(env):
                             "description": "Order submitted - awaiting fill confirmation",
                             "color": 0xFEE75C,  # Yellow for pending
                             "fields": [
-                                {"name": "Strategy", "value": spread.spread_type.value.replace("_", " ").title(), "inline": True},
+                                {"name": "Strategy", "value": spread.spread_type.display_name, "inline": True},
                                 {"name": "Expiration", "value": spread.expiration, "inline": True},
                                 {"name": "Strikes", "value": f"${spread.short_strike:.2f}/${spread.long_strike:.2f}", "inline": True},
                                 {"name": "Credit", "value": f"${spread.credit:.2f}", "inline": True},
@@ -6,6 +6,7 @@ Monitors open positions for exit conditions:
 - 21 DTE time exit
 """
 
+import asyncio
 from datetime import datetime
 
 from core import http
@@ -214,14 +215,25 @@ async def _reconcile_pending_orders(db, alpaca, discord, kv):
 
     print(f"Reconciling {len(pending_trades)} pending orders...")
 
+    # Fetch every pending order's status concurrently rather than one
+    # round trip per trade; failures are handled per trade below
+    fetched_orders = iter(
+        await asyncio.gather(
+            *(alpaca.get_order(t.broker_order_id) for t in pending_trades if t.broker_order_id),
+            return_exceptions=True,
+        )
+    )
+
     for trade in pending_trades:
         if not trade.broker_order_id:
             print(f"Trade {trade.id} has no broker_order_id, marking as expired")
             await db.update_trade_status(trade.id, TradeStatus.EXPIRED)
             continue
 
+        order = next(fetched_orders)
         try:
-            order = await alpaca.get_order(trade.broker_order_id)
+            if isinstance(order, Exception):
+                raise order
 
             if order.status == OrderStatus.FILLED:
                 # Order filled - mark trade as open
@@ -242,7 +254,7 @@ async def _reconcile_pending_orders(db, alpaca, discord, kv):
                         "description": "Your order has been filled and position is now active.",
                         "color": 0x57F287,  # Green
                         "fields": [
-                            {"name": "Strategy", "value": trade.spread_type.value.replace("_", " ").title(), "inline": True},
+                            {"name": "Strategy", "value": trade.spread_type.display_name, "inline": True},
                             {"name": "Strikes", "value": f"${trade.short_strike:.2f}/${trade.long_strike:.2f}", "inline": True},
                             {"name": "Credit", "value": f"${trade.entry_credit:.2f}", "inline": True},
                             {"name": "Contracts", "value": str(trade.contracts), "inline": True},
@@ -269,7 +281,7 @@ async def _reconcile_pending_orders(db, alpaca, discord, kv):
 
                 # Build fields for Discord notification
                 fields = [
-                    {"name": "Strategy", "value": trade.spread_type.value.replace("_", " ").title(), "inline": True},
+                    {"name": "Strategy", "value": trade.spread_type.display_name, "inline": True},
                     {"name": "Strikes", "value": f"${trade.short_strike:.2f}/${trade.long_strike:.2f}", "inline": True},
                     {"name": "Final Price", "value": f"${final_price:.2f}", "inline": True},
                 ]
@@ -422,7 +434,7 @@ async def _maybe_adjust_order_price(trade, order, alpaca, db, discord, kv):
                 "description": f"Order unfilled after {int(order_age_minutes)} min - adjusted price to improve fill chance.",
                 "color": 0xF59E0B,  # Amber/warning color
                 "fields": [
-                    {"name": "Strategy", "value": trade.spread_type.value.replace("_", " ").title(), "inline": True},
+                    {"name": "Strategy", "value": trade.spread_type.display_name, "inline": True},
                     {"name": "Strikes", "value": f"${trade.short_strike:.2f}/${trade.long_strike:.2f}", "inline": True},
                     {"name": "Original Credit", "value": f"${original_price:.2f}", "inline": True},
                     {"name": "New Credit", "value": f"${new_credit:.2f}", "inline": True},
@@ -468,15 +480,13 @@ async def _auto_execute_exit(
 
         print(f"Exit order placed: {order.id}")
 
-        # Close the trade in database
+        # Close the trade and delete its position snapshot in database
         await db.close_trade(
             trade_id=trade.id,
             exit_debit=current_value,
+            delete_position=True,
         )
 
-        # Delete position snapshot
-        await db.delete_position(trade.id)
-
         # Calculate realized P/L
         realized_pnl = (trade.entry_credit - current_value) * trade.contracts * 100
 
@@ -494,7 +504,7 @@ async def _auto_execute_exit(
                 "color": pnl_color,
                 "fields": [
                     {"name": "Reason", "value": exit_reason, "inline": False},
-                    {"name": "Strategy", "value": trade.spread_type.value.replace("_", " ").title(), "inline": True},
+                    {"name": "Strategy", "value": trade.spread_type.display_name, "inline": True},
                     {"name": "Strikes", "value": f"${trade.short_strike:.2f}/${trade.long_strike:.2f}", "inline": True},
                     {"name": "Contracts", "value": str(trade.contracts), "inline": True},
                     {"name": "Entry Credit", "value": f"${trade.entry_credit:.2f}", "inline": True},
@@ -0,0 +1,18 @@
+-- Migration: One position snapshot per trade
+-- Run with: wrangler d1 execute mahler-db --remote --file=src/migrations/0004_positions_trade_id_unique.sql
+
+-- upsert_position relies on ON CONFLICT(trade_id), which needs a unique index.
+-- Keep only the most recently updated snapshot for any trade with duplicates.
+DELETE FROM positions
+WHERE rowid NOT IN (
+    SELECT rowid FROM (
+        SELECT rowid, ROW_NUMBER() OVER (
+            PARTITION BY trade_id ORDER BY updated_at DESC, rowid DESC
+        ) AS rn
+        FROM positions
+    )
+    WHERE rn = 1
+);
+
+DROP INDEX IF EXISTS idx_positions_trade_id;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_positions_trade_id ON positions(trade_id);
@@ -0,0 +1,6 @@
+-- Migration: Covering index for trade statistics
+-- Run with: wrangler d1 execute mahler-db --remote --file=src/migrations/0005_trades_status_pnl_index.sql
+
+-- get_trade_stats only reads status and profit_loss, so this index covers the
+-- whole aggregate and SQLite can scan it instead of the full trades table.
+CREATE INDEX IF NOT EXISTS idx_trades_status_pnl ON trades(status, profit_loss);
@@ -347,6 +347,8 @@ def mock_kv_client():
     """Mock KVClient with all methods mocked."""
     from unittest.mock import AsyncMock, MagicMock
 
+    from core.types import CircuitBreakerStatus
+
     client = MagicMock()
     client.get = AsyncMock(return_value=None)
     client.put = AsyncMock()
@@ -354,6 +356,9 @@ def mock_kv_client():
     client.get_json = AsyncMock(return_value=None)
     client.put_json = AsyncMock()
     client.get_daily_stats = AsyncMock(return_value={"starting_equity": 100000})
+    client.get_trading_state = AsyncMock(
+        return_value=(CircuitBreakerStatus.active(), {"starting_equity": 100000})
+    )
     client.update_daily_stats = AsyncMock()
     client.get_weekly_stats = AsyncMock(return_value={"starting_equity": 100000})
     client.get_weekly_starting_equity = AsyncMock(return_value=100000)
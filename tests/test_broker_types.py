@@ -6,9 +6,13 @@ including the empty/missing field scenarios that caused production issues.
 
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 
 from core.broker.types import (
+    OptionContract,
+    OptionsChain,
     Order,
     OrderLeg,
     OrderSide,
@@ -359,3 +363,104 @@ class TestOCCSymbolParsing:
 
         assert result is not None
         assert result["strike"] == 470.5
+
+
+class TestOptionsChainATM:
+    """Test ATM contract selection on OptionsChain."""
+
+    @staticmethod
+    def _chain(strikes_and_ivs: list[tuple[float, float | None]]) -> OptionsChain:
+        contracts = [
+            OptionContract(
+                symbol=f"SPY240215P{int(strike * 1000):08d}",
+                underlying="SPY",
+                expiration="2024-02-15",
+                strike=strike,
+                option_type="put",
+                bid=1.0,
+                ask=1.1,
+                last=1.05,
+                volume=100,
+                open_interest=500,
+                implied_volatility=iv,
+            )
+            for strike, iv in strikes_and_ivs
+        ]
+        return OptionsChain(
+            underlying="SPY",
+            underlying_price=500.0,
+            timestamp=datetime.now(),
+            expirations=["2024-02-15"],
+            contracts=contracts,
+        )
+
+    def test_get_atm_contracts_within_band(self):
+        """Test only strikes strictly within 2% of the price are ATM."""
+        chain = self._chain([(480.0, 0.2), (490.5, 0.2), (500.0, 0.2), (509.5, 0.2), (510.0, 0.2)])
+
+        assert [c.strike for c in chain.get_atm_contracts()] == [490.5, 500.0, 509.5]
+
+    def test_get_atm_iv_averages_reported_ivs(self):
+        """Test ATM IV averages only contracts that report an IV."""
+        chain = self._chain([(495.0, 0.18), (500.0, None), (505.0, 0.22), (530.0, 0.5)])
+
+        assert chain.get_atm_iv() == pytest.approx(0.20)
+
+    def test_get_atm_iv_none_without_data(self):
+        """Test ATM IV is None when no ATM contract has an IV."""
+        chain = self._chain([(500.0, None), (530.0, 0.5)])
+
+        assert chain.get_atm_iv() is None
+
+
+class TestOptionsChainFilters:
+    """Test expiration / option type filtering on OptionsChain."""
+
+    @staticmethod
+    def _contract(expiration: str, option_type: str, strike: float) -> OptionContract:
+        return OptionContract(
+            symbol=f"SPY{expiration[2:].replace('-', '')}{option_type[0].upper()}{int(strike * 1000):08d}",
+            underlying="SPY",
+            expiration=expiration,
+            strike=strike,
+            option_type=option_type,
+            bid=1.0,
+            ask=1.1,
+            last=1.05,
+            volume=100,
+            open_interest=500,
+        )
+
+    @pytest.fixture
+    def chain(self) -> OptionsChain:
+        contracts = [
+            self._contract("2024-02-15", "put", 490.0),
+            self._contract("2024-02-15", "call", 510.0),
+            self._contract("2024-03-15", "put", 480.0),
+            self._contract("2024-02-15", "put", 495.0),
+        ]
+        return OptionsChain(
+            underlying="SPY",
+            underlying_price=500.0,
+            timestamp=datetime.now(),
+            expirations=["2024-02-15", "2024-03-15"],
+            contracts=contracts,
+        )
+
+    def test_get_puts_and_calls_by_expiration(self, chain):
+        """Test filtering by expiration keeps chain order."""
+        assert [c.strike for c in chain.get_puts("2024-02-15")] == [490.0, 495.0]
+        assert [c.strike for c in chain.get_calls("2024-02-15")] == [510.0]
+        assert [c.strike for c in chain.get_puts("2024-03-15")] == [480.0]
+        assert chain.get_calls("2024-04-19") == []
+
+    def test_get_puts_without_expiration(self, chain):
+        """Test omitting the expiration returns puts across all expirations."""
+        assert [c.strike for c in chain.get_puts()] == [490.0, 480.0, 495.0]
+
+    def test_filtered_lists_are_independent(self, chain):
+        """Test callers can sort or trim results without affecting the chain."""
+        puts = chain.get_puts("2024-02-15")
+        puts.clear()
+
+        assert len(chain.get_puts("2024-02-15")) == 2
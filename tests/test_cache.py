@@ -0,0 +1,71 @@
+"""Tests for the in-memory TTL cache."""
+
+from __future__ import annotations
+
+from core.cache import TTLCache
+
+
+class FakeTimer:
+    """Manually advanced clock for deterministic expiry."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction."""
+
+    def test_get_returns_cached_value(self):
+        """Test a fresh entry is returned."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert "a" in cache
+
+    def test_missing_returns_default(self):
+        """Test missing keys return the default."""
+        cache = TTLCache()
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "fallback") == "fallback"
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once the TTL has elapsed."""
+        timer = FakeTimer()
+        cache = TTLCache(maxsize=4, ttl=10, timer=timer)
+        cache.set("a", 1)
+
+        timer.now = 9.9
+        assert cache.get("a") == 1
+
+        timer.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        """Test explicit invalidation."""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
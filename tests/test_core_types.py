@@ -42,6 +42,11 @@ class TestSpreadTypeEnum:
         with pytest.raises(ValueError):
             SpreadType("BULL_PUT")  # Case sensitive
 
+    def test_display_name(self):
+        """Test display names are title-cased for messages."""
+        assert SpreadType.BULL_PUT.display_name == "Bull Put"
+        assert SpreadType.BEAR_CALL.display_name == "Bear Call"
+
 
 class TestRecommendationStatusEnum:
     """Test RecommendationStatus enum parsing."""
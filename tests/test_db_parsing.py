@@ -386,3 +386,27 @@ class TestDatetimeParsing:
         client = D1Client(None)
         with pytest.raises(ValueError):
             client._row_to_recommendation(row)
+
+
+class TestRowColumnTables:
+    """Test the positional column tables stay in dataclass field order."""
+
+    @pytest.mark.parametrize(
+        "columns_name,cls_name",
+        [
+            ("_RECOMMENDATION_COLUMNS", "Recommendation"),
+            ("_TRADE_COLUMNS", "Trade"),
+            ("_POSITION_COLUMNS", "Position"),
+        ],
+    )
+    def test_columns_match_fields(self, columns_name, cls_name):
+        """Test each column table lists every field, in declaration order."""
+        from dataclasses import fields
+
+        import core.db.d1 as d1
+        import core.types as types
+
+        columns = getattr(d1, columns_name)
+        cls = getattr(types, cls_name)
+
+        assert [column for column, _ in columns] == [f.name for f in fields(cls)]
@@ -0,0 +1,56 @@
+"""Tests for Black-Scholes Greeks calculations.
+
+These tests ensure the batch calculation stays numerically identical
+to the scalar path the rest of the system was validated against.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from core.analysis.greeks import calculate_greeks, calculate_greeks_batch
+
+
+class TestCalculateGreeksBatch:
+    """Test calculate_greeks_batch against calculate_greeks."""
+
+    STRIKES = [540.0, 560.0, 575.0, 580.0, 585.0, 600.0, 620.0]
+
+    @pytest.mark.parametrize("option_type", ["call", "put"])
+    def test_matches_scalar(self, option_type):
+        """Test batch results match per-strike scalar results."""
+        batch = calculate_greeks_batch(
+            spot=580.0,
+            strikes=self.STRIKES,
+            time_to_expiry=35 / 365,
+            volatility=0.22,
+            option_type=option_type,
+        )
+
+        for i, strike in enumerate(self.STRIKES):
+            scalar = calculate_greeks(580.0, strike, 35 / 365, 0.22, option_type=option_type)
+            assert batch.delta[i] == pytest.approx(scalar.delta, abs=1e-12)
+            assert batch.gamma[i] == pytest.approx(scalar.gamma, abs=1e-12)
+            assert batch.theta[i] == pytest.approx(scalar.theta, abs=1e-12)
+            assert batch.vega[i] == pytest.approx(scalar.vega, abs=1e-12)
+            assert batch.rho[i] == pytest.approx(scalar.rho, abs=1e-12)
+
+    def test_expired_uses_intrinsic_delta(self):
+        """Test expired options fall back to intrinsic deltas."""
+        batch = calculate_greeks_batch(
+            spot=580.0,
+            strikes=[570.0, 590.0],
+            time_to_expiry=0.0,
+            volatility=0.22,
+            option_type="put",
+        )
+
+        assert batch.delta == [0.0, -1.0]
+        assert batch.gamma == [0.0, 0.0]
+
+    def test_empty_strikes(self):
+        """Test an empty batch returns empty columns."""
+        batch = calculate_greeks_batch(580.0, [], 35 / 365, 0.22)
+
+        assert batch.delta == []
+        assert batch.rho == []
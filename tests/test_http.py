@@ -0,0 +1,100 @@
+"""Tests for the Workers fetch wrapper."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core import http
+
+
+def _response(status: int = 200, text: str = "", headers: dict | None = None):
+    response = MagicMock()
+    response.ok = 200 <= status < 300
+    response.status = status
+    response.text = AsyncMock(return_value=text)
+    response.headers.get = MagicMock(side_effect=(headers or {}).get)
+    return response
+
+
+class TestRequest:
+    """Test request() response handling."""
+
+    @pytest.mark.asyncio
+    async def test_parses_json_body(self):
+        """Test a JSON body is parsed into a dict."""
+        with patch(
+            "core.http.fetch", new_callable=AsyncMock, return_value=_response(text='{"a": 1}')
+        ):
+            assert await http.request("GET", "https://example.com/x") == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_json_request_body(self):
+        """Test json_data is serialized into the request body."""
+        with (
+            patch("core.http.to_js", side_effect=lambda options, **_: options),
+            patch(
+                "core.http.fetch",
+                new_callable=AsyncMock,
+                return_value=_response(text='{"a": [1, 2]}'),
+            ) as mock_fetch,
+        ):
+            result = await http.request("POST", "https://example.com/x", json_data={"qty": 1})
+
+        assert result == {"a": [1, 2]}
+        assert mock_fetch.call_args.args[1]["body"] == '{"qty": 1}'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status,headers", [(204, {}), (200, {"content-length": "0"})])
+    async def test_empty_responses_skip_body(self, status, headers):
+        """Test empty responses return {} without reading the body."""
+        response = _response(status=status, headers=headers)
+
+        with patch("core.http.fetch", new_callable=AsyncMock, return_value=response):
+            assert await http.request("DELETE", "https://example.com/x") == {}
+
+        response.text.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_error_raises_http_error(self):
+        """Test non-2xx responses raise HttpError with the status code."""
+        with (
+            patch(
+                "core.http.fetch", new_callable=AsyncMock, return_value=_response(422, "bad qty")
+            ),
+            pytest.raises(http.HttpError) as exc_info,
+        ):
+            await http.request("POST", "https://example.com/x", json_data={})
+
+        assert exc_info.value.status_code == 422
+        assert str(exc_info.value) == "HTTP 422: bad qty"
+
+    @pytest.mark.asyncio
+    async def test_query_params_are_encoded(self):
+        """Test query parameters are percent-encoded, keeping commas literal."""
+        with patch(
+            "core.http.fetch", new_callable=AsyncMock, return_value=_response(text="{}")
+        ) as mock_fetch:
+            await http.request(
+                "GET",
+                "https://example.com/quotes",
+                params={"symbols": "$VIX.X,VIX", "note": "a&b c"},
+            )
+
+        assert mock_fetch.call_args.args[0] == (
+            "https://example.com/quotes?symbols=%24VIX.X,VIX&note=a%26b+c"
+        )
+
+    @pytest.mark.asyncio
+    async def test_long_error_bodies_are_truncated(self):
+        """Test HttpError keeps only the start of a large error body."""
+        body = "x" * 10_000
+
+        with (
+            patch("core.http.fetch", new_callable=AsyncMock, return_value=_response(500, body)),
+            pytest.raises(http.HttpError) as exc_info,
+        ):
+            await http.request("GET", "https://example.com/x")
+
+        assert exc_info.value.message == body[: http.MAX_ERROR_BODY_CHARS]
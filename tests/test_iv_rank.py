@@ -0,0 +1,83 @@
+"""Tests for IV rank calculations and IV history storage."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from core.analysis.iv_rank import (
+    IVHistory,
+    calculate_iv_metrics,
+    calculate_iv_percentile,
+    calculate_iv_rank,
+)
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class TestIVHistory:
+    """Test IVHistory observation storage and trimming."""
+
+    def test_observations_returned_in_date_order(self):
+        """Test IVs come back ordered by date regardless of insert order."""
+        history = IVHistory()
+        history.add_observation("SPY", _days_ago(1), 0.21)
+        history.add_observation("SPY", _days_ago(3), 0.19)
+        history.add_observation("SPY", _days_ago(2), 0.20)
+
+        assert history.get_historical_ivs("SPY") == [0.19, 0.20, 0.21]
+
+    def test_trims_to_lookback_window(self):
+        """Test observations older than the lookback window are dropped."""
+        history = IVHistory(lookback_days=30)
+        history.add_observation("SPY", _days_ago(60), 0.30)
+        history.add_observation("SPY", _days_ago(31), 0.25)
+        history.add_observation("SPY", _days_ago(10), 0.20)
+
+        assert history.get_historical_ivs("SPY") == [0.20]
+
+    def test_unknown_symbol_is_empty(self):
+        """Test a symbol with no observations has empty history."""
+        assert IVHistory().get_historical_ivs("QQQ") == []
+
+    def test_round_trip_through_dict(self):
+        """Test to_dict/from_dict preserve observations."""
+        history = IVHistory()
+        history.add_observation("SPY", _days_ago(2), 0.20)
+        history.add_observation("QQQ", _days_ago(1), 0.25)
+
+        restored = IVHistory.from_dict(history.to_dict())
+
+        assert history.to_dict()["SPY"] == [{"date": _days_ago(2), "iv": 0.20}]
+        assert restored.to_dict() == history.to_dict()
+        assert restored.get_historical_ivs("QQQ") == [0.25]
+
+
+class TestCalculateIVMetrics:
+    """Test calculate_iv_metrics against the individual calculations."""
+
+    HISTORY = [0.15, 0.18, 0.20, 0.22, 0.25, 0.30]
+
+    def test_matches_individual_functions(self):
+        """Test combined metrics agree with rank/percentile helpers."""
+        metrics = calculate_iv_metrics(0.21, self.HISTORY)
+
+        assert metrics.iv_rank == calculate_iv_rank(0.21, self.HISTORY)
+        assert metrics.iv_percentile == calculate_iv_percentile(0.21, self.HISTORY)
+        assert metrics.iv_low == 0.15
+        assert metrics.iv_high == 0.30
+
+    def test_flat_history_defaults_rank_to_middle(self):
+        """Test identical history values don't divide by zero."""
+        metrics = calculate_iv_metrics(0.20, [0.20, 0.20, 0.20])
+
+        assert metrics.iv_rank == 50.0
+        assert metrics.iv_percentile == 0.0
+
+    def test_empty_history(self):
+        """Test empty history falls back to neutral defaults."""
+        metrics = calculate_iv_metrics(0.20, [])
+
+        assert metrics.iv_rank == 50.0
+        assert metrics.iv_high == metrics.iv_low == 0.20
@@ -10,8 +10,8 @@ from datetime import datetime, timedelta
 
 import pytest
 
-from core.broker.types import OptionContract, OptionsChain
 from core.analysis.iv_rank import IVMetrics
+from core.broker.types import OptionContract, OptionsChain
 
 
 class TestScreenerFiltering:
@@ -429,7 +429,8 @@ class TestScreenerScoring:
     def test_score_components(self):
         """Test individual score components."""
         from core.analysis.screener import OptionsScreener, ScoredSpread
-        from core.types import CreditSpread, SpreadType, OptionContract as CoreOptionContract
+        from core.types import CreditSpread, SpreadType
+        from core.types import OptionContract as CoreOptionContract
 
         # Verify scoring math
         # IV score = iv_percentile / 100
@@ -493,7 +494,8 @@ class TestScreenerScoring:
     def test_scoring_edge_cases(self):
         """Test scoring with edge case values."""
         from core.analysis.screener import OptionsScreener
-        from core.types import CreditSpread, SpreadType, OptionContract as CoreOptionContract
+        from core.types import CreditSpread, SpreadType
+        from core.types import OptionContract as CoreOptionContract
 
         iv_metrics = IVMetrics(
             current_iv=0.22,
@@ -545,3 +547,46 @@ class TestScreenerScoring:
         scored = screener._score_spread(spread, iv_metrics, 0.50)
 
         assert scored.score >= 0
+
+    def test_delta_score_floored_at_zero(self):
+        """Test deltas far from 0.25 can't drag the score below zero."""
+        from core.analysis.screener import OptionsScreener
+        from core.types import CreditSpread, SpreadType
+        from core.types import OptionContract as CoreOptionContract
+
+        iv_metrics = IVMetrics(
+            current_iv=0.22,
+            iv_rank=0.0,
+            iv_percentile=0.0,
+            iv_high=0.22,
+            iv_low=0.22,
+        )
+
+        def contract(strike: float, bid: float, ask: float) -> CoreOptionContract:
+            return CoreOptionContract(
+                symbol=f"SPY240215P00{int(strike)}000",
+                underlying="SPY",
+                expiration="2024-02-15",
+                strike=strike,
+                option_type="put",
+                bid=bid,
+                ask=ask,
+                last=(bid + ask) / 2,
+                volume=100,
+                open_interest=500,
+                implied_volatility=0.22,
+            )
+
+        spread = CreditSpread(
+            underlying="SPY",
+            spread_type=SpreadType.BULL_PUT,
+            short_strike=470.0,
+            long_strike=465.0,
+            expiration="2024-02-15",
+            short_contract=contract(470.0, 0.02, 0.03),
+            long_contract=contract(465.0, 0.01, 0.02),
+        )
+
+        scored = OptionsScreener()._score_spread(spread, iv_metrics, 0.90)
+
+        assert scored.score >= 0
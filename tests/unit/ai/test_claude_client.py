@@ -0,0 +1,301 @@
+"""Tests for ClaudeClient request handling and response caching."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.ai.claude import ClaudeClient
+from core.types import Confidence, CreditSpread, OptionContract, PlaybookRule, SpreadType
+
+
+def _claude_response(payload: dict | str) -> dict:
+    """Build a Messages API response wrapping a text payload."""
+    text = payload if isinstance(payload, str) else json.dumps(payload)
+    return {"content": [{"type": "text", "text": text}], "usage": {"input_tokens": 10}}
+
+
+ANALYSIS_PAYLOAD = {
+    "thesis": "Range-bound market favors premium selling.",
+    "risks": ["FOMC next week"],
+    "confidence": "medium",
+    "confidence_reason": "Elevated IV but event risk",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """Response caches are class-level; isolate each test."""
+    ClaudeClient._market_context_cache.clear()
+    ClaudeClient._analysis_cache.clear()
+    yield
+    ClaudeClient._market_context_cache.clear()
+    ClaudeClient._analysis_cache.clear()
+
+
+@pytest.fixture
+def spread() -> CreditSpread:
+    """A bull put spread 35 days out."""
+    expiration = (datetime.now() + timedelta(days=35)).strftime("%Y-%m-%d")
+
+    def contract(strike: float, bid: float, ask: float) -> OptionContract:
+        return OptionContract(
+            symbol=f"SPY{strike:.0f}P",
+            underlying="SPY",
+            expiration=expiration,
+            strike=strike,
+            option_type="put",
+            bid=bid,
+            ask=ask,
+            last=(bid + ask) / 2,
+            volume=100,
+            open_interest=500,
+            implied_volatility=0.22,
+        )
+
+    return CreditSpread(
+        underlying="SPY",
+        spread_type=SpreadType.BULL_PUT,
+        short_strike=570.0,
+        long_strike=565.0,
+        expiration=expiration,
+        short_contract=contract(570.0, 2.00, 2.10),
+        long_contract=contract(565.0, 0.72, 0.78),
+    )
+
+
+class TestRequest:
+    """Tests for _request() payload construction."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_capped(self):
+        """Test no more than max_concurrent_requests calls are in flight."""
+        client = ClaudeClient(api_key="test-key", max_concurrent_requests=2)
+        in_flight = 0
+        peak = 0
+
+        async def slow_request(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _claude_response("ok")
+
+        with patch("core.ai.claude.http.request", side_effect=slow_request):
+            await asyncio.gather(
+                *(client._request([{"role": "user", "content": "hi"}], "sys") for _ in range(6))
+            )
+
+        assert peak == 2
+
+
+class TestResponseCache:
+    """Tests for analysis and market context response caching."""
+
+    @pytest.mark.asyncio
+    async def test_analyze_trade_reuses_cached_analysis(self, spread):
+        """Test identical analyses within the TTL make a single API call."""
+        client = ClaudeClient(api_key="test-key")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _claude_response(ANALYSIS_PAYLOAD)
+            first = await client.analyze_trade(spread, 580.0, 65.2, 0.22, [])
+            second = await client.analyze_trade(spread, 580.5, 64.8, 0.22, [])
+
+        assert mock_request.call_count == 1
+        assert first is second
+        assert first.confidence == Confidence.MEDIUM
+
+    @pytest.mark.asyncio
+    async def test_analyze_trade_misses_on_different_strikes(self, spread):
+        """Test a different spread is analyzed separately."""
+        client = ClaudeClient(api_key="test-key")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _claude_response(ANALYSIS_PAYLOAD)
+            await client.analyze_trade(spread, 580.0, 65.0, 0.22, [])
+            spread.long_strike = 560.0
+            await client.analyze_trade(spread, 580.0, 65.0, 0.22, [])
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"underlying_price": 590.0},
+            {"current_iv": 0.30},
+            {"playbook_rules": [PlaybookRule(id="r1", rule="Avoid earnings", source="learned")]},
+        ],
+    )
+    async def test_analyze_trade_misses_on_other_prompt_inputs(self, spread, changed):
+        """Test price, IV and playbook rule changes are analyzed separately."""
+        client = ClaudeClient(api_key="test-key")
+        inputs = {
+            "underlying_price": 580.0,
+            "iv_rank": 65.0,
+            "current_iv": 0.22,
+            "playbook_rules": [],
+        }
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _claude_response(ANALYSIS_PAYLOAD)
+            await client.analyze_trade(spread, **inputs)
+            await client.analyze_trade(spread, **{**inputs, **changed})
+
+        assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_market_context_buckets_inputs(self):
+        """Test market context is reused for inputs in the same bucket."""
+        client = ClaudeClient(api_key="test-key")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _claude_response("Calm market.")
+            await client.get_market_context("SPY", 580.2, 15.01, 60.2)
+            await client.get_market_context("SPY", 579.9, 14.98, 59.8)
+            await client.get_market_context("QQQ", 580.2, 15.01, 60.2)
+
+        assert mock_request.call_count == 2
+
+
+class TestAnalyzeTradesBatch:
+    """Tests for analyze_trades_batch()."""
+
+    @pytest.fixture
+    def second_spread(self, spread) -> CreditSpread:
+        """A second, distinct spread on the same expiration."""
+        return CreditSpread(
+            underlying="QQQ",
+            spread_type=SpreadType.BULL_PUT,
+            short_strike=480.0,
+            long_strike=475.0,
+            expiration=spread.expiration,
+            short_contract=spread.short_contract,
+            long_contract=spread.long_contract,
+        )
+
+    @pytest.mark.asyncio
+    async def test_single_request_for_all_spreads(self, spread, second_spread):
+        """Test all uncached spreads are analyzed in one request."""
+        client = ClaudeClient(api_key="test-key")
+        high = dict(ANALYSIS_PAYLOAD, confidence="high")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _claude_response(
+                [dict(ANALYSIS_PAYLOAD, index=1), dict(high, index=2)]
+            )
+            results = await client.analyze_trades_batch(
+                [(spread, 580.0, 65.0, 0.22), (second_spread, 490.0, 60.0, 0.25)], []
+            )
+
+        assert mock_request.call_count == 1
+        assert [r.confidence for r in results] == [Confidence.MEDIUM, Confidence.HIGH]
+        prompt = mock_request.call_args[1]["json_data"]["messages"][0]["content"]
+        assert "### Spread 1" in prompt and "### Spread 2" in prompt
+
+    @pytest.mark.asyncio
+    async def test_maps_batch_items_by_index(self, spread, second_spread):
+        """Test batch items are matched to spreads by index, not position."""
+        client = ClaudeClient(api_key="test-key")
+        high = dict(ANALYSIS_PAYLOAD, confidence="high")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _claude_response(
+                [dict(high, index=2), dict(ANALYSIS_PAYLOAD, index=1)]
+            )
+            results = await client.analyze_trades_batch(
+                [(spread, 580.0, 65.0, 0.22), (second_spread, 490.0, 60.0, 0.25)], []
+            )
+
+        assert [r.confidence for r in results] == [Confidence.MEDIUM, Confidence.HIGH]
+
+    @pytest.mark.asyncio
+    async def test_splits_large_batches(self, spread, second_spread):
+        """Test batches are capped at MAX_BATCH_SIZE spreads per request."""
+        client = ClaudeClient(api_key="test-key")
+        client.MAX_BATCH_SIZE = 2
+        trades = [(spread, 580.0, rank, 0.22) for rank in (50.0, 60.0, 70.0)]
+
+        def respond(*args, json_data, **kwargs):
+            count = json_data["messages"][0]["content"].count("### Spread")
+            return _claude_response([dict(ANALYSIS_PAYLOAD, index=n) for n in range(1, count + 1)])
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = respond
+            results = await client.analyze_trades_batch(trades, [])
+
+        assert mock_request.call_count == 2
+        assert [call[1]["json_data"]["max_tokens"] for call in mock_request.call_args_list] == [
+            2 * ClaudeClient.MAX_TOKENS,
+            ClaudeClient.MAX_TOKENS,
+        ]
+        assert all(r is not None for r in results)
+
+    @pytest.mark.asyncio
+    async def test_non_dict_fallback_reply_returns_none(self, spread, second_spread):
+        """Test a non-object reply to the per-spread retry yields None."""
+        client = ClaudeClient(api_key="test-key")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [
+                _claude_response([dict(ANALYSIS_PAYLOAD, index=1)]),
+                _claude_response("[1, 2]"),
+            ]
+            results = await client.analyze_trades_batch(
+                [(spread, 580.0, 65.0, 0.22), (second_spread, 490.0, 60.0, 0.25)], []
+            )
+
+        assert results[0] is not None
+        assert results[1] is None
+
+    @pytest.mark.asyncio
+    async def test_falls_back_per_spread_on_malformed_batch(self, spread, second_spread):
+        """Test spreads are analyzed individually if the batch can't be parsed."""
+        client = ClaudeClient(api_key="test-key")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [
+                _claude_response("not json"),
+                _claude_response(ANALYSIS_PAYLOAD),
+                _claude_response(ANALYSIS_PAYLOAD),
+            ]
+            results = await client.analyze_trades_batch(
+                [(spread, 580.0, 65.0, 0.22), (second_spread, 490.0, 60.0, 0.25)], []
+            )
+
+        assert mock_request.call_count == 3
+        assert all(r is not None for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_spread_returns_none(self, spread):
+        """Test a spread whose analysis fails yields None instead of raising."""
+        client = ClaudeClient(api_key="test-key")
+
+        with patch("core.ai.claude.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = Exception("HTTP 529: overloaded")
+            results = await client.analyze_trades_batch([(spread, 580.0, 65.0, 0.22)], [])
+
+        assert results == [None]
+
+
+class TestParseJsonResponse:
+    """Tests for _parse_json_response()."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"a": 1}',
+            '```json\n{"a": 1}\n```',
+            '```\n{"a": 1}\n```',
+            '  ```json\n{"a": 1}\n```\n',
+        ],
+    )
+    def test_strips_markdown_fences(self, text):
+        """Test JSON is parsed with or without a markdown code fence."""
+        assert ClaudeClient(api_key="test-key")._parse_json_response(text) == {"a": 1}
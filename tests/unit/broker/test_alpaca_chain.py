@@ -0,0 +1,299 @@
+"""Tests for Alpaca options chain and market data retrieval."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.broker.alpaca import AlpacaClient
+
+
+@pytest.fixture(autouse=True)
+def clear_chain_cache():
+    """The chain cache is class-level; isolate each test."""
+    AlpacaClient._chain_cache.clear()
+    yield
+    AlpacaClient._chain_cache.clear()
+
+
+def _snapshot(bid: float, ask: float) -> dict:
+    return {
+        "latestQuote": {"bp": bid, "ap": ask},
+        "greeks": {"delta": -0.25},
+    }
+
+
+def _occ_symbol(strike: int) -> str:
+    return f"SPY250321P{strike * 1000:08d}"
+
+
+class TestGetOptionsChain:
+    """Tests for get_options_chain() snapshot batching."""
+
+    @pytest.fixture
+    def alpaca_client(self):
+        """Create an AlpacaClient with mocked HTTP."""
+        return AlpacaClient(
+            api_key="test-key",
+            secret_key="test-secret",
+            paper=True,
+        )
+
+    @staticmethod
+    def _fake_request(symbols: list[str], in_flight: list[int], peak: list[int]):
+        async def fake_request(method, url, headers=None, params=None, json_data=None):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+
+            if url.endswith("/v2/options/contracts"):
+                return {"option_contracts": [{"symbol": s, "open_interest": "50"} for s in symbols]}
+            if url.endswith("/quotes/latest"):
+                return {"quote": {"bp": 580.0, "ap": 580.2}}
+            batch = params["symbols"].split(",")
+            return {"snapshots": {s: _snapshot(1.0, 1.1) for s in batch}}
+
+        return fake_request
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_snapshot_batches_concurrently(self, alpaca_client):
+        """Test every batch is fetched, in parallel with the underlying quote."""
+        symbols = [_occ_symbol(strike) for strike in range(300, 550)]
+        in_flight, peak = [0], [0]
+
+        with patch(
+            "core.broker.alpaca.http.request",
+            side_effect=self._fake_request(symbols, in_flight, peak),
+        ) as mock_request:
+            chain = await alpaca_client.get_options_chain("SPY")
+
+        # 1 contracts call + 3 snapshot batches + 1 underlying quote
+        assert mock_request.call_count == 5
+        # All snapshot batches are in flight at once
+        assert peak[0] >= 3
+        assert chain.underlying_price == pytest.approx(580.1)
+        assert [c.symbol for c in chain.contracts] == symbols
+        assert chain.contracts[0].open_interest == 50
+        assert chain.expirations == ["2025-03-21"]
+
+    @pytest.mark.asyncio
+    async def test_follows_contract_pages(self, alpaca_client):
+        """Test every page of option contracts is fetched and snapshotted."""
+        first_page = [_occ_symbol(strike) for strike in range(300, 400)]
+        second_page = [_occ_symbol(strike) for strike in range(400, 450)]
+        contract_params = []
+
+        async def fake_request(method, url, headers=None, params=None, json_data=None):
+            if url.endswith("/v2/options/contracts"):
+                contract_params.append(dict(params))
+                if "page_token" not in params:
+                    return {
+                        "option_contracts": [{"symbol": s} for s in first_page],
+                        "next_page_token": "page-2",
+                    }
+                return {
+                    "option_contracts": [{"symbol": s} for s in second_page],
+                    "next_page_token": None,
+                }
+            if url.endswith("/quotes/latest"):
+                return {"quote": {"bp": 580.0, "ap": 580.2}}
+            batch = params["symbols"].split(",")
+            return {"snapshots": {s: _snapshot(1.0, 1.1) for s in batch}}
+
+        with patch("core.broker.alpaca.http.request", side_effect=fake_request):
+            chain = await alpaca_client.get_options_chain("SPY")
+
+        assert [p.get("page_token") for p in contract_params] == [None, "page-2"]
+        assert [c.symbol for c in chain.contracts] == first_page + second_page
+
+    @pytest.mark.asyncio
+    async def test_no_contracts_still_prices_underlying(self, alpaca_client):
+        """Test an empty chain still reports the underlying price."""
+
+        async def fake_request(method, url, headers=None, params=None, json_data=None):
+            if url.endswith("/v2/options/contracts"):
+                return {"option_contracts": []}
+            return {"quote": {"bp": 100.0, "ap": 100.2}}
+
+        with patch("core.broker.alpaca.http.request", side_effect=fake_request):
+            chain = await alpaca_client.get_options_chain("SPY")
+
+        assert chain.contracts == []
+        assert chain.expirations == []
+        assert chain.underlying_price == pytest.approx(100.1)
+
+    @pytest.mark.asyncio
+    async def test_repeat_calls_are_cached(self, alpaca_client):
+        """Test identical chain requests within the TTL hit Alpaca once."""
+        symbols = [_occ_symbol(strike) for strike in range(300, 350)]
+        in_flight, peak = [0], [0]
+
+        with patch(
+            "core.broker.alpaca.http.request",
+            side_effect=self._fake_request(symbols, in_flight, peak),
+        ) as mock_request:
+            first = await alpaca_client.get_options_chain("SPY", "2025-03-01", "2025-04-01")
+            second = await alpaca_client.get_options_chain("SPY", "2025-03-01", "2025-04-01")
+            await alpaca_client.get_options_chain("SPY", "2025-03-01", "2025-05-01")
+
+        assert second is first
+        # 3 requests (contracts, 1 snapshot batch, quote) per distinct chain
+        assert mock_request.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self, alpaca_client):
+        """Test concurrent identical chain requests are coalesced."""
+        symbols = [_occ_symbol(strike) for strike in range(300, 350)]
+        in_flight, peak = [0], [0]
+
+        with patch(
+            "core.broker.alpaca.http.request",
+            side_effect=self._fake_request(symbols, in_flight, peak),
+        ) as mock_request:
+            chains = await asyncio.gather(
+                *(alpaca_client.get_options_chain("SPY") for _ in range(3))
+            )
+
+        assert chains[0] is chains[1] is chains[2]
+        assert mock_request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """Test snapshot fan-out respects max_concurrent_requests."""
+        client = AlpacaClient("test-key", "test-secret", max_concurrent_requests=2)
+        symbols = [_occ_symbol(strike) for strike in range(100, 600)]
+        in_flight, peak = [0], [0]
+
+        with patch(
+            "core.broker.alpaca.http.request",
+            side_effect=self._fake_request(symbols, in_flight, peak),
+        ):
+            chain = await client.get_options_chain("SPY")
+
+        assert peak[0] == 2
+        assert len(chain.contracts) == len(symbols)
+
+
+class TestGetUnderlyingPrice:
+    """Tests for _get_underlying_price() request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test concurrent quotes for one symbol make a single request."""
+        client = AlpacaClient("test-key", "test-secret")
+
+        async def fake_request(method, url, headers=None, params=None, json_data=None):
+            await asyncio.sleep(0)
+            price = 580.0 if "/SPY/" in url else 480.0
+            return {"quote": {"bp": price, "ap": price + 0.2}}
+
+        with patch("core.broker.alpaca.http.request", side_effect=fake_request) as mock_request:
+            prices = await asyncio.gather(
+                client._get_underlying_price("SPY"),
+                client._get_underlying_price("SPY"),
+                client._get_underlying_price("QQQ"),
+            )
+            assert mock_request.call_count == 2
+
+            # Once settled, the next call fetches a fresh quote
+            await client._get_underlying_price("SPY")
+            assert mock_request.call_count == 3
+
+        assert prices == [pytest.approx(580.1), pytest.approx(580.1), pytest.approx(480.1)]
+
+
+class TestGetVixSnapshot:
+    """Tests for get_vix_snapshot() quote selection."""
+
+    @pytest.fixture
+    def alpaca_client(self):
+        """Create an AlpacaClient with mocked HTTP."""
+        return AlpacaClient(
+            api_key="test-key",
+            secret_key="test-secret",
+            paper=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_candidates_in_one_request(self, alpaca_client):
+        """Test VIX and VIX3M come from a single multi-symbol quote request."""
+        quotes = {
+            "quotes": {
+                "VIX": {"bp": 18.0, "ap": 18.2},
+                "VIXY": {"bp": 12.0, "ap": 12.1},
+                "VIX3M": {"bp": 20.0, "ap": 0},
+            }
+        }
+
+        with patch(
+            "core.broker.alpaca.http.request", new_callable=AsyncMock, return_value=quotes
+        ) as mock_request:
+            result = await alpaca_client.get_vix_snapshot()
+
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["params"] == {
+            "symbols": "$VIX.X,VIX,VIXY,$VIX3M.X,VIX3M"
+        }
+        assert result == {"vix": pytest.approx(18.1), "vix3m": 20.0}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_spy_iv_proxy(self, alpaca_client):
+        """Test the SPY ATM IV proxy is used when no VIX quote is available."""
+        chain = MagicMock()
+        chain.get_atm_iv.return_value = 0.2
+
+        with (
+            patch(
+                "core.broker.alpaca.http.request",
+                new_callable=AsyncMock,
+                return_value={"quotes": {}},
+            ),
+            patch.object(
+                alpaca_client, "get_options_chain", new_callable=AsyncMock, return_value=chain
+            ),
+        ):
+            result = await alpaca_client.get_vix_snapshot()
+
+        assert result == {"vix": pytest.approx(20.0)}
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_unavailable(self, alpaca_client):
+        """Test None is returned when neither quotes nor the proxy are available."""
+        with (
+            patch(
+                "core.broker.alpaca.http.request",
+                new_callable=AsyncMock,
+                side_effect=Exception("HTTP 400: bad"),
+            ),
+            patch.object(
+                alpaca_client,
+                "get_options_chain",
+                new_callable=AsyncMock,
+                side_effect=Exception("down"),
+            ),
+        ):
+            result = await alpaca_client.get_vix_snapshot()
+
+        assert result is None
+
+
+class TestParseOptionContract:
+    """Tests for _parse_option_contract() snapshot handling."""
+
+    def test_missing_and_null_sections(self):
+        """Test absent or null snapshot sections fall back to defaults."""
+        client = AlpacaClient("test-key", "test-secret")
+        snapshot = {"latestQuote": {"bp": 1.0, "ap": 1.2}, "latestTrade": None, "greeks": None}
+
+        contract = client._parse_option_contract(_occ_symbol(500), snapshot)
+
+        assert contract is not None
+        assert contract.strike == 500.0
+        assert contract.mid == pytest.approx(1.1)
+        assert contract.last == 0.0
+        assert contract.volume == 0
+        assert contract.open_interest == 0
+        assert contract.delta is None
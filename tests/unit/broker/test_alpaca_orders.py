@@ -124,6 +124,47 @@ class TestPlaceSpreadOrder:
             json_data = mock_request.call_args[1]["json_data"]
             assert json_data["limit_price"] == "-1.26"
 
+    @pytest.mark.asyncio
+    async def test_place_close_spread_order_constructs_correct_payload(self, alpaca_client):
+        """Test that place_close_spread_order() builds a closing debit order."""
+        mock_response = {
+            "id": "order-789",
+            "client_order_id": "client-order-789",
+            "symbol": "",
+            "side": "",
+            "type": "limit",
+            "qty": "2",
+            "limit_price": "0.45",
+            "status": "pending_new",
+            "filled_qty": "0",
+            "filled_avg_price": None,
+            "created_at": "2024-01-20T10:00:00Z",
+            "updated_at": "2024-01-20T10:00:00Z",
+            "legs": [
+                {"symbol": "SPY240215P00470000", "side": "buy", "qty": "2", "filled_qty": "0", "filled_avg_price": None},
+                {"symbol": "SPY240215P00465000", "side": "sell", "qty": "2", "filled_qty": "0", "filled_avg_price": None},
+            ],
+        }
+
+        with patch.object(alpaca_client, "_trading_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = mock_response
+            await alpaca_client.place_close_spread_order(
+                short_symbol="SPY240215P00470000",
+                long_symbol="SPY240215P00465000",
+                contracts=2,
+                limit_price=-0.454,
+            )
+
+            json_data = mock_request.call_args[1]["json_data"]
+            assert json_data["order_class"] == "mleg"
+            assert json_data["qty"] == "2"
+            # Closing debit uses positive limit price
+            assert json_data["limit_price"] == "0.45"
+            assert json_data["legs"] == [
+                {"symbol": "SPY240215P00470000", "side": "buy", "ratio_qty": "1", "position_intent": "buy_to_close"},
+                {"symbol": "SPY240215P00465000", "side": "sell", "ratio_qty": "1", "position_intent": "sell_to_close"},
+            ]
+
 
 class TestReplaceOrder:
     """Tests for replace_order() functionality."""
@@ -343,6 +384,15 @@ class TestParseOccSymbol:
         assert alpaca_client.parse_occ_symbol("AAPL") is None
         assert alpaca_client.parse_occ_symbol("TSLA") is None
 
+    def test_parse_malformed_symbol_returns_none(self, alpaca_client):
+        """Test that symbols with a bad type flag or strike return None."""
+        # Unknown option type
+        assert alpaca_client.parse_occ_symbol("SPY240215X00470000") is None
+        # Non-numeric date
+        assert alpaca_client.parse_occ_symbol("SPY24AB15P00470000") is None
+        # Trailing characters after the strike
+        assert alpaca_client.parse_occ_symbol("SPY240215P00470000X") is None
+
 
 class TestCancelOrder:
     """Tests for cancel_order() functionality."""
@@ -375,3 +425,51 @@ class TestCancelOrder:
                 await alpaca_client.cancel_order("nonexistent-order")
 
             assert exc_info.value.status_code == 404
+
+
+class TestRequestErrors:
+    """Tests for _request() error translation."""
+
+    @pytest.fixture
+    def alpaca_client(self):
+        """Create an AlpacaClient with mocked HTTP."""
+        return AlpacaClient(
+            api_key="test-key",
+            secret_key="test-secret",
+            paper=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_http_error_carries_status_code(self, alpaca_client):
+        """Test HTTP errors become AlpacaError with the response status."""
+        from core.http import HttpError
+
+        with patch("core.broker.alpaca.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = HttpError(404, "order not found")
+
+            with pytest.raises(AlpacaError) as exc_info:
+                await alpaca_client.get_order("nonexistent-order")
+
+        assert exc_info.value.status_code == 404
+        assert str(exc_info.value) == "HTTP 404: order not found"
+
+    @pytest.mark.asyncio
+    async def test_network_error_has_no_status_code(self, alpaca_client):
+        """Test non-HTTP failures become AlpacaError without a status."""
+        with patch("core.broker.alpaca.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = Exception("network unreachable")
+
+            with pytest.raises(AlpacaError) as exc_info:
+                await alpaca_client.get_order("order-123")
+
+        assert exc_info.value.status_code is None
+
+    @pytest.mark.asyncio
+    async def test_get_position_returns_none_on_404(self, alpaca_client):
+        """Test get_position() maps a 404 to None."""
+        from core.http import HttpError
+
+        with patch("core.broker.alpaca.http.request", new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = HttpError(404, "position does not exist")
+
+            assert await alpaca_client.get_position("SPY240215P00470000") is None
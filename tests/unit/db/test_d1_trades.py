@@ -254,41 +254,12 @@ class TestCloseTrade:
 
     @pytest.fixture
     def mock_db_with_trade(self):
-        """Create a mock D1 binding with a trade for closing."""
+        """Create a mock D1 binding whose UPDATE reports one changed row."""
         binding = MagicMock()
         prepare_mock = MagicMock()
         bind_mock = MagicMock()
 
-        binding.prepare = MagicMock(return_value=prepare_mock)
-        prepare_mock.bind = MagicMock(return_value=bind_mock)
-        bind_mock.run = AsyncMock()
-
-        # For get_trade query
-        trade_result = {
-            "results": [
-                {
-                    "id": "trade-123",
-                    "recommendation_id": "rec-123",
-                    "opened_at": "2024-01-15T10:00:00",
-                    "closed_at": None,
-                    "status": "open",
-                    "underlying": "SPY",
-                    "spread_type": "bull_put",
-                    "short_strike": 470.0,
-                    "long_strike": 465.0,
-                    "expiration": "2024-02-15",
-                    "entry_credit": 1.25,
-                    "exit_debit": None,
-                    "profit_loss": None,
-                    "contracts": 2,
-                    "broker_order_id": "order-123",
-                    "reflection": None,
-                    "lesson": None,
-                }
-            ]
-        }
-
-        bind_mock.all = AsyncMock(return_value=trade_result)
+        bind_mock.run = AsyncMock(return_value={"success": True, "meta": {"changes": 1}})
 
         binding._queries = []
         binding._params = []
@@ -307,9 +278,8 @@ class TestCloseTrade:
         return binding
 
     @pytest.mark.asyncio
-    async def test_close_trade_calculates_pnl_correctly(self, mock_db_with_trade):
-        """Test that close_trade() calculates P/L correctly."""
-        # Mock js_to_python
+    async def test_close_trade_calculates_pnl_in_single_update(self, mock_db_with_trade):
+        """Test that close_trade() computes P/L in SQL with one statement."""
         with patch("core.db.d1.js_to_python", side_effect=lambda x: x):
             from core.db.d1 import D1Client
 
@@ -320,26 +290,23 @@ class TestCloseTrade:
                 exit_debit=0.50,  # Closed at 0.50 debit
             )
 
-        # Verify the UPDATE query was called
-        update_query = None
-        for query in mock_db_with_trade._queries:
-            if "UPDATE trades" in query and "status = 'closed'" in query:
-                update_query = query
-                break
-
-        assert update_query is not None
+        assert len(mock_db_with_trade._queries) == 1
+        update_query = mock_db_with_trade._queries[0]
+        assert "UPDATE trades" in update_query
+        assert "status = 'closed'" in update_query
         assert "exit_debit = ?" in update_query
-        assert "profit_loss = ?" in update_query
+        assert "profit_loss = (entry_credit - ?) * contracts * 100" in update_query
 
-        # P/L should be: (1.25 - 0.50) * 2 * 100 = $150
-        # This is verified by checking the params passed to bind
-        # The profit_loss should be 150.0
+        params = mock_db_with_trade._params[0]
+        assert params[1:3] == (0.50, 0.50)
+        assert params[-1] == "trade-123"
 
     @pytest.mark.asyncio
     async def test_close_trade_not_found_raises_error(self, mock_db_with_trade):
-        """Test that close_trade() raises error for non-existent trade."""
-        # Mock js_to_python to return empty results
-        with patch("core.db.d1.js_to_python", return_value={"results": []}):
+        """Test that close_trade() raises error when no trade is updated."""
+        with patch(
+            "core.db.d1.js_to_python", return_value={"success": True, "meta": {"changes": 0}}
+        ):
             from core.db.d1 import D1Client
 
             client = D1Client(mock_db_with_trade)
@@ -352,6 +319,86 @@ class TestCloseTrade:
 
             assert "not found" in str(exc_info.value).lower()
 
+    @pytest.mark.asyncio
+    async def test_close_trade_with_delete_position_batches(self, mock_db_with_trade):
+        """Test that close_trade(delete_position=True) sends one batch."""
+        mock_db_with_trade.batch = AsyncMock(
+            return_value=[{"meta": {"changes": 1}}, {"meta": {"changes": 1}}]
+        )
+
+        with patch("core.db.d1.js_to_python", side_effect=lambda x: x):
+            from core.db.d1 import D1Client
+
+            client = D1Client(mock_db_with_trade)
+            await client.close_trade("trade-123", exit_debit=0.50, delete_position=True)
+
+        mock_db_with_trade.batch.assert_awaited_once()
+        assert len(mock_db_with_trade.batch.call_args.args[0]) == 2
+        assert "UPDATE trades" in mock_db_with_trade._queries[0]
+        assert "DELETE FROM positions" in mock_db_with_trade._queries[1]
+        assert mock_db_with_trade._params[1] == ("trade-123", "trade-123")
+
+    @pytest.mark.asyncio
+    async def test_close_trade_delete_position_requires_closed_trade(self, mock_db_with_trade):
+        """Test the batched DELETE is guarded so an unmatched close removes nothing."""
+        mock_db_with_trade.batch = AsyncMock(
+            return_value=[{"meta": {"changes": 0}}, {"meta": {"changes": 0}}]
+        )
+
+        with patch("core.db.d1.js_to_python", side_effect=lambda x: x):
+            from core.db.d1 import D1Client
+
+            client = D1Client(mock_db_with_trade)
+
+            with pytest.raises(ValueError, match="not found"):
+                await client.close_trade("missing", exit_debit=0.50, delete_position=True)
+
+        delete_query = mock_db_with_trade._queries[1]
+        assert "EXISTS (SELECT 1 FROM trades WHERE id = ? AND status = 'closed')" in delete_query
+
+
+class TestCreateTradeForRecommendation:
+    """Tests for create_trade() with a recommendation status update."""
+
+    @pytest.mark.asyncio
+    async def test_recommendation_update_and_insert_share_a_batch(self):
+        """Test that the recommendation update and trade insert are one batch."""
+        from core.db.d1 import D1Client
+        from core.types import RecommendationStatus
+
+        binding = MagicMock()
+        binding.batch = AsyncMock(return_value=[])
+        queries = []
+
+        def capture_prepare(query):
+            queries.append(query)
+            return MagicMock()
+
+        binding.prepare = MagicMock(side_effect=capture_prepare)
+        client = D1Client(binding)
+
+        with (
+            patch("core.db.d1.uuid4", return_value="trade-abc"),
+            patch("core.db.d1.js_to_python", side_effect=lambda x: x),
+        ):
+            trade_id = await client.create_trade(
+                recommendation_id="rec-123",
+                underlying="SPY",
+                spread_type=SpreadType.BULL_PUT,
+                short_strike=470.0,
+                long_strike=465.0,
+                expiration="2024-02-15",
+                entry_credit=1.25,
+                contracts=2,
+                status=TradeStatus.PENDING_FILL,
+                recommendation_status=RecommendationStatus.APPROVED,
+            )
+
+        assert trade_id == "trade-abc"
+        binding.batch.assert_awaited_once()
+        assert "UPDATE recommendations SET status = ?" in queries[0]
+        assert "INSERT INTO trades" in queries[1]
+
 
 class TestGetPendingFillTrades:
     """Tests for get_pending_fill_trades() functionality."""
@@ -434,3 +481,150 @@ class TestGetPendingFillTrades:
         # Verify the query filters by status
         query = mock_db_with_pending_trades._queries[0]
         assert "status = 'pending_fill'" in query
+
+
+class TestStatementCache:
+    """Tests for prepared statement reuse and result conversion."""
+
+    @pytest.mark.asyncio
+    async def test_identical_sql_is_prepared_once(self):
+        """Test that repeated queries reuse the prepared statement."""
+        from core.db.d1 import D1Client
+
+        binding = MagicMock()
+        stmt = binding.prepare.return_value
+        stmt.bind.return_value.run = AsyncMock()
+
+        client = D1Client(binding)
+        await client.run("DELETE FROM positions WHERE trade_id = ?", ["trade-1"])
+        await client.run("DELETE FROM positions WHERE trade_id = ?", ["trade-2"])
+
+        binding.prepare.assert_called_once()
+        assert [c.args for c in stmt.bind.call_args_list] == [("trade-1",), ("trade-2",)]
+
+    def test_js_to_python_uses_to_py(self):
+        """Test that JS objects convert via to_py() and Python values pass through."""
+        from core.db.d1 import js_to_python
+
+        js_result = MagicMock()
+        js_result.to_py.return_value = {"results": []}
+
+        assert js_to_python(js_result) == {"results": []}
+        assert js_to_python({"results": [1]}) == {"results": [1]}
+        assert js_to_python(None) is None
+
+
+class TestUpdateDailyPerformance:
+    """Tests for update_daily_performance() SQL generation."""
+
+    @pytest.mark.asyncio
+    async def test_only_supplied_fields_are_updated(self):
+        """Test the UPDATE sets ending_balance and non-zero deltas only."""
+        from core.db.d1 import D1Client
+
+        client = D1Client(MagicMock())
+
+        with patch.object(client, "run", new_callable=AsyncMock) as mock_run:
+            await client.update_daily_performance(
+                "2024-01-15", ending_balance=0.0, realized_pnl_delta=150.0, win_delta=1
+            )
+            await client.update_daily_performance(
+                "2024-01-16", ending_balance=10.0, realized_pnl_delta=-5.0, win_delta=2
+            )
+
+        first, second = mock_run.call_args_list
+        assert first.args == (
+            "UPDATE daily_performance SET ending_balance = ?, realized_pnl = realized_pnl + ?, "
+            "win_count = win_count + ? WHERE date = ?",
+            [0.0, 150.0, 1, "2024-01-15"],
+        )
+        assert second.args[0] is first.args[0]
+        assert second.args[1] == [10.0, -5.0, 2, "2024-01-16"]
+
+    @pytest.mark.asyncio
+    async def test_no_changes_skips_query(self):
+        """Test nothing is executed when no field is supplied."""
+        from core.db.d1 import D1Client
+
+        client = D1Client(MagicMock())
+
+        with patch.object(client, "run", new_callable=AsyncMock) as mock_run:
+            await client.update_daily_performance("2024-01-15")
+
+        mock_run.assert_not_called()
+
+
+class TestUpsertPosition:
+    """Tests for upsert_position() functionality."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_is_a_single_statement(self):
+        """Test upsert_position() issues one INSERT ... ON CONFLICT and returns the row ID."""
+        from core.db.d1 import D1Client
+
+        client = D1Client(MagicMock())
+
+        with (
+            patch("core.db.d1.uuid4", return_value="new-pos-id"),
+            patch.object(
+                client,
+                "execute",
+                new_callable=AsyncMock,
+                return_value={"results": [{"id": "existing-pos-id"}]},
+            ) as mock_execute,
+        ):
+            pos_id = await client.upsert_position(
+                trade_id="trade-123",
+                underlying="SPY",
+                short_strike=470.0,
+                long_strike=465.0,
+                expiration="2024-02-15",
+                contracts=2,
+                current_value=0.60,
+                unrealized_pnl=130.0,
+            )
+
+        assert pos_id == "existing-pos-id"
+        mock_execute.assert_awaited_once()
+        query, params = mock_execute.call_args.args
+        assert "ON CONFLICT(trade_id) DO UPDATE" in query
+        assert "RETURNING id" in query
+        assert params[:2] == ["new-pos-id", "trade-123"]
+
+
+class TestGetOrCreateDailyPerformance:
+    """Tests for get_or_create_daily_performance() batching."""
+
+    @pytest.mark.asyncio
+    async def test_insert_and_select_in_one_batch(self):
+        """Test the insert-or-ignore and read share one batch."""
+        from core.db.d1 import D1Client
+
+        client = D1Client(MagicMock())
+        row = {
+            "date": "2024-01-15",
+            "starting_balance": 10000.0,
+            "ending_balance": 10150.0,
+            "realized_pnl": 150.0,
+            "trades_opened": 1,
+            "trades_closed": 1,
+            "win_count": 1,
+            "loss_count": 0,
+        }
+
+        with patch.object(
+            client,
+            "run_batch",
+            new_callable=AsyncMock,
+            return_value=[{"meta": {"changes": 0}}, {"results": [row]}],
+        ) as mock_batch:
+            performance = await client.get_or_create_daily_performance("2024-01-15", 9000.0)
+
+        mock_batch.assert_awaited_once()
+        (insert, insert_params), (select, select_params) = mock_batch.call_args.args[0]
+        assert "INSERT OR IGNORE INTO daily_performance" in insert
+        assert insert_params == ["2024-01-15", 9000.0, 9000.0]
+        assert select_params == ["2024-01-15"]
+        # An existing row wins over the supplied starting balance
+        assert performance.starting_balance == 10000.0
+        assert performance.realized_pnl == 150.0
@@ -0,0 +1,96 @@
+"""Tests for KVClient state storage."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def kv_binding():
+    """Create a mock KV binding backed by an in-memory dict."""
+    storage = {}
+    binding = MagicMock()
+
+    async def mock_get(key):
+        return storage.get(key)
+
+    async def mock_put(key, value, options=None):
+        storage[key] = value
+
+    binding.get = AsyncMock(side_effect=mock_get)
+    binding.put = AsyncMock(side_effect=mock_put)
+    binding._storage = storage
+    return binding
+
+
+class TestCircuitBreakerCache:
+    """Tests for get_circuit_breaker() caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_reads_hit_kv_once(self, kv_binding):
+        """Test that reads within the TTL reuse the cached status."""
+        from core.db.kv import KVClient
+
+        kv_binding._storage["circuit_breaker"] = json.dumps({"halted": True, "reason": "test"})
+        client = KVClient(kv_binding)
+
+        first = await client.get_circuit_breaker()
+        second = await client.get_circuit_breaker()
+
+        assert first.halted and first.reason == "test"
+        assert second is first
+        kv_binding.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_trip_and_reset_update_cache(self, kv_binding):
+        """Test that trip/reset are visible without another KV read."""
+        from core.db.kv import KVClient
+
+        client = KVClient(kv_binding)
+
+        await client.trip_circuit_breaker("daily loss")
+        status = await client.get_circuit_breaker()
+        assert status.halted and status.reason == "daily loss"
+
+        await client.reset_circuit_breaker()
+        status = await client.get_circuit_breaker()
+        assert not status.halted
+
+        kv_binding.get.assert_not_awaited()
+        assert json.loads(kv_binding._storage["circuit_breaker"]) == {"halted": False}
+
+
+class TestWindowCounters:
+    """Tests for fixed-window rate limit and error counters."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_denies_after_max(self, kv_binding):
+        """Test requests beyond max_requests in one window are denied."""
+        from core.db.kv import KVClient
+
+        client = KVClient(kv_binding)
+
+        with patch("core.db.kv.time.time", return_value=7200.0):
+            results = [await client.check_rate_limit("claude", max_requests=2) for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert kv_binding._storage == {"rate_limit:claude:2": "2"}
+
+    @pytest.mark.asyncio
+    async def test_new_window_starts_a_new_count(self, kv_binding):
+        """Test the error count restarts when the window rolls over."""
+        from core.db.kv import KVClient
+
+        client = KVClient(kv_binding)
+
+        with patch("core.db.kv.time.time", return_value=120.0):
+            assert await client.increment_error_count(window_seconds=60) == 1
+            assert await client.increment_error_count(window_seconds=60) == 2
+        with patch("core.db.kv.time.time", return_value=180.0):
+            assert await client.increment_error_count(window_seconds=60) == 1
+
+        ttl = kv_binding.put.call_args.args[2]["expirationTtl"]
+        assert ttl >= 60
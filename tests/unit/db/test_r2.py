@@ -0,0 +1,132 @@
+"""Tests for R2Client archival storage."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def r2_binding():
+    """Create a mock R2 binding backed by an in-memory dict."""
+    storage = {}
+    binding = MagicMock()
+
+    async def mock_put(key, data, options):
+        storage[key] = (data, options["httpMetadata"])
+
+    async def mock_get(key):
+        if key not in storage:
+            return None
+        data, http_metadata = storage[key]
+        buffer = SimpleNamespace(to_bytes=lambda: data)
+        return SimpleNamespace(
+            httpMetadata=SimpleNamespace(**http_metadata),
+            arrayBuffer=AsyncMock(return_value=buffer),
+            text=AsyncMock(side_effect=lambda: data.decode()),
+        )
+
+    binding.put = AsyncMock(side_effect=mock_put)
+    binding.get = AsyncMock(side_effect=mock_get)
+    binding._storage = storage
+    return binding
+
+
+class TestJsonObjects:
+    """Tests for put_json()/get_json() compression."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_is_gzipped(self, r2_binding):
+        """Test JSON is stored gzip-encoded and read back unchanged."""
+        from core.db.r2 import R2Client
+
+        client = R2Client(r2_binding)
+        payload = {"symbol": "SPY", "chain": [{"strike": 500.0, "bid": 1.0}] * 50}
+
+        await client.put_json("options_chains/2024-01-15/SPY.json", payload)
+
+        data, http_metadata = r2_binding._storage["options_chains/2024-01-15/SPY.json"]
+        assert http_metadata == {"contentType": "application/json", "contentEncoding": "gzip"}
+        assert len(data) < len(json.dumps(payload))
+        assert await client.get_json("options_chains/2024-01-15/SPY.json") == payload
+
+    @pytest.mark.asyncio
+    async def test_reads_uncompressed_objects(self, r2_binding):
+        """Test objects archived before compression are still readable."""
+        from core.db.r2 import R2Client
+
+        r2_binding._storage["snapshots/old.json"] = (
+            json.dumps({"date": "2024-01-02"}).encode(),
+            {"contentType": "application/json"},
+        )
+
+        client = R2Client(r2_binding)
+
+        assert await client.get_json("snapshots/old.json") == {"date": "2024-01-02"}
+        assert await client.get("snapshots/old.json") == b'{"date": "2024-01-02"}'
+
+    @pytest.mark.asyncio
+    async def test_missing_object_returns_none(self, r2_binding):
+        """Test a missing key returns None."""
+        from core.db.r2 import R2Client
+
+        assert await R2Client(r2_binding).get_json("missing.json") is None
+
+
+class TestIterKeys:
+    """Tests for iter_keys() cursor pagination."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_until_not_truncated(self):
+        """Test every page is listed, passing each cursor forward."""
+        from core.db.r2 import R2Client
+
+        def page(keys, truncated, cursor=None):
+            objects = [SimpleNamespace(key=k) for k in keys]
+            return SimpleNamespace(objects=objects, truncated=truncated, cursor=cursor)
+
+        binding = MagicMock()
+        binding.list = AsyncMock(side_effect=[page(["a", "b"], True, "c1"), page(["c"], False)])
+
+        keys = [key async for key in R2Client(binding).iter_keys("backups/", page_size=2)]
+
+        assert keys == ["a", "b", "c"]
+        assert [c.args[0] for c in binding.list.call_args_list] == [
+            {"prefix": "backups/", "limit": 2},
+            {"prefix": "backups/", "limit": 2, "cursor": "c1"},
+        ]
+
+
+class TestArchiveOptionsChains:
+    """Tests for archive_options_chains() fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_archives_all_symbols_with_capped_concurrency(self, r2_binding):
+        """Test every chain is archived and writes respect the cap."""
+        import asyncio
+
+        from core.db.r2 import R2Client
+
+        in_flight, peak = [0], [0]
+        store = r2_binding.put.side_effect
+
+        async def slow_put(key, data, options):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            await store(key, data, options)
+
+        r2_binding.put = AsyncMock(side_effect=slow_put)
+        chains = {symbol: {"strikes": [1, 2]} for symbol in ("SPY", "QQQ", "IWM", "DIA")}
+
+        keys = await R2Client(r2_binding).archive_options_chains(
+            chains, date="2024-01-15", max_concurrent_writes=2
+        )
+
+        assert keys == [f"options_chains/2024-01-15/{s}.json" for s in chains]
+        assert peak[0] == 2
+        assert set(r2_binding._storage) == set(keys)
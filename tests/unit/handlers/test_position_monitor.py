@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -198,6 +199,35 @@ class TestReconcilePendingOrders:
         )
         mock_alpaca_client.get_order.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_reconcile_continues_past_failed_order_lookup(
+        self,
+        mock_d1_client,
+        mock_alpaca_client,
+        mock_discord_client,
+        mock_kv_client,
+        mock_trade,
+        mock_filled_order,
+    ):
+        """Test that one failed get_order does not block other trades."""
+        failing_trade = replace(mock_trade, id="trade-fail", broker_order_id="order-fail")
+        mock_d1_client.get_pending_fill_trades = AsyncMock(return_value=[failing_trade, mock_trade])
+        mock_alpaca_client.get_order = AsyncMock(
+            side_effect=[Exception("HTTP 500: boom"), mock_filled_order]
+        )
+
+        from handlers.position_monitor import _reconcile_pending_orders
+
+        await _reconcile_pending_orders(
+            db=mock_d1_client,
+            alpaca=mock_alpaca_client,
+            discord=mock_discord_client,
+            kv=mock_kv_client,
+        )
+
+        assert mock_alpaca_client.get_order.call_count == 2
+        mock_d1_client.mark_trade_filled.assert_called_once_with(mock_trade.id)
+
 
 class TestMaybeAdjustOrderPrice:
     """Tests for _maybe_adjust_order_price() functionality."""
@@ -0,0 +1,221 @@
+"""Tests for DiscordClient message sending."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from core.notifications.discord import DiscordClient
+
+
+@pytest.fixture
+def discord_client():
+    """Create a DiscordClient with test credentials."""
+    return DiscordClient(bot_token="test-token", public_key="00" * 32, channel_id="chan-1")
+
+
+class TestSendMany:
+    """Tests for send_many() ordered sends."""
+
+    @pytest.mark.asyncio
+    async def test_sends_sequentially_in_order(self, discord_client):
+        """Test each message is posted after the previous one, keeping input order."""
+        in_flight, peak, sent = [0], [0], []
+
+        async def fake_request(method, url, headers=None, params=None, json_data=None):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            sent.append(json_data["content"])
+            return {"id": f"msg-{json_data['content']}"}
+
+        with patch("core.notifications.discord.http.request", side_effect=fake_request):
+            ids = await discord_client.send_many(
+                [{"content": "a"}, {"content": "b", "embeds": [{}]}]
+            )
+
+        assert ids == ["msg-a", "msg-b"]
+        assert sent == ["a", "b"]
+        assert peak[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_returned_not_raised(self, discord_client):
+        """Test one failed send does not prevent the others."""
+        from core.notifications.discord import DiscordError
+
+        async def fake_request(method, url, headers=None, params=None, json_data=None):
+            if json_data["content"] == "bad":
+                raise Exception("HTTP 400: bad")
+            return {"id": "msg-ok"}
+
+        with patch("core.notifications.discord.http.request", side_effect=fake_request):
+            results = await discord_client.send_many([{"content": "bad"}, {"content": "ok"}])
+
+        assert isinstance(results[0], DiscordError)
+        assert str(results[0].__cause__) == "HTTP 400: bad"
+        assert results[1] == "msg-ok"
+
+
+class TestMessageBuilders:
+    """Tests for message builders shared by send_* and send_many()."""
+
+    def test_calibration_alert_none_when_calibrated(self, discord_client):
+        """Test no alert is built when every level is calibrated."""
+        calibration = {"high": {"is_calibrated": True}}
+
+        assert discord_client.calibration_alert_message(calibration) is None
+
+    def test_calibration_alert_lists_miscalibrated_levels(self, discord_client):
+        """Test the alert has a field per miscalibrated level."""
+        calibration = {
+            "high": {
+                "is_calibrated": False,
+                "calibration_gap": -0.2,
+                "actual_win_rate": 0.6,
+                "expected_win_rate": 0.8,
+            },
+            "low": {"is_calibrated": True},
+        }
+
+        message = discord_client.calibration_alert_message(calibration)
+
+        assert message["content"] == "**AI Calibration Issue Detected**"
+        assert [f["name"] for f in message["embeds"][0]["fields"]] == ["HIGH Confidence"]
+
+
+class TestRequestHeaders:
+    """Tests for prebuilt request headers."""
+
+    @pytest.mark.asyncio
+    async def test_headers_are_built_once(self, discord_client):
+        """Test every API call reuses the Headers built at init."""
+        from unittest.mock import AsyncMock
+
+        with patch(
+            "core.notifications.discord.http.request",
+            new_callable=AsyncMock,
+            return_value={"id": "m"},
+        ) as mock_request:
+            await discord_client.send_message("one")
+            await discord_client.send_message("two")
+            await discord_client.respond_to_interaction("i-1", "tok", "done")
+
+        headers = [c.kwargs["headers"] for c in mock_request.call_args_list]
+        assert headers[0] is discord_client._fetch_headers
+        assert headers[1] is discord_client._fetch_headers
+        assert headers[2] is discord_client._interaction_headers
+
+
+class TestUint8ArrayConversion:
+    """Tests for bytes to Uint8Array conversion."""
+
+    def test_assigns_buffer_in_one_call(self):
+        """Test the array is sized once and filled from the bytes buffer."""
+        import sys
+
+        from core.notifications.discord import _to_uint8_array
+
+        with patch.object(sys.modules["js"], "Uint8Array") as uint8_array:
+            array = _to_uint8_array(b"\x01\x02\x03")
+
+        uint8_array.new.assert_called_once_with(3)
+        array.assign.assert_called_once_with(b"\x01\x02\x03")
+
+
+class TestEd25519KeyCache:
+    """Tests for Ed25519 public key import caching."""
+
+    @pytest.mark.asyncio
+    async def test_key_is_imported_once(self):
+        """Test repeat verifications reuse the imported CryptoKey and algorithm."""
+        import sys
+        from unittest.mock import AsyncMock
+
+        from core.notifications import discord
+
+        public_key = "ab" * 32
+        discord._ED25519_KEYS.pop(public_key, None)
+        discord._ed25519_algorithm.cache_clear()
+        js = sys.modules["js"]
+        crypto = js.crypto
+
+        with (
+            patch.object(js.Object, "fromEntries") as from_entries,
+            patch.object(
+                crypto.subtle, "importKey", new_callable=AsyncMock, return_value="crypto-key"
+            ) as import_key,
+            patch.object(
+                crypto.subtle, "verify", new_callable=AsyncMock, return_value=True
+            ) as verify,
+        ):
+            for _ in range(2):
+                assert await discord.verify_ed25519_signature(public_key, b"msg", "cd" * 64)
+
+        from_entries.assert_called_once()
+        import_key.assert_awaited_once()
+        assert verify.await_count == 2
+        assert verify.call_args.args[1] == "crypto-key"
+        discord._ED25519_KEYS.pop(public_key, None)
+        discord._ed25519_algorithm.cache_clear()
+
+
+class TestSendRecommendation:
+    """Tests for send_recommendation() embed layout."""
+
+    @pytest.mark.asyncio
+    async def test_fields_and_buttons(self, discord_client):
+        """Test the embed lists optional greeks before Max Loss and adds buttons."""
+        from datetime import datetime
+        from unittest.mock import AsyncMock
+
+        from core.types import Confidence, Recommendation, RecommendationStatus, SpreadType
+
+        rec = Recommendation(
+            id="rec-12345678",
+            created_at=datetime(2024, 1, 15, 10, 0),
+            expires_at=datetime(2024, 1, 15, 10, 15),
+            status=RecommendationStatus.PENDING,
+            underlying="SPY",
+            spread_type=SpreadType.BEAR_CALL,
+            short_strike=600.0,
+            long_strike=605.0,
+            expiration="2024-02-15",
+            credit=1.1,
+            max_loss=390.0,
+            iv_rank=55.0,
+            delta=0.2,
+            confidence=Confidence.HIGH,
+        )
+
+        with patch.object(
+            discord_client, "send_message", new_callable=AsyncMock, return_value="m"
+        ) as send:
+            await discord_client.send_recommendation(rec)
+
+        embed = send.call_args.kwargs["embeds"][0]
+        assert embed["color"] == 0x57F287
+        assert [f["name"] for f in embed["fields"]] == [
+            "Strategy",
+            "Direction",
+            "Expiration",
+            "Short Strike",
+            "Long Strike",
+            "Credit",
+            "IV Rank",
+            "Delta",
+            "Max Loss",
+            "Contracts",
+            "Confidence",
+        ]
+        assert embed["fields"][:2] == [
+            {"name": "Strategy", "value": "Bear Call Spread", "inline": True},
+            {"name": "Direction", "value": "Bearish", "inline": True},
+        ]
+        buttons = send.call_args.kwargs["components"][0]["components"]
+        assert [b["custom_id"] for b in buttons] == [
+            "approve_trade:rec-12345678",
+            "reject_trade:rec-12345678",
+        ]